@@ -0,0 +1,121 @@
+'''
+Compares the compiled extraction schemas with the former lookup helpers,
+which walked every key path twice, on a synthetic works payload.
+
+Run from the repository root:
+    python benchmarks/bench_extraction.py [--works 3000] [--repeat 5]
+'''
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pyorcid.orcid_extraction import WORK_SCHEMA, iter_group_items  # noqa: E402
+
+
+def synthetic_works(count):
+    '''
+    Builds a /works payload with ``count`` work summaries
+    return  : the payload
+    '''
+    return {"group": [{"work-summary": [{
+        "put-code": i,
+        "title": {"title": {"value": f"Study number {i} on café culture"}},
+        "type": "journal-article",
+        "publication-date": {"year": {"value": str(1990 + i % 30)},
+                             "month": {"value": f"{1 + i % 12:02d}"},
+                             "day": None},
+        "journal-title": {"value": "Journal of Examples"},
+        "organization": None if i % 3 else {
+            "name": "Example University",
+            "address": {"city": "Zürich", "region": None, "country": "CH"}},
+        "url": {"value": f"https://example.org/{i}"},
+    }]} for i in range(count)]}
+
+
+def legacy_extract_works(data):
+    '''
+    The extraction as implemented before the compiled schemas
+    return  : the list of work dictionaries
+    '''
+    def deunicode(s):
+        try:
+            s.encode('ascii')
+        except UnicodeEncodeError:
+            s = s.encode('ascii', 'ignore').decode('ascii')
+        return s
+
+    def accessible(obj, keys):
+        for key in keys:
+            if isinstance(obj, dict) and key in obj:
+                obj = obj[key]
+            else:
+                return False
+        return True
+
+    def value(obj, keys):
+        if accessible(obj, keys):
+            for key in keys:
+                obj = obj[key]
+            if isinstance(obj, str):
+                obj = deunicode(obj)
+            return obj
+        return None
+
+    def date(date_dict):
+        if date_dict is None:
+            return ''
+        year = value(date_dict, ["year", "value"])
+        month = value(date_dict, ["month", "value"])
+        if year is not None and month is not None:
+            return f"{month}/{year}"
+        return year if year is not None else ''
+
+    def address(org_obj):
+        if not isinstance(org_obj, dict):
+            return ''
+        return ', '.join(deunicode(i) for i in filter(None, org_obj.values()))
+
+    works = []
+    for group in data.get('group', []):
+        for work in group.get('work-summary', []):
+            works.append({
+                'title': value(work, ["title", "title", "value"]),
+                'type': value(work, ["type"]),
+                'publication-date': date(work.get('publication-date', {})),
+                'journal title': value(work, ["journal-title", "value"]),
+                'organization': value(work, ["organization", "name"]),
+                'organization-address': address(
+                    value(work, ["organization", "address"])),
+                'url': value(work, ["url", "value"]),
+            })
+    return works
+
+
+def compiled_extract_works(data):
+    return WORK_SCHEMA.extract_many(iter_group_items(data, 'work-summary'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--works", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = synthetic_works(args.works)
+    assert legacy_extract_works(data) == compiled_extract_works(data)
+
+    timings = {}
+    for name, function in (("legacy", legacy_extract_works),
+                           ("compiled", compiled_extract_works)):
+        timings[name] = min(timeit.repeat(
+            lambda: function(data), number=1, repeat=args.repeat))
+        print(f"{name:>9}: {timings[name] * 1000:8.2f} ms "
+              f"for {args.works} works")
+    print(f"  speedup: {timings['legacy'] / timings['compiled']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+'''
+Compares the JSON decoders of orcid_json on a synthetic /works payload:
+generic decoding followed by record extraction with each installed
+backend, and typed decoding straight into records (msgspec only).
+
+Run from the repository root:
+    python benchmarks/bench_json.py [--works 3000] [--repeat 5]
+'''
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_extraction import synthetic_works  # noqa: E402
+from src.pyorcid.orcid_json import (  # noqa: E402
+    decode_records,
+    loads,
+    msgspec,
+    orjson,
+)
+from src.pyorcid.orcid_records import section_records  # noqa: E402
+
+
+def synthetic_payload(count):
+    '''
+    Builds a /works payload whose summaries also carry the metadata the
+    extraction skips (sources, external ids, timestamps...), as real
+    payloads do
+    return  : the UTF-8 JSON payload
+    '''
+    data = synthetic_works(count)
+    for i, group in enumerate(data["group"]):
+        external_ids = {"external-id": [{
+            "external-id-type": "doi",
+            "external-id-value": f"10.1000/example.{i}",
+            "external-id-url": {"value": f"https://doi.org/10.1000/{i}"},
+            "external-id-relationship": "self",
+        }]}
+        group["external-ids"] = external_ids
+        group["last-modified-date"] = {"value": 1700000000000 + i}
+        for summary in group["work-summary"]:
+            summary.update({
+                "created-date": {"value": 1600000000000 + i},
+                "last-modified-date": {"value": 1700000000000 + i},
+                "source": {
+                    "source-orcid": None,
+                    "source-client-id": {
+                        "uri": "https://orcid.org/client/0000-0001-9884-1913",
+                        "path": "0000-0001-9884-1913",
+                        "host": "orcid.org"},
+                    "source-name": {"value": "Crossref"},
+                },
+                "external-ids": external_ids,
+                "visibility": "public",
+                "path": f"/0000-0000-0000-0001/work/{i}",
+                "display-index": "0",
+            })
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--works", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = synthetic_payload(args.works)
+    expected = section_records("works", json.loads(raw))
+    print(f"{len(raw) / 1e6:.1f} MB payload with {args.works} works")
+
+    cases = [(f"{backend} + extract",
+              lambda backend=backend: section_records(
+                  "works", loads(raw, backend)))
+             for backend, module in (("json", json), ("orjson", orjson),
+                                     ("msgspec", msgspec))
+             if module is not None]
+    if msgspec is not None:
+        cases.append(("msgspec typed", lambda: decode_records("works", raw)))
+
+    for name, function in cases:
+        assert function() == expected
+        seconds = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name:>17}: {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
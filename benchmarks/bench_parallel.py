@@ -0,0 +1,92 @@
+'''
+Re-summarizes synthetic /record payloads with orcid_parallel: in this
+process, then on a process pool receiving the payloads through shared
+memory, and on a pool receiving them pickled, as ingest_dump() does.
+
+Run from the repository root:
+    python benchmarks/bench_parallel.py [--records 2000] [--works 50]
+        [--processes N] [--chunk-size 256]
+'''
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_extraction import synthetic_works  # noqa: E402
+from src.pyorcid.orcid_dump import _chunks  # noqa: E402
+from src.pyorcid.orcid_parallel import (  # noqa: E402
+    map_payloads,
+    summarize_record,
+)
+
+
+def synthetic_record(works):
+    '''
+    Builds a /record payload with ``works`` work summaries
+    return  : the UTF-8 JSON payload
+    '''
+    return json.dumps({
+        "history": {"last-modified-date": {"value": 1700000000000}},
+        "person": {
+            "name": {"given-names": {"value": "Ada"}},
+            "other-names": {"other-name": []},
+            "emails": {"email": []},
+            "keywords": {"keyword": [{"content": "optics"}]},
+        },
+        "activities-summary": {"works": synthetic_works(works)},
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def _summarize_pickled(chunk):
+    '''
+    Baseline worker receiving its payloads pickled
+    '''
+    return [(orcid_id, summarize_record(orcid_id, memoryview(payload)))
+            for orcid_id, payload in chunk]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--works", type=int, default=50)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    payload = synthetic_record(args.works)
+    payloads = [(f"0000-0000-{i // 10000:04d}-{i % 10000:04d}", payload)
+                for i in range(args.records)]
+    print(f"{args.records} records of {len(payload) / 1e3:.0f} kB, "
+          f"{args.processes} processes")
+
+    def pickled():
+        with ProcessPoolExecutor(args.processes) as executor:
+            return list(executor.map(
+                _summarize_pickled, _chunks(payloads, args.chunk_size)))
+
+    cases = (
+        ("inline", lambda: list(map_payloads(
+            summarize_record, payloads, processes=0,
+            chunk_size=args.chunk_size))),
+        ("pickled", pickled),
+        ("shared memory", lambda: list(map_payloads(
+            summarize_record, payloads, processes=args.processes,
+            chunk_size=args.chunk_size))),
+    )
+    for name, function in cases:
+        start = time.perf_counter()
+        chunks = function()
+        seconds = time.perf_counter() - start
+        results = [result for chunk in chunks for _, result in chunk]
+        assert len(results) == args.records
+        assert not any(isinstance(result, Exception) for result in results)
+        print(f"{name:>13}: {seconds:6.2f} s "
+              f"({args.records / seconds:8.0f} records/s)")
+
+
+if __name__ == "__main__":
+    main()
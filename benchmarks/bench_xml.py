@@ -0,0 +1,113 @@
+'''
+Compares the single-pass XML parser of OrcidScrapper with the former
+xmltodict + key renaming + metadata removal path on a synthetic record.
+
+Run from the repository root:
+    python benchmarks/bench_xml.py [--works 5000] [--repeat 3]
+'''
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+import xmltodict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pyorcid.orcid_xml import iter_xml_elements, parse_xml  # noqa: E402
+
+NAMESPACES = (
+    "internal", "education", "distinction", "deprecated", "other-name",
+    "membership", "error", "common", "record", "personal-details", "keyword",
+    "email", "external-identifier", "funding", "preferences", "address",
+    "invited-position", "work", "history", "employment", "qualification",
+    "service", "person", "activities", "researcher-url", "peer-review",
+    "bulk", "research-resource",
+)
+
+
+def synthetic_record(works):
+    '''
+    Builds a namespaced /record XML document with ``works`` work summaries
+    return  : the document as bytes
+    '''
+    declarations = " ".join(
+        f'xmlns:{ns}="http://www.orcid.org/ns/{ns}"' for ns in NAMESPACES)
+    summaries = "".join(
+        f'<activities:group><work:work-summary put-code="{i}" '
+        f'visibility="public">'
+        f'<work:title><common:title>Study {i} on café culture'
+        f'</common:title></work:title><work:type>journal-article</work:type>'
+        f'<common:publication-date><common:year>{1990 + i % 30}'
+        f'</common:year></common:publication-date>'
+        f'<work:journal-title>Journal of Examples</work:journal-title>'
+        f'</work:work-summary></activities:group>'
+        for i in range(works))
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<record:record path="/0000-0000-0000-0001" {declarations}>'
+        f'<person:person><person:name><personal-details:given-names>Sri'
+        f'</personal-details:given-names></person:name></person:person>'
+        f'<activities:activities-summary><activities:works>{summaries}'
+        f'</activities:works></activities:activities-summary>'
+        f'</record:record>'
+    ).encode("utf-8")
+
+
+def legacy_parse(xml_data):
+    '''
+    The former path: xmltodict, then a recursive copy renaming "ns:name"
+    keys. Namespace declarations are dropped first (the former code dropped
+    the first root keys after renaming, which could collide with elements
+    such as "person").
+    return  : the parsed document
+    '''
+    def rename(data):
+        if isinstance(data, dict):
+            return {key.split(":")[-1] if ":" in key else key: rename(value)
+                    for key, value in data.items()}
+        if isinstance(data, list):
+            return [rename(item) for item in data]
+        return data
+
+    data = xmltodict.parse(xml_data)
+    section = next(iter(data))
+    data[section] = {key: value for key, value in data[section].items()
+                     if not key.startswith("@xmlns")}
+    return rename(data)
+
+
+def measure(function, repeat):
+    seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--works", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    xml_data = synthetic_record(args.works)
+    assert legacy_parse(xml_data) == parse_xml(xml_data)
+    print(f"{len(xml_data) / 1e6:.1f} MB record with {args.works} works")
+
+    def stream():
+        for _ in iter_xml_elements(xml_data, "work-summary"):
+            pass
+
+    for name, function in (("legacy", lambda: legacy_parse(xml_data)),
+                           ("single-pass", lambda: parse_xml(xml_data)),
+                           ("streamed", stream)):
+        seconds, peak = measure(function, args.repeat)
+        print(f"{name:>12}: {seconds * 1000:8.1f} ms, "
+              f"peak {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
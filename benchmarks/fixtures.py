@@ -0,0 +1,364 @@
+'''
+Payload fixtures of the benchmark suite: synthetic ORCID records and
+search result pages of realistic shapes and sizes, recorded payloads read
+from a directory, and an offline session replaying payloads to the clients.
+'''
+import io
+import json
+import os
+import random
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+# Number of works, fundings, employments and educations of each synthetic
+# profile: a sparse record, a typical one and an exceptionally large one
+PROFILES = {
+    "small": (5, 1, 1, 1),
+    "median": (40, 3, 4, 3),
+    "10k": (10000, 150, 25, 8),
+}
+
+# Rows of the synthetic search result pages (the API's maximum page size)
+SEARCH_ROWS = 1000
+
+_ORGANIZATIONS = (
+    ("Example University", "Zürich", "CH"),
+    ("Institut d'Études Avancées", "Paris", "FR"),
+    ("Northern Research Council", "Oslo", "NO"),
+    ("Universidad de Ejemplo", "Bogotá", "CO"),
+)
+
+_WORK_TYPES = ("journal-article", "conference-paper", "book-chapter",
+               "dataset", "preprint")
+
+
+def _date(year, month=None):
+    return {"year": {"value": str(year)},
+            "month": None if month is None else {"value": f"{month:02d}"},
+            "day": None}
+
+
+def _source():
+    return {
+        "source-orcid": None,
+        "source-client-id": {
+            "uri": "https://orcid.org/client/0000-0001-9884-1913",
+            "path": "0000-0001-9884-1913", "host": "orcid.org"},
+        "source-name": {"value": "Crossref"},
+        "assertion-origin-orcid": None,
+        "assertion-origin-client-id": None,
+        "assertion-origin-name": None,
+    }
+
+
+def _organization(i):
+    name, city, country = _ORGANIZATIONS[i % len(_ORGANIZATIONS)]
+    return {
+        "name": name,
+        "address": {"city": city, "region": None, "country": country},
+        "disambiguated-organization": {
+            "disambiguated-organization-identifier": f"https://ror.org/0{i:07d}",
+            "disambiguation-source": "ROR"},
+    }
+
+
+def _activity_metadata(orcid_id, kind, put_code):
+    return {
+        "created-date": {"value": 1600000000000 + put_code},
+        "last-modified-date": {"value": 1700000000000 + put_code},
+        "source": _source(),
+        "put-code": put_code,
+        "visibility": "public",
+        "path": f"/{orcid_id}/{kind}/{put_code}",
+        "display-index": "0",
+    }
+
+
+def synthetic_works(orcid_id, count, rng):
+    '''
+    Builds a /works payload whose summaries carry the metadata real
+    payloads carry (sources, external ids, timestamps...)
+    return  : the payload
+    '''
+    groups = []
+    for i in range(count):
+        external_ids = {"external-id": [{
+            "external-id-type": "doi",
+            "external-id-value": f"10.{1000 + i % 97}/example.{i}",
+            "external-id-normalized": {"value": f"10.{1000 + i % 97}/example.{i}",
+                                       "transient": True},
+            "external-id-url": {"value": f"https://doi.org/10.1000/example.{i}"},
+            "external-id-relationship": "self",
+        }]}
+        summary = _activity_metadata(orcid_id, "work", 100000 + i)
+        summary.update({
+            "title": {"title": {"value": f"On the {rng.choice(('Scaling', 'Theory', 'Dynamics'))} "
+                                         f"of café culture, part {i}"},
+                      "subtitle": None, "translated-title": None},
+            "external-ids": external_ids,
+            "url": {"value": f"https://example.org/works/{i}"} if i % 4 else None,
+            "type": _WORK_TYPES[i % len(_WORK_TYPES)],
+            "publication-date": _date(1990 + i % 34, 1 + i % 12),
+            "journal-title": {"value": f"Journal of Examples {i % 40}"},
+        })
+        groups.append({
+            "last-modified-date": {"value": 1700000000000 + i},
+            "external-ids": external_ids,
+            "work-summary": [summary],
+        })
+    return {"last-modified-date": {"value": 1700000000000},
+            "group": groups, "path": f"/{orcid_id}/works"}
+
+
+def synthetic_fundings(orcid_id, count, rng):
+    '''
+    Builds a /fundings payload
+    return  : the payload
+    '''
+    groups = []
+    for i in range(count):
+        summary = _activity_metadata(orcid_id, "funding", 200000 + i)
+        summary.update({
+            "title": {"title": {"value": f"Grant {i}: {rng.choice(('Networks', 'Oceans', 'Proteins'))}"},
+                      "translated-title": None},
+            "external-ids": {"external-id": [{
+                "external-id-type": "grant_number",
+                "external-id-value": f"G-{i:06d}",
+                "external-id-url": None,
+                "external-id-relationship": "self"}]},
+            "type": "grant",
+            "start-date": _date(2000 + i % 20, 1 + i % 12),
+            "end-date": _date(2003 + i % 20, 1 + i % 12) if i % 3 else None,
+            "organization": _organization(i),
+            "url": None,
+        })
+        groups.append({"last-modified-date": {"value": 1700000000000 + i},
+                       "external-ids": {"external-id": []},
+                       "funding-summary": [summary]})
+    return {"last-modified-date": {"value": 1700000000000},
+            "group": groups, "path": f"/{orcid_id}/fundings"}
+
+
+def synthetic_affiliations(orcid_id, kind, count):
+    '''
+    Builds an affiliation section payload, e.g. /employments for the
+    "employment" kind
+    return  : the payload
+    '''
+    groups = []
+    for i in range(count):
+        summary = _activity_metadata(orcid_id, kind, 300000 + i)
+        summary.update({
+            "department-name": f"Department {i % 7}",
+            "role-title": "Professor" if kind == "employment" else "PhD",
+            "start-date": _date(1995 + 2 * i, 9),
+            "end-date": _date(1997 + 2 * i, 8) if i else None,
+            "organization": _organization(i),
+            "url": None,
+            "external-ids": None,
+        })
+        groups.append({"last-modified-date": {"value": 1700000000000 + i},
+                       "external-ids": {"external-id": []},
+                       "summaries": [{f"{kind}-summary": summary}]})
+    return {"last-modified-date": {"value": 1700000000000},
+            "affiliation-group": groups, "path": f"/{orcid_id}/{kind}s"}
+
+
+def synthetic_record(profile, orcid_id="0000-0002-1825-0097", seed=0):
+    '''
+    Builds the /record payload of a synthetic profile
+    profile : a key of PROFILES
+    return  : the payload
+    '''
+    works, fundings, employments, educations = PROFILES[profile]
+    rng = random.Random(seed)
+    empty = {"last-modified-date": None, "group": []}
+    return {
+        "orcid-identifier": {"uri": f"https://orcid.org/{orcid_id}",
+                             "path": orcid_id, "host": "orcid.org"},
+        "history": {"last-modified-date": {"value": 1700000000000}},
+        "person": {
+            "name": {"given-names": {"value": "Josiah"},
+                     "family-name": {"value": "Carberry"},
+                     "credit-name": None},
+            "other-names": {"other-name": [{"content": "J. Carberry"}]},
+            "biography": {"content": "Professor of psychoceramics."},
+            "emails": {"email": []},
+            "keywords": {"keyword": [{"content": keyword} for keyword in
+                                     ("ceramics", "psychology", "cracks")]},
+        },
+        "activities-summary": {
+            "educations": synthetic_affiliations(orcid_id, "education",
+                                                 educations),
+            "employments": synthetic_affiliations(orcid_id, "employment",
+                                                  employments),
+            "distinctions": {"affiliation-group": []},
+            "invited-positions": {"affiliation-group": []},
+            "memberships": {"affiliation-group": []},
+            "qualifications": {"affiliation-group": []},
+            "services": {"affiliation-group": []},
+            "fundings": synthetic_fundings(orcid_id, fundings, rng),
+            "peer-reviews": empty,
+            "research-resources": empty,
+            "works": synthetic_works(orcid_id, works, rng),
+        },
+    }
+
+
+_XML_NAMESPACES = " ".join(
+    f'xmlns:{ns}="http://www.orcid.org/ns/{ns}"'
+    for ns in ("record", "common", "person", "personal-details",
+               "activities", "work", "employment", "search"))
+
+
+def synthetic_record_xml(profile, orcid_id="0000-0002-1825-0097"):
+    '''
+    Builds the /record XML document of a synthetic profile, as scraped
+    by OrcidScrapper (works and employments)
+    return  : the document as bytes
+    '''
+    works, _, employments, _ = PROFILES[profile]
+    work_groups = "".join(
+        f'<activities:group><work:work-summary put-code="{100000 + i}" '
+        f'visibility="public" path="/{orcid_id}/work/{100000 + i}">'
+        f'<common:created-date>2020-09-13T12:26:40.000Z</common:created-date>'
+        f'<common:source><common:source-name>Crossref</common:source-name>'
+        f'</common:source><work:title><common:title>On café culture, part {i}'
+        f'</common:title></work:title><common:external-ids>'
+        f'<common:external-id><common:external-id-type>doi'
+        f'</common:external-id-type><common:external-id-value>'
+        f'10.1000/example.{i}</common:external-id-value>'
+        f'</common:external-id></common:external-ids>'
+        f'<work:type>{_WORK_TYPES[i % len(_WORK_TYPES)]}</work:type>'
+        f'<common:publication-date><common:year>{1990 + i % 34}</common:year>'
+        f'<common:month>{1 + i % 12:02d}</common:month>'
+        f'</common:publication-date><work:journal-title>Journal of Examples'
+        f'</work:journal-title></work:work-summary></activities:group>'
+        for i in range(works))
+    employment_groups = "".join(
+        f'<activities:affiliation-group><employment:employment-summary '
+        f'put-code="{300000 + i}"><common:role-title>Professor'
+        f'</common:role-title><common:start-date><common:year>{1995 + 2 * i}'
+        f'</common:year></common:start-date><common:organization>'
+        f'<common:name>{_ORGANIZATIONS[i % 4][0]}</common:name>'
+        f'<common:address><common:city>{_ORGANIZATIONS[i % 4][1]}'
+        f'</common:city><common:country>{_ORGANIZATIONS[i % 4][2]}'
+        f'</common:country></common:address></common:organization>'
+        f'</employment:employment-summary></activities:affiliation-group>'
+        for i in range(employments))
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<record:record path="/{orcid_id}" {_XML_NAMESPACES}>'
+        f'<common:orcid-identifier><common:path>{orcid_id}</common:path>'
+        f'</common:orcid-identifier><person:person><person:name>'
+        f'<personal-details:given-names>Josiah</personal-details:given-names>'
+        f'</person:name></person:person><activities:activities-summary>'
+        f'<activities:employments>{employment_groups}</activities:employments>'
+        f'<activities:works>{work_groups}</activities:works>'
+        f'</activities:activities-summary></record:record>'
+    ).encode("utf-8")
+
+
+def _search_people(rows):
+    for i in range(rows):
+        name, _, _ = _ORGANIZATIONS[i % len(_ORGANIZATIONS)]
+        yield (f"0000-0001-{i // 10000:04d}-{i % 10000:04d}",
+               f"Given{i}", f"Family-Ñame {i}", name)
+
+
+def search_json(rows=SEARCH_ROWS):
+    '''
+    Builds an expanded-search result page
+    return  : the UTF-8 JSON page
+    '''
+    return json.dumps({"expanded-result": [{
+        "orcid-id": orcid_id,
+        "given-names": given,
+        "family-names": family,
+        "credit-name": None,
+        "other-name": [f"{given[0]}. {family}"],
+        "email": [],
+        "institution-name": [institution, "Example Hospital"],
+    } for orcid_id, given, family, institution in _search_people(rows)],
+        "num-found": 250000}, ensure_ascii=False).encode("utf-8")
+
+
+def search_csv(rows=SEARCH_ROWS):
+    '''
+    Builds a csv-search result page with the default columns
+    return  : the UTF-8 CSV page
+    '''
+    lines = ["orcid,given-names,family-name,current-institution-affiliation-name"]
+    lines += [f'{orcid_id},{given},{family},"{institution}, Main Campus"'
+              for orcid_id, given, family, institution in _search_people(rows)]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def search_xml(rows=SEARCH_ROWS):
+    '''
+    Builds an expanded-search result page in XML
+    return  : the XML page as bytes
+    '''
+    results = "".join(
+        f'<expanded-search:expanded-result><expanded-search:orcid-id>{orcid_id}'
+        f'</expanded-search:orcid-id><expanded-search:given-names>{given}'
+        f'</expanded-search:given-names><expanded-search:family-names>{family}'
+        f'</expanded-search:family-names><expanded-search:institution-name>'
+        f'{institution.replace("&", "&amp;")}</expanded-search:institution-name>'
+        f'</expanded-search:expanded-result>'
+        for orcid_id, given, family, institution in _search_people(rows))
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<expanded-search:expanded-search num-found="250000" '
+        f'xmlns:expanded-search="http://www.orcid.org/ns/expanded-search">'
+        f'{results}</expanded-search:expanded-search>'
+    ).encode("utf-8")
+
+
+def recorded_records(directory):
+    '''
+    Reads recorded /record payloads, saved by ``suite.py --record`` as
+    {name}.record.json (and {name}.record.xml for the scraper)
+    return  : a dictionary mapping each name to its (JSON bytes, XML
+    bytes or None) payloads
+    '''
+    records = {}
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".record.json"):
+            continue
+        name = file_name[:-len(".record.json")]
+        with open(os.path.join(directory, file_name), "rb") as file:
+            payload = file.read()
+        xml = None
+        xml_path = os.path.join(directory, f"{name}.record.xml")
+        if os.path.exists(xml_path):
+            with open(xml_path, "rb") as file:
+                xml = file.read()
+        records[name] = (payload, xml)
+    return records
+
+
+class ReplaySession:
+    '''
+    Stands in for the requests.Session of a transport: every GET is
+    answered with a real requests.Response whose body is read from
+    memory, selected by the last path segment of the URL (e.g. "record",
+    "works" or "expanded-search") or by the search mode
+    '''
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    def get(self, url, **kwargs):
+        parts = urlsplit(url)
+        key = parts.path.rstrip("/").rsplit("/", 1)[-1]
+        if "fl" in parse_qs(parts.query):
+            key = "csv-search"
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.raw = io.BytesIO(self.payloads[key])
+        return response
+
+    def close(self):
+        pass
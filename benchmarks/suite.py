@@ -0,0 +1,303 @@
+'''
+Offline benchmark suite: times the extraction, summary, scraper and search
+paths on synthetic (and optionally recorded) payloads, without network.
+
+Every case reports its time per call, throughput and peak traced memory.
+Results can be saved and compared with a previous run to flag regressions,
+e.g. between two commits:
+
+    git checkout main && python benchmarks/suite.py --save base.json
+    git checkout my-branch && python benchmarks/suite.py --compare base.json
+
+Run from the repository root:
+    python benchmarks/suite.py [-k FILTER] [--repeat 5] [--fixtures DIR]
+        [--save FILE] [--compare FILE] [--load FILE] [--threshold 0.1]
+    python benchmarks/suite.py --record ORCID_ID [...] --fixtures DIR
+'''
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import fixtures  # noqa: E402
+from src.pyorcid import (  # noqa: E402
+    Orcid,
+    OrcidScrapper,
+    OrcidSearch,
+    OrcidTransport,
+)
+from src.pyorcid.orcid_extraction import iter_section_items  # noqa: E402
+from src.pyorcid.orcid_xml import parse_xml  # noqa: E402
+
+# A benchmarked call: ``items`` summaries or rows handled from ``size``
+# bytes of payload per call
+Case = namedtuple("Case", "name function items size")
+
+# Memory growth below this is never reported as a regression
+MEMORY_NOISE = 64 * 1024
+
+ORCID_ID = "0000-0002-1825-0097"
+
+
+def _replay_transport(payloads):
+    transport = OrcidTransport()
+    transport.session = fixtures.ReplaySession(payloads)
+    return transport
+
+
+def _size(data):
+    return len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def record_cases(profile, payload, xml):
+    '''
+    Cases of one profile: the section accessors, the affiliation helper,
+    record_summary() with and without decoding, and the scraper
+    payload : the /record JSON bytes
+    xml     : the /record XML bytes, or None to skip the scraper
+    return  : a list of cases
+    '''
+    data = json.loads(payload)
+    activities = data.get("activities-summary") or {}
+    orcid = Orcid(ORCID_ID, transport=_replay_transport({"record": payload}))
+
+    def count(section):
+        return sum(1 for _ in iter_section_items(
+            section, activities.get(section)))
+
+    works, fundings = activities.get("works"), activities.get("fundings")
+    employments = activities.get("employments")
+    activity_count = sum(count(section) for section in (
+        "works", "fundings", "educations", "employments"))
+    cases = [
+        Case(f"works[{profile}]", lambda: orcid.works(works),
+             count("works"), _size(works)),
+        Case(f"fundings[{profile}]", lambda: orcid.fundings(fundings),
+             count("fundings"), _size(fundings)),
+        Case(f"extract_details[{profile}]",
+             lambda: orcid._Orcid__extract_details(employments, "employment"),
+             count("employments"), _size(employments)),
+        Case(f"record_summary[{profile}]",
+             lambda: orcid.record_summary(data=data),
+             activity_count, len(payload)),
+        Case(f"record_summary_decode[{profile}]", orcid.record_summary,
+             activity_count, len(payload)),
+    ]
+    if xml is not None:
+        scrapper = OrcidScrapper(ORCID_ID, transport=_replay_transport(
+            {"record": xml, "works": xml}))
+        cases += [
+            Case(f"scrapper_parse_xml[{profile}]",
+                 lambda: scrapper._parse_xml(xml), count("works"), len(xml)),
+            Case(f"scrapper_stream_works[{profile}]",
+                 lambda: sum(1 for _ in scrapper.scrape_elements(
+                     "works", "work-summary")),
+                 count("works"), len(xml)),
+        ]
+    return cases
+
+
+def search_cases(rows=fixtures.SEARCH_ROWS):
+    '''
+    Cases of a full search result page in JSON and CSV through OrcidSearch,
+    and in XML through the XML parser (OrcidSearch reads JSON and CSV only)
+    return  : a list of cases
+    '''
+    page_json = fixtures.search_json(rows)
+    page_csv = fixtures.search_csv(rows)
+    page_xml = fixtures.search_xml(rows)
+    search = OrcidSearch(transport=_replay_transport({
+        "expanded-search": page_json, "csv-search": page_csv}))
+    return [
+        Case("search_json", lambda: search.search("family-name:Carberry"),
+             rows, len(page_json)),
+        Case("search_csv", lambda: list(search.iter_csv_search(
+            "family-name:Carberry", max_results=rows)), rows, len(page_csv)),
+        Case("search_xml", lambda: parse_xml(page_xml), rows, len(page_xml)),
+    ]
+
+
+def build_cases(fixtures_directory=None):
+    '''
+    return  : every case, synthetic profiles first, then recorded ones
+    '''
+    cases = []
+    for profile in fixtures.PROFILES:
+        payload = json.dumps(fixtures.synthetic_record(profile, ORCID_ID),
+                             ensure_ascii=False).encode("utf-8")
+        cases += record_cases(profile, payload,
+                              fixtures.synthetic_record_xml(profile, ORCID_ID))
+    if fixtures_directory:
+        for name, (payload, xml) in fixtures.recorded_records(
+                fixtures_directory).items():
+            cases += record_cases(f"recorded:{name}", payload, xml)
+    return cases + search_cases()
+
+
+def measure(case, repeat):
+    '''
+    Times a case (best of ``repeat`` runs of enough calls to last about
+    0.2 s) and traces the peak memory of one call
+    return  : a dictionary of the measurements
+    '''
+    case.function()
+    timer = timeit.Timer(case.function)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        case.function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "items": case.items,
+        "bytes": case.size,
+        "items_per_second": case.items / seconds,
+        "mb_per_second": case.size / seconds / 1e6,
+        "peak_bytes": peak,
+    }
+
+
+def _metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def print_results(results):
+    print(f"{'case':<40} {'time':>11} {'items/s':>11} {'MB/s':>8} "
+          f"{'peak MB':>8}")
+    for name, result in results.items():
+        print(f"{name:<40} {result['seconds'] * 1000:8.3f} ms "
+              f"{result['items_per_second']:11.0f} "
+              f"{result['mb_per_second']:8.1f} "
+              f"{result['peak_bytes'] / 1e6:8.2f}")
+
+
+def compare(baseline, results, threshold):
+    '''
+    Prints the time and peak memory of every case relative to a baseline
+    run, flagging the cases slower or larger by more than ``threshold``
+    return  : the names of the regressed cases
+    '''
+    regressions = []
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'} "
+          f"(threshold {threshold:.0%}):")
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<40} new")
+            continue
+        time_ratio = result["seconds"] / before["seconds"]
+        memory_ratio = result["peak_bytes"] / max(before["peak_bytes"], 1)
+        flags = []
+        if time_ratio > 1 + threshold:
+            flags.append("SLOWER")
+        if (memory_ratio > 1 + threshold and
+                result["peak_bytes"] - before["peak_bytes"] > MEMORY_NOISE):
+            flags.append("MORE MEMORY")
+        if flags:
+            regressions.append(name)
+        elif time_ratio < 1 - threshold:
+            flags.append("faster")
+        print(f"{name:<40} time x{time_ratio:5.2f}  memory "
+              f"x{memory_ratio:5.2f}  {' '.join(flags)}")
+    return regressions
+
+
+def record(orcid_ids, directory):
+    '''
+    Saves the public /record payloads of real profiles, in JSON and XML,
+    as fixtures (requires network access)
+    '''
+    os.makedirs(directory, exist_ok=True)
+    with OrcidTransport() as transport:
+        for orcid_id in orcid_ids:
+            for extension, accept in (("json", "application/json"),
+                                      ("xml", "application/xml")):
+                response = transport.get(
+                    f"https://pub.orcid.org/v3.0/{orcid_id}/record",
+                    headers={"Accept": accept})
+                response.raise_for_status()
+                path = os.path.join(directory,
+                                    f"{orcid_id}.record.{extension}")
+                with open(path, "wb") as file:
+                    file.write(response.content)
+                print(f"Recorded {path} ({len(response.content)} bytes)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", dest="filter", default="",
+                        help="only run the cases whose name contains FILTER")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fixtures",
+                        help="directory of recorded {name}.record.json "
+                             "(and .xml) payloads to benchmark too")
+    parser.add_argument("--record", nargs="+", metavar="ORCID_ID",
+                        help="record public profiles into --fixtures")
+    parser.add_argument("--save", help="write the results to a JSON file")
+    parser.add_argument("--load",
+                        help="read the results from a JSON file instead of "
+                             "running the cases")
+    parser.add_argument("--compare",
+                        help="baseline results to compare with; exits with "
+                             "status 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown or memory growth reported "
+                             "as a regression")
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.fixtures:
+            parser.error("--record needs --fixtures")
+        record(args.record, args.fixtures)
+        return 0
+
+    if args.load:
+        with open(args.load, encoding="utf-8") as file:
+            run = json.load(file)
+    else:
+        run = {"meta": _metadata(), "results": {}}
+        for case in build_cases(args.fixtures):
+            if args.filter in case.name:
+                run["results"][case.name] = measure(case, args.repeat)
+    print_results(run["results"])
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(run, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, run["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): "
+                  f"{', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
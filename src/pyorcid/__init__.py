@@ -1,6 +1,48 @@
 from .orcid import Orcid
+from .orcid_async import AsyncOrcid, AsyncOrcidScrapper, AsyncOrcidSearch
 from .orcid_authentication import OrcidAuthentication
+from .orcid_batch import OrcidBatch, harvest
+from .orcid_cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+from .orcid_columnar import ArrowBatchWriter
+from .orcid_metrics import MetricsAggregator, MetricsHook, OpenTelemetryHook, PrometheusHook
+from .orcid_records import AffiliationSummary, FundingSummary, WorkSummary
+from .orcid_report import CohortReport
 from .orcid_scrapper import OrcidScrapper
 from .orcid_search import OrcidSearch
+from .orcid_singleflight import AsyncSingleFlight, SingleFlight
+from .orcid_store import RecordStore
+from .orcid_sync import OrcidSync, SyncState
+from .orcid_throttle import RateLimiter, RetryPolicy
+from .orcid_transport import OrcidTransport
 
-__all__ = ["Orcid", "OrcidAuthentication", "OrcidScrapper", "OrcidSearch"]
+__all__ = [
+    "AffiliationSummary",
+    "ArrowBatchWriter",
+    "AsyncOrcid",
+    "AsyncOrcidScrapper",
+    "AsyncOrcidSearch",
+    "AsyncSingleFlight",
+    "CohortReport",
+    "FundingSummary",
+    "MemoryCacheBackend",
+    "MetricsAggregator",
+    "MetricsHook",
+    "OpenTelemetryHook",
+    "Orcid",
+    "OrcidAuthentication",
+    "OrcidBatch",
+    "OrcidScrapper",
+    "OrcidSearch",
+    "OrcidSync",
+    "OrcidTransport",
+    "PrometheusHook",
+    "RateLimiter",
+    "RecordStore",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCacheBackend",
+    "SingleFlight",
+    "SyncState",
+    "WorkSummary",
+    "harvest",
+]
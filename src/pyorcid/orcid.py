@@ -2,24 +2,96 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Iterable
 
 import requests
 
+from .orcid_cache import normalize_section
+from .orcid_columnar import AFFILIATION_SECTIONS, section_columns, to_arrow
+from .orcid_extraction import (
+    AFFILIATION_SCHEMA,
+    FUNDING_SCHEMA,
+    WORK_SCHEMA,
+    format_date,
+    get_path,
+    iter_affiliation_items,
+    iter_group_items,
+)
+from .orcid_json import response_json, response_records
+from .orcid_metrics import timed_decode
+from .orcid_records import section_records
+from .orcid_store import STORED_SECTIONS, RecordStore
+from .orcid_stream import iter_funding_summaries, iter_work_summaries
+from .orcid_templates import MARKDOWN_TEMPLATE
+from .orcid_token import needs_validation, token_validation_cache
+from .orcid_transport import OrcidTransport
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of put-codes the bulk works endpoint accepts per request
+MAX_BULK_WORKS = 100
+
+
+class _SectionUnavailable(Exception):
+    '''
+    Raised (once logged) by Orcid.__stream_section when the section cannot
+    be read, so that a streaming accessor yields nothing instead of failing
+    on an empty JSON document
+    '''
+
+
+def _unless_unavailable(items):
+    '''
+    Helper function for the streaming accessors
+    return  : a generator of the items, empty if the section could not be
+    read
+    '''
+    try:
+        yield from items
+    except _SectionUnavailable:
+        return
+
 
 class Orcid:
     '''
     This is a wrapper class for ORCID API
+
+    Every section accessor (works(), fundings(), employments(), ...)
+    accepts an optional ``data`` argument holding the already fetched
+    payload of its section, e.g. one of the values returned by
+    fetch_sections(); the section is read from ORCID only when it is None.
     '''
+    # Activity sections summarised by record_summary(), in the order
+    # they appear in the summary
+    ACTIVITY_SECTIONS = (
+        "educations",
+        "qualifications",
+        "employments",
+        "distinctions",
+        "invited-positions",
+        "memberships",
+        "services",
+        "fundings",
+        "works",
+    )
+
     def __init__(
         self,
         orcid_id: str,
         orcid_access_token: str = " ",
         state: str = "public",
-        sandbox: bool = False
+        sandbox: bool = False,
+        max_workers: int = 10,
+        transport: OrcidTransport | None = None,
+        store: RecordStore | None = None
     ) -> None:
         """Initialize orcid instance.
 
@@ -28,58 +100,70 @@ class Orcid:
             orcid_access_token: ORCID access token obtained from the user
             state: Whether to use "public" or "member" API of ORCID
             sandbox: Whether to use ORCID sandbox API for testing
-
-        Raises:
-            ValueError: If access token is invalid
+            max_workers: Number of sections fetch_sections() reads in
+                parallel; the connection pool is sized to match
+            transport: Transport to send requests with, e.g. one shared by
+                many instances (a private transport is created if None)
+            store: RecordStore serving the sections it holds without any
+                request; the sections read from ORCID are saved to it
+
+        Note:
+            The access token is validated lazily, from the response to the
+            first request, and the outcome is shared process-wide; see
+            orcid_token.token_validation_cache.
         """
         self._orcid_id = orcid_id
         self._orcid_access_token = orcid_access_token
         self._state = state
         self._sandbox = sandbox
-        self._session = requests.Session()
+        self._max_workers = max_workers
+        if transport is None:
+            transport = self._make_transport()
+        self._transport = transport
+        self._store = store
+        self._token_validated = not needs_validation(orcid_access_token)
+
+    def _make_transport(self) -> OrcidTransport:
+        '''
+        Creates the private transport of an instance given none; overridden
+        by the clients that do not send their requests with requests
+        return  : the transport
+        '''
+        return OrcidTransport(pool_maxsize=self._max_workers)
 
-        # For testing purposes (pytesting on github workflow)
-        if orcid_access_token.strip() and orcid_access_token != " ":
-            try:
-                self.__test_is_access_token_valid()
-            except (KeyError, OSError):
-                if not self.__is_access_token_valid():
-                    raise ValueError(
-                        f"Invalid access token! Please make sure the user with "
-                        f"ORCID_ID:{orcid_id} has given access."
-                    )
+    def _check_access_token(
+        self,
+        status_code: int | None = None,
+        section: str = "record"
+    ) -> None:
+        """Validate the access token from the outcome of a request.
 
-    def __is_access_token_valid(self) -> bool:
-        """Check if the current access token is valid.
+        Called before a request (status_code None), to fail fast on a token
+        already known to be rejected, and after it, to record the outcome.
+        A 401/403 is recorded for this iD and section only, since it may
+        mean the section is restricted rather than the token invalid.
 
-        Returns:
-            True if token is valid, False otherwise
+        Args:
+            status_code: Status of a response obtained with the token
+            section: Section the request was for
 
         Raises:
-            ValueError: If access token is empty
+            ValueError: If ORCID rejected the access token (for the
+                section)
         """
-        access_token = self._orcid_access_token
-
-        if not access_token or access_token.strip() == "":
+        if self._token_validated:
+            return
+        valid = token_validation_cache.check(
+            self._orcid_access_token, self._state, self._sandbox, status_code,
+            resource=f"{self._orcid_id}/{normalize_section(section)}")
+        if valid is None:
+            return
+        if not valid:
             raise ValueError(
-                "Empty value for access token! Please make sure you are "
-                "authenticated by ORCID as developer."
+                f"Invalid access token! Please make sure the user with "
+                f"ORCID_ID:{self._orcid_id} has given access."
             )
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-
-        api_url = self.__get_api_url()
-
-        try:
-            response = self._session.get(api_url, headers=headers, timeout=10)
-            # Status code 200 or 404 means token is valid (404 just means empty profile)
-            return response.status_code in (200, 404)
-        except requests.RequestException as e:
-            logger.warning(f"Failed to validate access token: {e}")
-            return False
+        self._token_validated = True
 
     def __get_api_url(self, section: str = "") -> str:
         """Construct API URL based on state and sandbox settings.
@@ -107,18 +191,62 @@ class Orcid:
             url = f"{url}/{section}"
         return url
 
-    def __read_section(self, section: str = "record") -> dict[str, Any] | None:
+    def _read_section(
+        self,
+        section: str = "record",
+        strict: bool = False
+    ) -> dict[str, Any] | None:
+        """Read and decode a section of the profile, see __read_section.
+
+        The hook collaborators such as OrcidBatch read sections through;
+        AsyncOrcid overrides it with a coroutine.
+        """
+        return self.__read_section(section, strict=strict)
+
+    def __read_section(
+        self,
+        section: str = "record",
+        decode: Callable[[Any], Any] = response_json,
+        strict: bool = False
+    ) -> dict[str, Any] | None:
         """Read a section of an ORCID profile.
 
         Args:
             section: The ORCID API section to read (default: "record")
+            decode: Function decoding the successful response; by default
+                the fastest installed JSON decoder (see orcid_json). Not
+                applied to the sections served by or saved to the store,
+                which are returned as payloads.
+            strict: Raise the error of a failed request instead of
+                returning {}
 
         Returns:
-            Dictionary containing the section data, or None if request fails
+            Dictionary containing the section data (the result of decode),
+            or {} if request fails
 
         Raises:
-            requests.RequestException: If the API request fails
+            ValueError: If the access token is invalid, or (strict) the
+                response cannot be decoded
+            requests.HTTPError: If authentication fails after the token
+                was validated
+            requests.RequestException: If the request fails (strict)
         """
+        if self._store is not None and section in STORED_SECTIONS:
+            data = self._store.get(self._orcid_id, section)
+            if data is None:
+                data = self.__fetch_section(section, response_json, strict)
+                if data:
+                    self._store.put(self._orcid_id, section, data)
+            return data
+        return self.__fetch_section(section, decode, strict)
+
+    def __fetch_section(self, section, decode, strict=False):
+        '''
+        Helper function for __read_section: reads a section from ORCID
+        strict  : raise the error of a failed request instead of returning {}
+        return  : the decoded section, or {} if the request fails
+        '''
+        self._check_access_token(section=section)
         access_token = self._orcid_access_token
 
         headers = {
@@ -129,9 +257,19 @@ class Orcid:
         api_url = self.__get_api_url(section)
 
         try:
-            response = self._session.get(api_url, headers=headers, timeout=30)
+            response = self._transport.get(
+                api_url, headers=headers, section=section)
+        except requests.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            if strict:
+                raise
+            return {}
+        self._check_access_token(response.status_code, section)
+
+        try:
             response.raise_for_status()
-            return response.json()
+            return timed_decode(
+                self._transport.hooks, section, response, decode)
         except requests.HTTPError as e:
             if e.response.status_code in (401, 403):
                 logger.error(
@@ -143,15 +281,117 @@ class Orcid:
                 f"Failed to retrieve ORCID section '{section}': "
                 f"{e.response.status_code} {e.response.text}"
             )
+            if strict:
+                raise
             return {}
 
         except requests.RequestException as e:
             logger.error(f"Request failed: {e}")
+            if strict:
+                raise
             return {}
         except ValueError as e:
             logger.error(f"Failed to parse JSON response: {e}")
+            if strict:
+                raise
             return {}
 
+    def __stream_section(self, section, chunk_size=65536):
+        '''
+        Streams the raw body of a section instead of decoding it at once
+        return  : a generator of byte chunks
+        raises  : _SectionUnavailable if the request fails before the body,
+        ValueError if the access token is invalid, HTTPError on 401/403
+        once the token was validated, RequestException if the connection
+        fails while the body is read
+        '''
+        self._check_access_token(section=section)
+        headers = {
+            'Authorization': f'Bearer {self._orcid_access_token}',
+            'Content-Type': 'application/json'
+        }
+        api_url = self.__get_api_url(section)
+
+        try:
+            response = self._transport.get(
+                api_url, headers=headers, section=section, stream=True)
+        except requests.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise _SectionUnavailable(section) from e
+
+        try:
+            try:
+                self._check_access_token(response.status_code, section)
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                if e.response.status_code in (401, 403):
+                    logger.error(
+                        f"Authentication failed for ORCID section "
+                        f"'{section}': {e.response.status_code}"
+                    )
+                    raise
+                logger.warning(
+                    f"Failed to retrieve ORCID section '{section}': "
+                    f"{e.response.status_code}"
+                )
+                raise _SectionUnavailable(section) from e
+            yield from response.iter_content(chunk_size=chunk_size)
+        finally:
+            response.close()
+
+    def fetch_sections(
+        self,
+        sections: Iterable[str],
+        max_workers: int | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Read several sections of the profile concurrently.
+
+        Each section is read on its own worker thread, so the whole call
+        takes about as long as the slowest section. A section whose request
+        fails is logged and reported as an empty dict without cancelling
+        the others, mirroring how a single failed read behaves.
+
+        Args:
+            sections: ORCID API section names, e.g. ["works", "fundings"]
+            max_workers: Number of parallel requests (defaults to the
+                max_workers the instance was created with)
+
+        Returns:
+            Dictionary mapping each section name to its parsed payload
+
+        Raises:
+            ValueError: If the access token is invalid
+            requests.HTTPError: If authentication fails after the token
+                was validated
+        """
+        sections = list(dict.fromkeys(sections))
+        if not sections:
+            return {}
+
+        workers = min(max_workers or self._max_workers, len(sections))
+        self._transport.ensure_pool_size(workers)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.__read_section, section): section
+                for section in sections
+            }
+            for future in as_completed(futures):
+                section = futures[future]
+                try:
+                    results[section] = future.result()
+                except requests.HTTPError:
+                    # Only 401/403 get here: a rejected token fails every
+                    # section alike
+                    raise
+                except requests.RequestException as e:
+                    logger.error(
+                        f"Failed to retrieve ORCID section '{section}': {e}")
+                    results[section] = {}
+
+        return {section: results[section] for section in sections}
+
     def __timestamp_to_iso_date(self, timestamp):
         '''
         Converts a timestamp to an ISO date string
@@ -177,33 +417,23 @@ class Orcid:
         except Exception as e:
             raise ValueError(f"Error: {e}")
 
-    def __deunicode_string(self, s):
-        '''
-        Removes non-ASCII characters from a string
-        return : a string with only ASCII characters
-        '''
-        try:
-            # Check if string contains any non-ASCII characters
-            s.encode('ascii')
-        except UnicodeEncodeError:
-            # String contains non-ASCII characters, remove them
-            s = s.encode('ascii', 'ignore').decode('ascii')
-        return s
-
-    def record(self):
+    def record(self, data=None):
         '''
         Reads the Orcid record
         return  : a dictionary of summary view of the full ORCID record
         '''
-        return self.__read_section("record")
+        if data is None:
+            data = self.__read_section("record")
+        return data
 
-    def person(self):
+    def person(self, data=None):
         '''
         Read biographical section of the ORCID record, including
         through /researcher-urls below
         return  : dict with name, biography, researcher-urls
         '''
-        data = self.__read_section("person")
+        if data is None:
+            data = self.__read_section("person")
         name = self.__get_value_from_keys(
             data, ["name", "given-names", "value"])
         bio = self.__get_value_from_keys(data, ["biography", "content"])
@@ -226,260 +456,455 @@ class Orcid:
 
         return {"Name": name, "Bio": bio, "URLs": urls}
 
-    def address(self):
+    def address(self, data=None):
         '''
         The researcher's countries or regions
         return  :
         '''
-        return self.__read_section("address")
+        if data is None:
+            data = self.__read_section("address")
+        return data
 
-    def email(self):
+    def email(self, data=None):
         '''
         The email address(es) associated with the record
         return  : A tuple of list of emails and whole info tree
         related to email from orcid
         '''
-        data = self.__read_section("email")
+        if data is None:
+            data = self.__read_section("email")
         emails = [email['email'] for email in self.__get_value_from_keys(
             data, ["person", "emails", "email"])]
         return emails, data
 
-    def external_identifiers(self):
+    def external_identifiers(self, data=None):
         '''
         Linked external identifiers in other systems
         return  :
         '''
-        return self.__read_section("external-identifiers")
+        if data is None:
+            data = self.__read_section("external-identifiers")
+        return data
 
-    def keywords(self):
+    def keywords(self, data=None):
         '''
         Keywords related to the researcher and their work
         return  : A tuple of list of keywords and whole info tree
         related to keywords from orcid
         '''
-        data = self.__read_section("keywords")
+        if data is None:
+            data = self.__read_section("keywords")
         lis = [value["content"] for value in data["keyword"]]
 
         return (lis, data)
 
-    def other_names(self):
+    def other_names(self, data=None):
         '''
         Other names by which the researcher is known
         return  :
         '''
-        return self.__read_section("other-names")
+        if data is None:
+            data = self.__read_section("other-names")
+        return data
 
-    def personal_details(self):
+    def personal_details(self, data=None):
         '''
         Personal details: the researcher's name, credit (published)
         name, and biography
         return  :
         '''
-        return self.__read_section("personal-details")
+        if data is None:
+            data = self.__read_section("personal-details")
+        return data
 
-    def researcher_urls(self):
+    def researcher_urls(self, data=None):
         '''
         Links to the researcher's personal or profile pages
         return  :
         '''
-        return self.__read_section("researcher-urls")
+        if data is None:
+            data = self.__read_section("researcher-urls")
+        return data
 
-    def activities(self):
+    def activities(self, data=None):
         '''
         Summary of the activities section of the ORCID record,
         including through /works below.
         return  :
         '''
-        return self.__read_section("activities")
+        if data is None:
+            data = self.__read_section("activities")
+        return data
 
-    def educations(self):
+    def educations(self, data=None):
         '''
         Education affiliations
         return  : a tuple containing the Education details and the whole
         info tree related to education from orcid
         '''
-        data = self.__read_section("educations")
+        if data is None:
+            data = self.__read_section("educations")
 
         edu = self.__extract_details(data, "education")
 
         return (edu, data)
 
-    def employments(self):
+    def employments(self, data=None):
         '''
         Employment affiliations
         return  : a tuple containing the Employment details and the whole
         info tree related to employment from orcid
         '''
-        data = self.__read_section("employments")
+        if data is None:
+            data = self.__read_section("employments")
 
         employments = self.__extract_details(data, "employment")
 
         return (employments, data)
 
-    def fundings(self):
+    def fundings(self, data=None):
         '''
         Summary of funding activities
         return  : a tuple containing the Funding details and the whole
         info tree related to funding from orcid
         '''
-        funding_details = []
-
-        data = self.__read_section("fundings")
-        group = data.get('group', [])
-
-        for funding_summary in group:
-            funding_summaries = funding_summary.get('funding-summary', [])
-
-            for fund_summary in funding_summaries:
-                title = self.__get_value_from_keys(
-                    fund_summary, ["title", "title", "value"])
-                fund_type = self.__get_value_from_keys(
-                    fund_summary, ["type"])
-                start_date = self.get_formatted_date(
-                    fund_summary.get('start-date', {}))
-                end_date = self.get_formatted_date(
-                    fund_summary.get('end-date', {}))
-                organization = self.__get_value_from_keys(
-                    fund_summary, ["organization", "name"])
-                organization_address = self.__org_string_from_obj(
-                    self.__get_value_from_keys(
-                        fund_summary, ["organization", "address"]))
-                url = self.__get_value_from_keys(
-                    fund_summary, ["url", "value"])
-
-                funding_detail = {
-                    'title': title,
-                    'type': fund_type,
-                    'start-date': start_date,
-                    'end-date': end_date,
-                    'organization': organization,
-                    'organization-address': organization_address,
-                    'url': url,
-                }
-
-                funding_details.append(funding_detail)
+        if data is None:
+            data = self.__read_section("fundings")
+
+        funding_details = self.__extract_fundings(data)
 
         return (funding_details, data)
 
-    def peer_reviews(self):
+    def peer_reviews(self, data=None):
         '''
         Summary of peer review activities
         return  :
         '''
-        return self.__read_section("peer-reviews")
+        if data is None:
+            data = self.__read_section("peer-reviews")
+        return data
 
-    def works(self):
+    def works(self, data=None):
         '''
         Summary of research works
         return  : a tuple containing the Work details and the whole
         info tree related to work from orcid
         '''
-        data = self.__read_section("works")
-        work_details = []
-
-        group = data.get('group', [])
-
-        for work_summary in group:
-            work_summaries = work_summary.get('work-summary', [])
-
-            for work_summary in work_summaries:
-                title = self.__get_value_from_keys(
-                    work_summary, ["title", "title", "value"])
-                work_type = self.__get_value_from_keys(
-                    work_summary, ["type"])
-                publication_date = self.get_formatted_date(
-                    work_summary.get('publication-date', {}))
-                journal_title = self.__get_value_from_keys(
-                    work_summary, ["journal-title", "value"])
-                organization = self.__get_value_from_keys(
-                    work_summary, ["organization", "name"])
-                organization_address = self.__org_string_from_obj(
-                    self.__get_value_from_keys(
-                        work_summary, ["organization", "address"]))
-                url = self.__get_value_from_keys(
-                    work_summary, ["url", "value"])
-
-                work_detail = {
-                    'title': title,
-                    'type': work_type,
-                    'publication-date': publication_date,
-                    'journal title': journal_title,
-                    'organization': organization,
-                    'organization-address': organization_address,
-                    'url': url,
-                }
-
-                work_details.append(work_detail)
+        if data is None:
+            data = self.__read_section("works")
+
+        work_details = self.__extract_works(data)
 
         return (work_details, data)
 
-    def research_resources(self):
+    def research_resources(self, data=None):
         '''
         Summary of research resources
         return  :
         '''
-        return self.__read_section("research-resources")
+        if data is None:
+            data = self.__read_section("research-resources")
+        return data
 
-    def services(self):
+    def services(self, data=None):
         '''
         Summary of services
         return  : a tuple containing the Service details and the whole
         info tree related to service from orcid
         '''
-        data = self.__read_section("services")
+        if data is None:
+            data = self.__read_section("services")
 
         services = self.__extract_details(data, "service")
 
         return (services, data)
 
-    def qualifications(self):
+    def qualifications(self, data=None):
         '''
         Summary of qualifications
         return  : a tuple containing the Qualification details and the
         whole info tree related to qualification from orcid
         '''
-        data = self.__read_section("qualifications")
+        if data is None:
+            data = self.__read_section("qualifications")
 
         qualifications = self.__extract_details(data, "qualification")
 
         return (qualifications, data)
 
-    def memberships(self):
+    def memberships(self, data=None):
         '''
         Summary of memberships
         return  : a tuple containing the Membership details and the whole
         info tree related to membership from orcid
         '''
-        data = self.__read_section("memberships")
+        if data is None:
+            data = self.__read_section("memberships")
 
         mem = self.__extract_details(data, "membership")
 
         return (mem, data)
 
-    def distinctions(self):
+    def distinctions(self, data=None):
         '''
         Summary of distinctions
         return  : a tuple containing the distinction details and the whole
         info tree related to distinction from orcid
         '''
-        data = self.__read_section("distinctions")
+        if data is None:
+            data = self.__read_section("distinctions")
 
         distinctions = self.__extract_details(data, "distinction")
 
         return (distinctions, data)
 
-    def invited_positions(self):
+    def invited_positions(self, data=None):
         '''
         Summary of invited positions
         return  : a tuple containing the invited position details and the
         whole info tree related to invited position from orcid
         '''
-        data = self.__read_section("invited-positions")
+        if data is None:
+            data = self.__read_section("invited-positions")
 
         invited_pos = self.__extract_details(data, "invited-position")
 
         return (invited_pos, data)
 
+    def work_summaries(self, data=None):
+        '''
+        Typed version of works()
+        data    : pre-fetched /works payload, read from ORCID if None (and
+                  then decoded straight into records, see
+                  orcid_json.decode_records)
+        return  : a list of WorkSummary records (as_dict() gives the dicts
+        listed by works())
+        '''
+        if data is None:
+            return self.__read_records("works")
+        return section_records("works", data)
+
+    def funding_summaries(self, data=None):
+        '''
+        Typed version of fundings()
+        data    : pre-fetched /fundings payload, read from ORCID if None
+        return  : a list of FundingSummary records
+        '''
+        if data is None:
+            return self.__read_records("fundings")
+        return section_records("fundings", data)
+
+    def affiliation_summaries(self, section="employments", data=None):
+        '''
+        Typed version of the affiliation accessors (educations(),
+        employments(), services(), ...)
+        section : the affiliation section, e.g. "educations" or
+                  "invited-positions"
+        data    : pre-fetched section payload, read from ORCID if None
+        return  : a list of AffiliationSummary records
+        '''
+        self.__check_affiliation_section(section)
+        if data is None:
+            return self.__read_records(section)
+        return section_records(section, data)
+
+    def work_details(self, put_codes=None, batch_size=MAX_BULK_WORKS,
+                     max_workers=None):
+        '''
+        Full metadata of works (contributors, citation, external ids...),
+        read through the bulk works/{put-code,put-code,...} endpoint:
+        one request per batch of put-codes instead of one per work, with
+        several batches in flight at once
+        put_codes   : put-codes of the works to read, by default every
+                      put-code listed by /works
+        batch_size  : put-codes per request, at most MAX_BULK_WORKS
+        max_workers : number of batches read in parallel (defaults to the
+                      max_workers the instance was created with)
+        return  : a generator of work dictionaries, in completion order;
+        put-codes ORCID reports an error for are logged and skipped
+        raises  : ValueError if batch_size exceeds MAX_BULK_WORKS
+        '''
+        if put_codes is None:
+            put_codes = self._work_put_codes(self.__read_section("works"))
+        batches = iter(self._work_batches(put_codes, batch_size))
+        workers = max_workers or self._max_workers
+        self._transport.ensure_pool_size(workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for batch in batches:
+                pending.add(executor.submit(self.__read_work_batch, batch))
+                if len(pending) >= workers:
+                    break
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Refill the freed slot before handing the works out
+                    batch = next(batches, None)
+                    if batch is not None:
+                        pending.add(
+                            executor.submit(self.__read_work_batch, batch))
+                    yield from future.result()
+
+    def __read_work_batch(self, put_codes):
+        '''
+        Helper function for work_details()
+        return  : the list of works of one bulk request
+        '''
+        return self._bulk_works(
+            self.__read_section(f"works/{','.join(put_codes)}"))
+
+    @staticmethod
+    def _work_put_codes(data):
+        '''
+        Helper function for work_details(), shared with AsyncOrcid
+        return  : the put-codes of every work summary of a /works payload
+        '''
+        return [summary.get('put-code')
+                for summary in iter_group_items(data, 'work-summary')]
+
+    @staticmethod
+    def _work_batches(put_codes, batch_size):
+        '''
+        Helper function for work_details(), shared with AsyncOrcid
+        return  : the distinct put-codes split into lists of batch_size
+        raises  : ValueError if batch_size exceeds MAX_BULK_WORKS
+        '''
+        if not 1 <= batch_size <= MAX_BULK_WORKS:
+            raise ValueError(
+                f"batch_size must be between 1 and {MAX_BULK_WORKS}.")
+        put_codes = [str(code) for code in dict.fromkeys(put_codes)
+                     if code is not None]
+        return [put_codes[i:i + batch_size]
+                for i in range(0, len(put_codes), batch_size)]
+
+    def _bulk_works(self, data):
+        '''
+        Helper function for work_details(), shared with AsyncOrcid
+        return  : the works of a bulk response, logging the put-codes
+        ORCID reported an error for
+        '''
+        works = []
+        for item in (data or {}).get('bulk', []):
+            if 'work' in item:
+                works.append(item['work'])
+            else:
+                message = self.__get_value_from_keys(
+                    item, ["error", "developer-message"])
+                logger.warning(f"Failed to retrieve work: {message}")
+        return works
+
+    def stream_works(self, section="works", raw=False, backend="auto"):
+        '''
+        Streaming version of works(): the response is parsed incrementally
+        as it arrives and each work is extracted as soon as its summary is
+        complete, so memory stays proportional to a single work
+        section : "works", or "activities" / "record" to read the works
+                  embedded in those sections
+        raw     : if True, yield the work-summary objects unextracted
+        backend : JSON scanner, "python", "ijson" or "auto" (ijson when
+                  installed)
+        return  : an iterator over the dictionaries listed by works(),
+        empty if the section cannot be read
+        raises  : requests.RequestException if the connection fails while
+        the section is streamed
+        '''
+        summaries = _unless_unavailable(iter_work_summaries(
+            self.__stream_section(section), section, backend))
+        if raw:
+            return summaries
+        return map(WORK_SCHEMA.extract, summaries)
+
+    def stream_fundings(self, section="fundings", raw=False,
+                        backend="auto"):
+        '''
+        Streaming version of fundings(), see stream_works()
+        section : "fundings", or "activities" / "record"
+        return  : an iterator over the dictionaries listed by fundings()
+        '''
+        summaries = _unless_unavailable(iter_funding_summaries(
+            self.__stream_section(section), section, backend))
+        if raw:
+            return summaries
+        return map(FUNDING_SCHEMA.extract, summaries)
+
+    def works_table(self, data=None, arrow=False):
+        '''
+        Columnar version of works(): one list per column instead of one
+        dict per work, with the publication date split into integer
+        publication-year and publication-month columns
+        data    : pre-fetched /works payload, read from ORCID if None
+        arrow   : if True, return a typed pyarrow.Table (requires pyarrow)
+        return  : a dictionary mapping column names to lists of values,
+        or a pyarrow.Table
+        '''
+        if data is None:
+            data = self.__read_section("works")
+        return self.__section_table("works", data, arrow)
+
+    def fundings_table(self, data=None, arrow=False):
+        '''
+        Columnar version of fundings(), with integer start/end year and
+        month columns
+        data    : pre-fetched /fundings payload, read from ORCID if None
+        arrow   : if True, return a typed pyarrow.Table (requires pyarrow)
+        return  : a dictionary mapping column names to lists of values,
+        or a pyarrow.Table
+        '''
+        if data is None:
+            data = self.__read_section("fundings")
+        return self.__section_table("fundings", data, arrow)
+
+    def affiliations_table(self, section="employments", data=None,
+                           arrow=False):
+        '''
+        Columnar version of the affiliation accessors (educations(),
+        employments(), services(), ...), with integer start/end year and
+        month columns
+        section : the affiliation section, e.g. "educations" or
+                  "invited-positions"
+        data    : pre-fetched section payload, read from ORCID if None
+        arrow   : if True, return a typed pyarrow.Table (requires pyarrow)
+        return  : a dictionary mapping column names to lists of values,
+        or a pyarrow.Table
+        '''
+        self.__check_affiliation_section(section)
+        if data is None:
+            data = self.__read_section(section)
+        return self.__section_table(section, data, arrow)
+
+    def __check_affiliation_section(self, section):
+        '''
+        Helper function for the affiliation_*() accessors
+        raises  : ValueError if section is not an affiliation section
+        '''
+        if section not in AFFILIATION_SECTIONS:
+            raise ValueError(
+                f"'{section}' is not an affiliation section. Use one of "
+                f"{', '.join(AFFILIATION_SECTIONS)}.")
+
+    def __read_records(self, section):
+        '''
+        Helper function for the *_summaries() accessors: reads a section
+        and decodes it straight into records (see orcid_json.decode_records)
+        return  : a list of records, empty if the section cannot be read
+        '''
+        if self._store is not None:
+            return section_records(section, self.__read_section(section))
+        records = self.__read_section(
+            section, decode=partial(response_records, section))
+        return records or []
+
+    def __section_table(self, section, data, arrow):
+        '''
+        Helper function for the *_table() accessors
+        '''
+        columns = section_columns(section, data)
+        if arrow:
+            return to_arrow(section, columns)
+        return columns
+
     def get_formatted_date(self, date_dict):
         """
         Formats a date dictionary into a string (e.g., "MM/YYYY") if all
@@ -493,43 +918,7 @@ class Orcid:
             str: The formatted date string or an empty string if any
             required key is missing or None.
         """
-        if date_dict is not None:
-            year = self.__get_value_from_keys(date_dict, ["year", "value"])
-            month = self.__get_value_from_keys(
-                date_dict, ["month", "value"])
-
-            # Check if all required keys are present and not None
-            if year is not None and month is not None:
-                return f"{month}/{year}"
-            elif year is not None:
-                return year
-            else:
-                return ''
-        else:
-            return ''
-
-    def __are_keys_accessible(self, json_obj, keys):
-        """
-        Check if all keys are accessible cumulatively in the JSON-like
-        object.
-
-        Args:
-        json_obj (dict): The JSON-like object (dictionary).
-        keys (list): List of keys to check for accessibility.
-
-        Returns:
-        bool: True if all keys are accessible cumulatively,
-        False otherwise.
-        """
-        current_obj = json_obj
-
-        for key in keys:
-            if isinstance(current_obj, dict) and key in current_obj:
-                current_obj = current_obj[key]
-            else:
-                return False
-
-        return True
+        return format_date(date_dict)
 
     def __get_value_from_keys(self, json_obj, keys):
         """
@@ -545,84 +934,40 @@ class Orcid:
         Any: The value associated with the last key if all keys are
         accessible cumulatively, or None if not accessible.
         """
-        if self.__are_keys_accessible(json_obj, keys):
-            current_obj = json_obj
-            for key in keys:
-                current_obj = current_obj[key]
-            if isinstance(current_obj, str):
-                current_obj = self.__deunicode_string(current_obj)
-            return current_obj
-        else:
-            return None
+        return get_path(json_obj, keys)
 
     def __extract_details(self, data, key):
         '''
         Helper function for record_summary()
         '''
-        details = []
-
-        # Extract the 'affiliation-group' from the data
-        affiliation_group = data.get('affiliation-group', [])
-
-        for group in affiliation_group:
-            summaries = group.get('summaries', [])
-
-            for summary in summaries:
-                key_summary = summary.get(f'{key}-summary', {})
-                department = self.__get_value_from_keys(
-                    key_summary, ["department-name"])
-                role = self.__get_value_from_keys(
-                    key_summary, ["role-title"])
-                start_date = self.get_formatted_date(
-                    key_summary.get('start-date', {}))
-                end_date = self.get_formatted_date(
-                    key_summary.get('end-date', {}))
-                organization = self.__get_value_from_keys(
-                    key_summary, ["organization", "name"])
-
-                # Extract the organization address components into a string
-                organization_address = self.__org_string_from_obj(
-                    self.__get_value_from_keys(
-                        key_summary, ["organization", "address"]))
-
-                url = self.__get_value_from_keys(
-                    key_summary, ["url", "value"])
-                detail = {
-                    'Department': department,
-                    'Role': role,
-                    'start-date': start_date,
-                    'end-date': end_date,
-                    'organization': organization,
-                    'organization-address': organization_address,
-                    'url': url,
-                }
-
-                details.append(detail)
-
-        return details
-
-    def __org_string_from_obj(self, org_obj):
+        return AFFILIATION_SCHEMA.extract_many(
+            iter_affiliation_items(data, key))
+
+    def __extract_fundings(self, data):
         '''
-        Helper function for record_summary()
+        Helper function for fundings() and record_summary()
         '''
-        org_string = ''
-        if not isinstance(org_obj, dict):
-            return org_string
-
-        # Build a string from organization components without unicode
-        org_parts = filter(None, org_obj.values())
-        if org_parts is not None:
-            org_string = ', '.join([
-                self.__deunicode_string(i) for i in org_parts])
+        return FUNDING_SCHEMA.extract_many(
+            iter_group_items(data, 'funding-summary'))
 
-        return org_string
+    def __extract_works(self, data):
+        '''
+        Helper function for works() and record_summary()
+        '''
+        return WORK_SCHEMA.extract_many(
+            iter_group_items(data, 'work-summary'))
 
-    def record_summary(self):
+    def record_summary(self, per_section=False, data=None):
         '''
         A cleaner version of Orcid record
+        per_section : if True, read every activity section through its
+                      own endpoint instead of the activities summary
+                      embedded in the /record response
+        data        : pre-fetched /record payload, read from ORCID if None
         return  : a dictionary of summary view of the full ORCID record
         '''
-        data = self.record()
+        if data is None:
+            data = self.__read_section("record")
         last_modified_value = self.__get_value_from_keys(
             data, ["history", "last-modified-date", "value"])
         extracted_data = {
@@ -648,55 +993,78 @@ class Orcid:
                     data, ["person", "keywords", "keyword"])],
         }
 
+        activities = self.__activities_summary(data, per_section)
+
         # Extract education details
-        education_details = self.educations()[0]
+        education_details = self.__extract_details(
+            activities.get('educations'), "education")
         if education_details:
             extracted_data['Education'] = education_details
 
-        # Extract education details
-        qualification_details = self.qualifications()[0]
+        # Extract qualification details
+        qualification_details = self.__extract_details(
+            activities.get('qualifications'), "qualification")
         if qualification_details:
             extracted_data['Quaifications'] = qualification_details
 
         # Extract employment details
-        employment_details = self.employments()[0]
+        employment_details = self.__extract_details(
+            activities.get('employments'), "employment")
         if employment_details:
             extracted_data['Employment'] = employment_details
 
-        # Extract education details
-        distinction_details = self.distinctions()[0]
+        # Extract distinction details
+        distinction_details = self.__extract_details(
+            activities.get('distinctions'), "distinction")
         if distinction_details:
             extracted_data['Distinctions'] = distinction_details
 
-        # Extract employment details
-        invited_details = self.invited_positions()[0]
+        # Extract invited position details
+        invited_details = self.__extract_details(
+            activities.get('invited-positions'), "invited-position")
         if invited_details:
             extracted_data['Invited Positions'] = invited_details
 
-        # Extract education details
-        membership_details = self.memberships()[0]
+        # Extract membership details
+        membership_details = self.__extract_details(
+            activities.get('memberships'), "membership")
         if membership_details:
             extracted_data['Memberships'] = membership_details
 
         # Extract service details
-        service_details = self.services()[0]
+        service_details = self.__extract_details(
+            activities.get('services'), "service")
         if service_details:
             extracted_data['Service'] = service_details
 
         # Extract funding details with start and end dates
-        extracted_data['Fundings'] = self.fundings()[0]
-        extracted_data['Works'] = self.works()[0]
+        extracted_data['Fundings'] = self.__extract_fundings(
+            activities.get('fundings'))
+        extracted_data['Works'] = self.__extract_works(
+            activities.get('works'))
 
         return extracted_data
 
-    def generate_markdown_file(self, output_file=None):
+    def __activities_summary(self, data, per_section=False):
+        '''
+        Helper function for record_summary()
+        return  : a dictionary mapping activity section names (e.g.
+        "works", "invited-positions") to their payloads
+        '''
+        if per_section:
+            return self.fetch_sections(self.ACTIVITY_SECTIONS)
+
+        return (data or {}).get('activities-summary') or {}
+
+    def generate_markdown_file(self, output_file=None, summary=None):
         '''
         Generates a markdown file with the ORCID record summary
         output_file  : the name of the output file
+        summary      : pre-computed record_summary(), built if None
         return  : None
         '''
 
-        data = self.record_summary()
+        data = summary if summary is not None else self.record_summary()
         if 'Name' in data:
             file_name = f"{data['Name']}.md"
         else:
@@ -707,31 +1075,7 @@ class Orcid:
             file_name = output_file
 
         with open(file_name, 'w', encoding='utf-8') as md_file:
-            for section, content in data.items():
-                md_file.write(f"## {section}\n\n")
-
-                if isinstance(content, list):
-                    if content:
-                        if isinstance(content[0], dict):
-                            keys = content[0].keys()
-                            md_file.write("| " + " | ".join(keys) + " |\n")
-                            md_file.write(
-                                "| " + " | ".join(["---"] * len(keys)) +
-                                " |\n")
-                            for item in content:
-                                md_file.write(
-                                    "| " + " | ".join(
-                                        str(item[key]) for key in keys) +
-                                    " |\n")
-                        else:
-                            for item in content:
-                                md_file.write(f"- {item}\n")
-                    else:
-                        md_file.write("No data available.\n")
-                else:
-                    md_file.write(f"{content}\n")
-
-                md_file.write("\n")
+            md_file.writelines(MARKDOWN_TEMPLATE.render(data))
 
     # THESE FUNCTIONS ARE FOR TESTING PURPOSES
     def __test_is_access_token_valid(self):
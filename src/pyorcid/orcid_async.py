@@ -0,0 +1,877 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import csv
+import io
+import logging
+import time
+import weakref
+from typing import Any, AsyncIterator, Iterable, Mapping, MutableSequence
+
+from .orcid import MAX_BULK_WORKS, Orcid
+from .orcid_columnar import AFFILIATION_SECTIONS
+from .orcid_json import response_json
+from .orcid_metrics import MetricsHook, RequestEvent, emit, timed_decode
+from .orcid_scrapper import OrcidScrapper
+from .orcid_search import (
+    DEFAULT_CSV_COLUMNS,
+    MAX_SEARCH_ROWS,
+    MAX_SEARCH_START,
+    OrcidSearch,
+    _csv_rows,
+    _csv_targets,
+    _result_key,
+)
+from .orcid_singleflight import AsyncSingleFlight, flight_key
+from .orcid_throttle import RateLimiter, RetryPolicy
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# One AsyncClient (and therefore one connection pool) per event loop, shared
+# by every async client instance that was not given its own client
+_shared_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Connection limits of the shared pool. Requests beyond max_connections
+# wait for a free connection instead of failing, so a single loop can have
+# thousands of reads in flight.
+POOL_LIMITS = {"max_connections": 100, "max_keepalive_connections": 50}
+
+
+def shared_async_client() -> httpx.AsyncClient:
+    """Return the AsyncClient shared by async clients on the running loop.
+
+    Returns:
+        The shared httpx.AsyncClient, created on first use
+
+    Raises:
+        ImportError: If httpx is not installed
+        RuntimeError: If called outside a running event loop
+    """
+    _require_httpx()
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(**POOL_LIMITS),
+            timeout=httpx.Timeout(30, pool=None),
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared AsyncClient of the running loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "The async clients require httpx. Install it with "
+            "`pip install PyOrcid[async]`."
+        )
+
+
+class _NoTransport:
+    '''
+    Stands in for the OrcidTransport of the async clients, which send their
+    requests with httpx: a synchronous code path reaching for the transport
+    fails with an error naming the client instead of blocking the loop
+    '''
+    __slots__ = ("_client",)
+
+    def __init__(self, client: str) -> None:
+        self._client = client
+
+    def __getattr__(self, name):
+        raise TypeError(
+            f"{self._client} sends its requests with httpx and has no "
+            f"synchronous transport; use its awaitable methods"
+        )
+
+
+async def _send(client, url, rate_limiter=None, retry=None, hooks=(),
+                section="", singleflight=None, stream=False, **kwargs):
+    '''
+    Sends a GET request on ``client`` (or the shared client), waiting for
+    the rate limiter and retrying according to the retry policy
+    hooks        : metrics hooks the RequestEvent of the request is
+                   emitted to
+    section      : ORCID section name reported in the RequestEvent
+    singleflight : AsyncSingleFlight coalescing the request with an
+                   identical one in flight
+    stream       : return before reading the body, which the caller
+                   reads and closes; never coalesced
+    return  : the httpx response, shared with the coalesced callers
+    '''
+    client = client or shared_async_client()
+    event = None
+    if hooks:
+        event = RequestEvent("GET", url, section, client="async",
+                             streamed=stream)
+
+    async def send():
+        if event is not None:
+            return await _timed_attempt(client, url, event, kwargs, stream)
+        if stream:
+            return await client.send(
+                client.build_request("GET", url, **kwargs), stream=True)
+        return await client.get(url, **kwargs)
+
+    async def call():
+        if retry is not None:
+            return await retry.acall(
+                send, rate_limiter, exceptions=(httpx.TransportError,))
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        return await send()
+
+    start = time.perf_counter()
+    try:
+        if singleflight is None or stream:
+            response = await call()
+        else:
+            response, shared = await singleflight.do(
+                flight_key(url, kwargs.get("headers")), call)
+            if shared and event is not None:
+                event.cache = "coalesced"
+        if event is not None:
+            event.status_code = response.status_code
+        return response
+    except Exception as e:
+        if event is not None:
+            event.error = type(e).__name__
+        raise
+    finally:
+        if event is not None:
+            event.elapsed = time.perf_counter() - start
+            emit(hooks, "on_request", event)
+
+
+def _span(marks, step):
+    '''
+    return  : the duration of a traced httpcore step, 0 if it did not run
+    '''
+    started = marks.get(f"{step}.started")
+    complete = marks.get(f"{step}.complete")
+    if started is None or complete is None:
+        return 0.0
+    return complete - started
+
+
+async def _timed_attempt(client, url, event, kwargs, stream=False):
+    '''
+    Sends one attempt of an instrumented request, splitting its time with
+    the httpcore "trace" extension. Transports that do not trace (e.g.
+    httpx.MockTransport) only report the elapsed time.
+    return  : the httpx response
+    '''
+    marks = {}
+
+    async def trace(name, info):
+        # "connection.connect_tcp.started" -> "connect_tcp.started"
+        marks[name.split(".", 1)[-1]] = time.perf_counter()
+
+    event.attempts += 1
+    start = time.perf_counter()
+    request = client.build_request(
+        "GET", url, extensions={"trace": trace}, **kwargs)
+    response = await client.send(request, stream=stream)
+    end = time.perf_counter()
+
+    headers = marks.get("receive_response_headers.complete")
+    if headers is not None:
+        event.connect = _span(marks, "connect_tcp") + _span(marks, "start_tls")
+        event.ttfb = headers - marks.get("send_request_headers.started", start)
+        if not stream:
+            event.download = end - headers
+    if not stream:
+        event.bytes_received = ((event.bytes_received or 0)
+                                + len(response.content))
+    return response
+
+
+async def _aiter_text_lines(response):
+    '''
+    Asyncio version of orcid_search._iter_text_lines()
+    return  : an async generator of text lines
+    '''
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    async for chunk in response.aiter_bytes():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def _acsv_rows(lines, columns, as_tuples=False):
+    '''
+    Asyncio version of orcid_search._csv_rows(). Lines are gathered into
+    records, a record being complete once its quotes are balanced (no
+    quoted field left open), and each record is parsed on its own.
+    return  : an async generator of row dicts (or tuples)
+    '''
+    names = [name.strip() for name in columns.split(",")]
+    header = True
+    async for record in _acsv_records(lines):
+        for fields in csv.reader(record):
+            if header:
+                header = False
+            elif not fields:
+                continue
+            elif as_tuples:
+                yield tuple(fields)
+            else:
+                yield dict(zip(names, fields))
+
+
+async def _acsv_records(lines):
+    '''
+    Helper function for _acsv_rows()
+    return  : an async generator of the lines of each csv record
+    '''
+    record, quotes = [], 0
+    async for line in lines:
+        record.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield record
+            record, quotes = [], 0
+    if record:
+        yield record
+
+
+def _async_accessor(name: str, section: str):
+    '''
+    Builds an awaitable version of the Orcid accessor ``name`` that reads
+    ``section`` asynchronously and hands the payload to the synchronous
+    extraction code
+    '''
+    sync_accessor = getattr(Orcid, name)
+
+    async def accessor(self, data=None, **kwargs):
+        if data is None:
+            data = await self._read_section(section)
+        return sync_accessor(self, data, **kwargs)
+
+    accessor.__name__ = name
+    accessor.__qualname__ = f"AsyncOrcid.{name}"
+    accessor.__doc__ = sync_accessor.__doc__
+    return accessor
+
+
+class AsyncOrcid(Orcid):
+    '''
+    Asyncio version of the Orcid class. Every section accessor is awaitable
+    and returns the same result as its Orcid counterpart.
+    '''
+    def __init__(
+        self,
+        orcid_id: str,
+        orcid_access_token: str = " ",
+        state: str = "public",
+        sandbox: bool = False,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        hooks: Iterable[MetricsHook] | None = None,
+        singleflight: AsyncSingleFlight | None = None
+    ) -> None:
+        """Initialize async orcid instance.
+
+        As with Orcid, the access token is validated lazily from the first
+        response, sharing the outcome with every client of the process.
+
+        Args:
+            orcid_id: ORCID ID of the user
+            orcid_access_token: ORCID access token obtained from the user
+            state: Whether to use "public" or "member" API of ORCID
+            sandbox: Whether to use ORCID sandbox API for testing
+            client: AsyncClient to send requests with (defaults to the
+                pool shared by all async clients on the running loop)
+            rate_limiter: Rate limiter every request waits for, e.g. one
+                shared by many instances (no limit if None)
+            retry: Retry policy for throttled or failed requests
+                (a single attempt if None)
+            hooks: Metrics hooks receiving a RequestEvent for every
+                request and a DecodeEvent for every decoded body
+            singleflight: Group coalescing identical reads in flight on
+                the loop, e.g. one shared by many clients (no coalescing
+                if None)
+        """
+        _require_httpx()
+        # Orcid explicitly: in AsyncOrcidScrapper the next class in the MRO
+        # is OrcidScrapper, whose constructor takes no token
+        Orcid.__init__(self, orcid_id, orcid_access_token, state, sandbox)
+        self._client = client
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._hooks = list(hooks or ())
+        self._singleflight = singleflight
+
+    def _make_transport(self) -> _NoTransport:
+        return _NoTransport(type(self).__name__)
+
+    def stream_works(self, section="works", raw=False, backend="auto"):
+        '''
+        Not available on the async clients: the streaming JSON scanners
+        read their input synchronously. Use ``await works()`` instead.
+        raises  : NotImplementedError
+        '''
+        self.__no_streaming("stream_works", "works")
+
+    def stream_fundings(self, section="fundings", raw=False,
+                        backend="auto"):
+        '''
+        Not available on the async clients, see stream_works()
+        raises  : NotImplementedError
+        '''
+        self.__no_streaming("stream_fundings", "fundings")
+
+    def __no_streaming(self, name, accessor):
+        raise NotImplementedError(
+            f"{type(self).__name__}.{name}() is not available: sections "
+            f"cannot be streamed asynchronously. Use "
+            f"`await {accessor}()` instead."
+        )
+
+    async def _read_section(
+        self,
+        section: str = "record",
+        strict: bool = False
+    ) -> dict[str, Any]:
+        """Read a section of an ORCID profile asynchronously.
+
+        Args:
+            section: The ORCID API section to read (default: "record")
+            strict: Raise the error of a failed request instead of
+                returning {}
+
+        Returns:
+            Dictionary containing the section data, or {} if request fails
+
+        Raises:
+            ValueError: If the access token is invalid, or (strict) the
+                response cannot be decoded
+            httpx.HTTPStatusError: If authentication fails after the token
+                was validated
+            httpx.HTTPError: If the request fails (strict)
+        """
+        self._check_access_token(section=section)
+        headers = {
+            'Authorization': f'Bearer {self._orcid_access_token}',
+            'Accept': 'application/json'
+        }
+        api_url = self._Orcid__get_api_url(section)
+
+        try:
+            response = await _send(
+                self._client, api_url, self._rate_limiter, self._retry,
+                self._hooks, section, self._singleflight, headers=headers)
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            if strict:
+                raise
+            return {}
+        self._check_access_token(response.status_code, section)
+
+        try:
+            response.raise_for_status()
+            return timed_decode(self._hooks, section, response, response_json)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                logger.error(
+                    f"Authentication failed for ORCID section '{section}': "
+                    f"{e.response.status_code} {e.response.text}"
+                )
+                raise
+            logger.warning(
+                f"Failed to retrieve ORCID section '{section}': "
+                f"{e.response.status_code} {e.response.text}"
+            )
+            if strict:
+                raise
+            return {}
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            if strict:
+                raise
+            return {}
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            if strict:
+                raise
+            return {}
+
+    async def fetch_sections(
+        self,
+        sections: Iterable[str],
+        max_workers: int | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Read several sections of the profile concurrently.
+
+        Args:
+            sections: ORCID API section names, e.g. ["works", "fundings"]
+            max_workers: Maximum number of sections read at the same time
+                (defaults to all of them)
+
+        Returns:
+            Dictionary mapping each section name to its parsed payload;
+            a section whose request failed maps to {}
+
+        Raises:
+            ValueError: If the access token is invalid
+            httpx.HTTPStatusError: If authentication fails after the token
+                was validated
+        """
+        sections = list(dict.fromkeys(sections))
+        semaphore = asyncio.Semaphore(max_workers or len(sections) or 1)
+
+        async def read(section):
+            async with semaphore:
+                return await self._read_section(section)
+
+        results = await asyncio.gather(
+            *(read(section) for section in sections),
+            return_exceptions=True,
+        )
+
+        payloads = {}
+        for section, result in zip(sections, results):
+            if isinstance(result, BaseException):
+                # Only 401/403 reach here as HTTPStatusError
+                if (isinstance(result, httpx.HTTPStatusError) or
+                        not isinstance(result, httpx.HTTPError)):
+                    raise result
+                logger.error(
+                    f"Failed to retrieve ORCID section '{section}': {result}")
+                result = {}
+            payloads[section] = result
+        return payloads
+
+    async def work_details(self, put_codes=None, batch_size=MAX_BULK_WORKS,
+                           max_workers=None):
+        '''
+        Full metadata of works through the bulk works endpoint, see
+        Orcid.work_details()
+        max_workers : number of batches read at the same time (defaults to
+                      all of them)
+        return  : an async generator of work dictionaries, in completion
+        order
+        '''
+        if put_codes is None:
+            put_codes = self._work_put_codes(await self._read_section("works"))
+        batches = self._work_batches(put_codes, batch_size)
+        semaphore = asyncio.Semaphore(max_workers or len(batches) or 1)
+
+        async def read(batch):
+            async with semaphore:
+                return await self._read_section(f"works/{','.join(batch)}")
+
+        tasks = [asyncio.ensure_future(read(batch)) for batch in batches]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for work in self._bulk_works(await task):
+                    yield work
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    record = _async_accessor("record", "record")
+    person = _async_accessor("person", "person")
+    address = _async_accessor("address", "address")
+    email = _async_accessor("email", "email")
+    external_identifiers = _async_accessor(
+        "external_identifiers", "external-identifiers")
+    keywords = _async_accessor("keywords", "keywords")
+    other_names = _async_accessor("other_names", "other-names")
+    personal_details = _async_accessor(
+        "personal_details", "personal-details")
+    researcher_urls = _async_accessor("researcher_urls", "researcher-urls")
+    activities = _async_accessor("activities", "activities")
+    educations = _async_accessor("educations", "educations")
+    employments = _async_accessor("employments", "employments")
+    fundings = _async_accessor("fundings", "fundings")
+    peer_reviews = _async_accessor("peer_reviews", "peer-reviews")
+    works = _async_accessor("works", "works")
+    research_resources = _async_accessor(
+        "research_resources", "research-resources")
+    services = _async_accessor("services", "services")
+    qualifications = _async_accessor("qualifications", "qualifications")
+    memberships = _async_accessor("memberships", "memberships")
+    distinctions = _async_accessor("distinctions", "distinctions")
+    invited_positions = _async_accessor(
+        "invited_positions", "invited-positions")
+    work_summaries = _async_accessor("work_summaries", "works")
+    funding_summaries = _async_accessor("funding_summaries", "fundings")
+    works_table = _async_accessor("works_table", "works")
+    fundings_table = _async_accessor("fundings_table", "fundings")
+
+    async def affiliations_table(self, section="employments", data=None,
+                                 arrow=False):
+        '''
+        Columnar version of the affiliation accessors, see
+        Orcid.affiliations_table()
+        '''
+        if data is None and section in AFFILIATION_SECTIONS:
+            data = await self._read_section(section)
+        return Orcid.affiliations_table(self, section, data, arrow)
+
+    async def affiliation_summaries(self, section="employments", data=None):
+        '''
+        Typed version of the affiliation accessors, see
+        Orcid.affiliation_summaries()
+        '''
+        if data is None and section in AFFILIATION_SECTIONS:
+            data = await self._read_section(section)
+        return Orcid.affiliation_summaries(self, section, data)
+
+    async def record_summary(self, per_section=False, data=None):
+        '''
+        A cleaner version of Orcid record
+        per_section : if True, read every activity section through its
+                      own endpoint (concurrently) instead of the activities
+                      summary embedded in the /record response
+        data        : pre-fetched /record payload, read from ORCID if None
+        return  : a dictionary of summary view of the full ORCID record
+        '''
+        if data is None:
+            data = await self._read_section("record")
+        if per_section:
+            data = dict(data)
+            data['activities-summary'] = await self.fetch_sections(
+                self.ACTIVITY_SECTIONS)
+        return Orcid.record_summary(self, data=data)
+
+    async def generate_markdown_file(self, output_file=None, summary=None):
+        '''
+        Generates a markdown file with the ORCID record summary
+        output_file  : the name of the output file
+        summary      : pre-computed record_summary(), built if None
+        return  : None
+        '''
+        if summary is None:
+            summary = await self.record_summary()
+        Orcid.generate_markdown_file(self, output_file, summary=summary)
+
+
+class AsyncOrcidSearch(OrcidSearch):
+    '''
+    Asyncio version of the OrcidSearch class
+    '''
+    def __init__(
+        self,
+        orcid_access_token: str = " ",
+        state: str = "public",
+        sandbox: bool = False,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        hooks: Iterable[MetricsHook] | None = None,
+        singleflight: AsyncSingleFlight | None = None
+    ) -> None:
+        """Initialize async ORCID search instance.
+
+        Args:
+            orcid_access_token: ORCID access token
+            state: Whether to use "public" or "member" API of ORCID
+            sandbox: Whether to use ORCID sandbox API for testing
+            client: AsyncClient to send requests with (defaults to the
+                pool shared by all async clients on the running loop)
+            rate_limiter: Rate limiter every request waits for, e.g. one
+                shared with other clients (no limit if None)
+            retry: Retry policy for throttled or failed requests
+                (a single attempt if None)
+            hooks: Metrics hooks receiving a RequestEvent for every
+                request and a DecodeEvent for every decoded body
+            singleflight: Group coalescing identical reads in flight on
+                the loop, e.g. one shared by many clients (no coalescing
+                if None)
+        """
+        _require_httpx()
+        super().__init__(orcid_access_token, state, sandbox)
+        self._client = client
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._hooks = list(hooks or ())
+        self._singleflight = singleflight
+
+    def _make_transport(self) -> _NoTransport:
+        return _NoTransport(type(self).__name__)
+
+    async def search(
+        self,
+        query,
+        start=0,
+        rows=1000,
+        search_mode="expanded-search",
+        columns=DEFAULT_CSV_COLUMNS,
+        strict=False
+    ):
+        '''
+        Search orcid records, see OrcidSearch.search() for the arguments
+        return      : a dictionary of search results
+        '''
+        api_url, headers = self._search_request(
+            query, start, rows, search_mode, columns)
+
+        try:
+            response = await _send(
+                self._client, api_url, self._rate_limiter, self._retry,
+                self._hooks, "search", self._singleflight, headers=headers)
+        except httpx.HTTPError as e:
+            logger.error(f"Search request failed: {e}")
+            if strict:
+                raise
+            return None
+        self._check_access_token(response.status_code)
+
+        try:
+            response.raise_for_status()
+            if search_mode == "csv-search":
+                return list(_csv_rows(io.StringIO(response.text), columns))
+            return timed_decode(
+                self._hooks, "search", response, response_json)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                logger.error(
+                    f"Authentication failed for ORCID search: "
+                    f"{e.response.status_code} {e.response.text}"
+                )
+                raise
+            logger.warning(
+                f"Failed to retrieve ORCID search results: "
+                f"{e.response.status_code} {e.response.text}"
+            )
+            if strict:
+                raise
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"Search request failed: {e}")
+            if strict:
+                raise
+            return None
+        except ValueError as e:
+            logger.error(f"Failed to parse search response: {e}")
+            if strict:
+                raise
+            return None
+
+    async def iter_search(
+        self,
+        query: str,
+        page_size: int = MAX_SEARCH_ROWS,
+        max_results: int | None = None,
+        search_mode: str = "expanded-search"
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate lazily over every result row of a search.
+
+        Asyncio version of OrcidSearch.iter_search(), used with
+        ``async for``: the next page is fetched in its own task while the
+        caller consumes the current one.
+
+        Raises:
+            ValueError: If search_mode is not a JSON search mode, or a
+                page cannot be decoded
+            httpx.HTTPError: If a page cannot be read
+        """
+        result_key = _result_key(search_mode)
+        page_size = max(1, min(page_size, MAX_SEARCH_ROWS))
+        limit = None
+
+        start = 0
+        task = asyncio.ensure_future(self.search(
+            query, start, page_size, search_mode, strict=True))
+        try:
+            while task is not None:
+                page = await task
+                task = None
+                if not page:
+                    return
+                if limit is None:
+                    limit = self._reachable_results(
+                        page.get("num-found") or 0, max_results)
+
+                rows = page.get(result_key) or []
+                next_start = start + page_size
+                if (rows and next_start < limit
+                        and next_start <= MAX_SEARCH_START):
+                    # Prefetch the next page before yielding this one
+                    task = asyncio.ensure_future(self.search(
+                        query, next_start, min(page_size, limit - next_start),
+                        search_mode, strict=True))
+
+                for row in rows[:max(0, limit - start)]:
+                    yield row
+                start = next_start
+        finally:
+            # The caller stopped early: drop the prefetched page
+            if task is not None:
+                task.cancel()
+
+    async def iter_csv_search(
+        self,
+        query: str,
+        columns: str = DEFAULT_CSV_COLUMNS,
+        start: int = 0,
+        page_size: int = MAX_SEARCH_ROWS,
+        max_results: int | None = None,
+        as_tuples: bool = False
+    ) -> AsyncIterator[dict[str, str] | tuple[str, ...]]:
+        """Stream the rows of a csv-search.
+
+        Asyncio version of OrcidSearch.iter_csv_search(), used with
+        ``async for``: each page is streamed through httpx and parsed row
+        by row.
+        """
+        page_size = max(1, min(page_size, MAX_SEARCH_ROWS))
+        yielded = 0
+
+        while True:
+            rows = page_size
+            if max_results is not None:
+                rows = min(rows, max_results - yielded)
+            if rows <= 0:
+                return
+            if start > MAX_SEARCH_START:
+                logger.warning(
+                    f"Stopping csv-search at the deep-paging limit "
+                    f"(start={start}).")
+                return
+
+            count = 0
+            async for row in self.__stream_csv_page(
+                    query, start, rows, columns, as_tuples):
+                yield row
+                count += 1
+
+            yielded += count
+            if count < rows:
+                return
+            start += rows
+
+    async def csv_search_into(
+        self,
+        query: str,
+        out: Mapping[str, MutableSequence[Any]],
+        columns: str = DEFAULT_CSV_COLUMNS,
+        start: int = 0
+    ) -> int:
+        """Fill preallocated column arrays from a streamed csv-search.
+
+        Asyncio version of OrcidSearch.csv_search_into().
+        """
+        targets, capacity = _csv_targets(out, columns)
+        count = 0
+        async for row in self.iter_csv_search(
+                query, columns, start, max_results=capacity, as_tuples=True):
+            for index, array in targets:
+                array[count] = row[index]
+            count += 1
+        return count
+
+    async def __stream_csv_page(self, query, start, rows, columns,
+                                as_tuples=False):
+        '''
+        Streams one page of csv-search results
+        return  : an async generator of row dicts (or tuples)
+        '''
+        api_url, headers = self._search_request(
+            query, start, rows, "csv-search", columns)
+
+        try:
+            response = await _send(
+                self._client, api_url, self._rate_limiter, self._retry,
+                self._hooks, "search", stream=True, headers=headers)
+        except httpx.HTTPError as e:
+            logger.error(f"Search request failed: {e}")
+            return
+
+        try:
+            try:
+                self._check_access_token(response.status_code)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code in (401, 403):
+                    logger.error(
+                        f"Authentication failed for ORCID csv-search: "
+                        f"{e.response.status_code}"
+                    )
+                    raise
+                logger.warning(
+                    f"Failed to retrieve ORCID csv-search results: "
+                    f"{e.response.status_code}"
+                )
+                return
+            async for row in _acsv_rows(
+                    _aiter_text_lines(response), columns, as_tuples):
+                yield row
+        finally:
+            await response.aclose()
+
+
+class AsyncOrcidScrapper(AsyncOrcid, OrcidScrapper):
+    '''
+    Asyncio version of the OrcidScrapper class
+    '''
+    def __init__(
+        self,
+        orcid_id: str,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        hooks: Iterable[MetricsHook] | None = None,
+        singleflight: AsyncSingleFlight | None = None
+    ) -> None:
+        """Initialize the AsyncOrcidScrapper class.
+
+        Args:
+            orcid_id: ORCID ID of the user
+            client: AsyncClient to send requests with (defaults to the
+                pool shared by all async clients on the running loop)
+            rate_limiter: Rate limiter every request waits for, e.g. one
+                shared with other clients (no limit if None)
+            retry: Retry policy for throttled or failed requests
+                (a single attempt if None)
+            hooks: Metrics hooks receiving a RequestEvent for every
+                request and a DecodeEvent for every decoded body
+            singleflight: Group coalescing identical reads in flight on
+                the loop, e.g. one shared by many clients (no coalescing
+                if None)
+        """
+        AsyncOrcid.__init__(
+            self, orcid_id, client=client, rate_limiter=rate_limiter,
+            retry=retry, hooks=hooks, singleflight=singleflight)
+
+    async def scrape_section(self, section="record"):
+        '''
+        Reads the section of a Orcid member Profile from its public XML
+        return  : a dictionary of summary view of the section of
+        ORCID data
+        '''
+        url = f"https://pub.orcid.org/v3.0/{self._orcid_id}/{section}"
+
+        try:
+            response = await _send(
+                self._client, url, self._rate_limiter, self._retry,
+                self._hooks, section, self._singleflight)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch data from {url}: {e}")
+            raise
+
+        data = timed_decode(self._hooks, section, response,
+                            lambda response: self._parse_xml(response.content))
+        return next(iter(data.values()), {})
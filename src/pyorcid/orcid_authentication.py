@@ -5,6 +5,8 @@ from urllib.parse import urlencode
 
 import requests
 
+from .orcid_transport import OrcidTransport
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,8 @@ class OrcidAuthentication:
         client_id: str,
         client_secret: str,
         redirect_uri: str = "",
-        sandbox: bool = False
+        sandbox: bool = False,
+        transport: OrcidTransport | None = None
     ) -> None:
         """Initialize ORCID Authentication handler.
 
@@ -29,12 +32,16 @@ class OrcidAuthentication:
             client_secret: Client secret from registered ORCID application
             redirect_uri: Redirect URI from registered ORCID application
             sandbox: Whether to use ORCID sandbox API for testing
+            transport: Transport to send requests with, e.g. one shared
+                with other clients (a private transport is created if None)
         """
         self.__client_id = client_id
         self.__client_secret = client_secret
         self.__redirect_uri = redirect_uri
         self.__sandbox = sandbox
-        self._session = requests.Session()
+        if transport is None:
+            transport = OrcidTransport()
+        self._transport = transport
 
     def get_private_access_token(self):
         '''
@@ -77,7 +84,7 @@ class OrcidAuthentication:
             'redirect_uri': self.__redirect_uri
         }
 
-        response = requests.post(token_url, data=data)
+        response = self._transport.post(token_url, data=data)
         access_token = response.json().get('access_token')
         # set_key(".env", "ORCID_ACCESS_TOKEN", access_token)
         return access_token
@@ -104,7 +111,8 @@ class OrcidAuthentication:
         headers = {'Accept': 'application/json'}
 
         try:
-            response = requests.post(token_url, data=params, headers=headers)
+            response = self._transport.post(
+                token_url, data=params, headers=headers)
             # Raises an exception for HTTP errors
             response.raise_for_status()
 
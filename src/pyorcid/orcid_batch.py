@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator
+
+from .orcid import Orcid
+from .orcid_transport import OrcidTransport
+
+logger = logging.getLogger(__name__)
+
+
+class OrcidBatch:
+    '''
+    Reads the same sections of many ORCID records over one shared
+    connection pool, with a bounded number of records in flight
+    '''
+    def __init__(
+        self,
+        orcid_access_token: str = " ",
+        state: str = "public",
+        sandbox: bool = False,
+        sections: Iterable[str] = ("record",),
+        concurrency: int = 8,
+        transport: OrcidTransport | None = None
+    ) -> None:
+        """Initialize the batch reader.
+
+        Args:
+            orcid_access_token: ORCID access token used for every record
+            state: Whether to use "public" or "member" API of ORCID
+            sandbox: Whether to use ORCID sandbox API for testing
+            sections: ORCID API sections read for every record
+            concurrency: Maximum number of records read at the same time
+            transport: Transport shared by every read, e.g. one with a
+                RateLimiter and RetryPolicy (a private transport is
+                created if None); its pool is grown to the concurrency
+
+        Raises:
+            ValueError: If concurrency is lower than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self._orcid_access_token = orcid_access_token
+        self._state = state
+        self._sandbox = sandbox
+        self._sections = tuple(dict.fromkeys(sections))
+        self._concurrency = concurrency
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = OrcidTransport(pool_maxsize=concurrency)
+        transport.ensure_pool_size(concurrency)
+        self._transport = transport
+
+    def harvest(
+        self,
+        orcid_ids: Iterable[str]
+    ) -> Iterator[tuple[str, dict[str, Any] | Exception]]:
+        """Read the configured sections of every ORCID iD.
+
+        The iDs are consumed lazily and at most ``concurrency`` records are
+        in flight, so memory stays flat however many iDs are given.
+        Results are yielded in completion order, not input order.
+
+        Args:
+            orcid_ids: ORCID iDs to read, any iterable (e.g. a generator)
+
+        Yields:
+            Tuples of (orcid_id, result) where result maps every section
+            name to its payload, or is the exception that stopped the read
+        """
+        ids = iter(orcid_ids)
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            pending = {}
+            for orcid_id in ids:
+                pending[executor.submit(self._read, orcid_id)] = orcid_id
+                if len(pending) >= self._concurrency:
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    orcid_id = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to read ORCID record {orcid_id}: {e}")
+                        result = e
+
+                    # Refill the freed slot before handing the result out
+                    next_id = next(ids, None)
+                    if next_id is not None:
+                        pending[executor.submit(self._read, next_id)] = next_id
+
+                    yield orcid_id, result
+
+    def close(self) -> None:
+        """Close the connection pool, unless the transport was given by
+        the caller."""
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> OrcidBatch:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read(self, orcid_id: str) -> dict[str, Any]:
+        '''
+        Reads every configured section of one record on the shared session
+        return  : a dictionary mapping section names to their payloads
+        raises  : the error of the first section that could not be read
+        '''
+        orcid = Orcid(
+            orcid_id,
+            orcid_access_token=self._orcid_access_token,
+            state=self._state,
+            sandbox=self._sandbox,
+            transport=self._transport,
+        )
+        return {
+            section: orcid._read_section(section, strict=True)
+            for section in self._sections
+        }
+
+
+def harvest(
+    orcid_ids: Iterable[str],
+    sections: Iterable[str] = ("record",),
+    concurrency: int = 8,
+    orcid_access_token: str = " ",
+    state: str = "public",
+    sandbox: bool = False,
+    transport: OrcidTransport | None = None
+) -> Iterator[tuple[str, dict[str, Any] | Exception]]:
+    """Read the given sections of many ORCID records concurrently.
+
+    Shortcut for OrcidBatch(...).harvest(orcid_ids); see OrcidBatch for
+    the arguments.
+
+    Yields:
+        Tuples of (orcid_id, result) in completion order
+    """
+    with OrcidBatch(
+        orcid_access_token=orcid_access_token,
+        state=state,
+        sandbox=sandbox,
+        sections=sections,
+        concurrency=concurrency,
+        transport=transport,
+    ) as batch:
+        yield from batch.harvest(orcid_ids)
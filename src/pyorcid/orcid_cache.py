@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Mapping
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Request headers whose value changes the response, and therefore the key
+_VARY_HEADERS = ("Authorization", "Accept", "Content-Type")
+
+# Response headers kept alongside the cached body
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+_PUT_CODES = re.compile(r"^\d+(,\d+)*$")
+
+
+def normalize_section(section: str) -> str:
+    '''
+    Section name with its put-codes templated, so every bulk read of a
+    section shares one name: "works/1,2,3" -> "works/{put-codes}"
+    return  : the normalized section name
+    '''
+    if "/" not in section:
+        return section
+    return "/".join("{put-codes}" if _PUT_CODES.match(part) else part
+                    for part in section.split("/"))
+
+
+class CacheEntry:
+    '''
+    A cached response body together with its validators
+    '''
+    __slots__ = ("body", "headers", "stored_at")
+
+    def __init__(
+        self,
+        body: bytes,
+        headers: Mapping[str, str],
+        stored_at: float
+    ) -> None:
+        self.body = body
+        self.headers = dict(headers)
+        self.stored_at = stored_at
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("Last-Modified")
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+
+class MemoryCacheBackend:
+    '''
+    In-process LRU cache backend bounded by the total size of the cached
+    bodies
+    '''
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_bytes: Total body size after which the least recently used
+                entries are evicted
+        """
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    '''
+    On-disk cache backend storing responses in a SQLite database, so the
+    cache survives between runs
+    '''
+    def __init__(self, path: str = "pyorcid_cache.sqlite") -> None:
+        """Initialize the backend.
+
+        Args:
+            path: Path of the SQLite database file (":memory:" for a
+                throwaway database)
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, "
+                "headers TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, headers, stored_at FROM responses "
+                "WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, headers, stored_at = row
+        return CacheEntry(bytes(body), json.loads(headers), stored_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, headers, stored_at) VALUES (?, ?, ?, ?)",
+                (key, entry.body, json.dumps(entry.headers), entry.stored_at)
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class CacheStats:
+    '''
+    Thread-safe hit/miss/revalidation counters of a ResponseCache
+    '''
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+            }
+
+
+class ResponseCache:
+    '''
+    HTTP response cache for ORCID reads. Fresh entries are served without
+    a request; stale entries are revalidated with If-None-Match /
+    If-Modified-Since so an unchanged payload costs a 304 round trip.
+    '''
+    def __init__(
+        self,
+        backend: MemoryCacheBackend | SQLiteCacheBackend | None = None,
+        ttl: float = 0,
+        section_ttl: Mapping[str, float] | None = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to a MemoryCacheBackend)
+            ttl: Seconds an entry is served without revalidation; 0 means
+                every read is revalidated
+            section_ttl: Per-section overrides of ttl, e.g.
+                {"works": 3600, "search": 0}
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.section_ttl = dict(section_ttl or {})
+        self.stats = CacheStats()
+
+    def ttl_for(self, section: str) -> float:
+        """Return the freshness lifetime of a section in seconds.
+
+        Put-code reads such as "works/1,2,3" use the TTL of
+        "works/{put-codes}" if one is set, else that of their section
+        ("works").
+        """
+        section = normalize_section(section)
+        if section in self.section_ttl:
+            return self.section_ttl[section]
+        return self.section_ttl.get(section.split("/", 1)[0], self.ttl)
+
+    def get(
+        self,
+        send: Callable[..., requests.Response],
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        section: str = "",
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send a GET request through the cache.
+
+        Args:
+            send: Function sending the GET request when the server has to
+                be asked, called like requests.get (e.g. session.get)
+            url: Requested URL
+            headers: Request headers
+            section: ORCID section name, used to pick the TTL
+            **kwargs: Extra arguments for send (e.g. timeout)
+
+        Returns:
+            The server response, or a 200 response rebuilt from the cache
+            when the entry is fresh or the server answered 304
+        """
+        headers = dict(headers or {})
+        key = self.key(url, headers)
+        entry = self.backend.get(key)
+
+        if entry is not None:
+            if time.time() - entry.stored_at < self.ttl_for(section):
+                self.stats.increment("hits")
+                return self.__build_response(url, entry)
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = send(url, headers=headers, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            self.stats.increment("revalidations")
+            stored_headers = entry.headers
+            stored_headers.update(self.__validators(response))
+            entry = CacheEntry(entry.body, stored_headers, time.time())
+            self.backend.set(key, entry)
+            return self.__build_response(url, entry)
+
+        self.stats.increment("misses")
+        if response.status_code == 200:
+            self.backend.set(key, CacheEntry(
+                response.content, self.__validators(response), time.time()))
+        return response
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self.backend.clear()
+
+    @staticmethod
+    def key(url: str, headers: Mapping[str, str]) -> str:
+        """Return the cache key of a request."""
+        vary = "\n".join(str(headers.get(name, "")) for name in _VARY_HEADERS)
+        digest = hashlib.sha256(vary.encode("utf-8")).hexdigest()[:16]
+        return f"{url}#{digest}"
+
+    @staticmethod
+    def __validators(response: requests.Response) -> dict[str, str]:
+        return {
+            name: response.headers[name] for name in _STORED_HEADERS
+            if name in response.headers
+        }
+
+    @staticmethod
+    def __build_response(url: str, entry: CacheEntry) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.body
+        response.encoding = "utf-8"
+        return response
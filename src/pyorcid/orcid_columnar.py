@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterator
+
+from .orcid_extraction import (
+    Field,
+    Schema,
+    first_doi,
+    format_address,
+    iter_section_items,
+    to_int,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Activity sections made of affiliation groups (educations, employments...)
+AFFILIATION_SECTIONS = (
+    "educations",
+    "qualifications",
+    "employments",
+    "distinctions",
+    "invited-positions",
+    "memberships",
+    "services",
+)
+
+
+def _date_fields(prefix, path):
+    '''
+    Year and month columns of an ORCID fuzzy date
+    return  : a tuple of two fields
+    '''
+    return (
+        Field(f'{prefix}-year', path + ("year", "value"), to_int),
+        Field(f'{prefix}-month', path + ("month", "value"), to_int),
+    )
+
+
+_ORGANIZATION_COLUMNS = (
+    Field('organization', ("organization", "name")),
+    Field('organization-address', ("organization", "address"),
+          format_address),
+    Field('url', ("url", "value")),
+)
+
+WORK_COLUMNS = Schema((
+    Field('put-code', ("put-code",), to_int),
+    Field('title', ("title", "title", "value")),
+    Field('type', ("type",)),
+    *_date_fields('publication', ("publication-date",)),
+    Field('journal-title', ("journal-title", "value")),
+) + _ORGANIZATION_COLUMNS + (
+    Field('doi', ("external-ids", "external-id"), first_doi, deunicode=False),
+))
+
+FUNDING_COLUMNS = Schema((
+    Field('put-code', ("put-code",), to_int),
+    Field('title', ("title", "title", "value")),
+    Field('type', ("type",)),
+    *_date_fields('start', ("start-date",)),
+    *_date_fields('end', ("end-date",)),
+) + _ORGANIZATION_COLUMNS)
+
+AFFILIATION_COLUMNS = Schema((
+    Field('put-code', ("put-code",), to_int),
+    Field('department', ("department-name",)),
+    Field('role', ("role-title",)),
+    *_date_fields('start', ("start-date",)),
+    *_date_fields('end', ("end-date",)),
+) + _ORGANIZATION_COLUMNS)
+
+
+def section_schema(section: str) -> Schema:
+    '''
+    Column schema of an activity section
+    section : "works", "fundings" or one of AFFILIATION_SECTIONS
+    return  : the compiled Schema
+    raises  : ValueError if the section has no columnar form
+    '''
+    if section == "works":
+        return WORK_COLUMNS
+    if section == "fundings":
+        return FUNDING_COLUMNS
+    if section in AFFILIATION_SECTIONS:
+        return AFFILIATION_COLUMNS
+    raise ValueError(
+        f"Section '{section}' has no columnar form. Use 'works', "
+        f"'fundings' or one of {', '.join(AFFILIATION_SECTIONS)}.")
+
+
+def section_columns(section: str, data: Any) -> dict[str, list[Any]]:
+    '''
+    Extracts the summaries of an activity section payload into columns
+    section : "works", "fundings" or one of AFFILIATION_SECTIONS
+    data    : the section payload as returned by the ORCID API
+    return  : a dictionary mapping each column name to its list of values
+    '''
+    schema = section_schema(section)
+    return schema.extract_columns(iter_section_items(section, data))
+
+
+def _xml_date_fields(prefix, path):
+    '''
+    Year and month columns of a fuzzy date as parsed from XML, where the
+    year and month elements hold their value as text
+    '''
+    return (
+        Field(f'{prefix}-year', path + ("year",), to_int),
+        Field(f'{prefix}-month', path + ("month",), to_int),
+    )
+
+
+_XML_ORGANIZATION_COLUMNS = (
+    Field('organization', ("organization", "name")),
+    Field('organization-address', ("organization", "address"),
+          format_address),
+    Field('url', ("url",)),
+)
+
+# Counterparts of the columnar schemas (same columns, in the same order)
+# for summaries parsed from XML: the public data file, or the payloads
+# OrcidScrapper reads
+XML_WORK_COLUMNS = Schema((
+    Field('put-code', ("@put-code",), to_int),
+    Field('title', ("title", "title")),
+    Field('type', ("type",)),
+    *_xml_date_fields('publication', ("publication-date",)),
+    Field('journal-title', ("journal-title",)),
+) + _XML_ORGANIZATION_COLUMNS + (
+    Field('doi', ("external-ids", "external-id"), first_doi, deunicode=False),
+))
+
+XML_FUNDING_COLUMNS = Schema((
+    Field('put-code', ("@put-code",), to_int),
+    Field('title', ("title", "title")),
+    Field('type', ("type",)),
+    *_xml_date_fields('start', ("start-date",)),
+    *_xml_date_fields('end', ("end-date",)),
+) + _XML_ORGANIZATION_COLUMNS)
+
+XML_AFFILIATION_COLUMNS = Schema((
+    Field('put-code', ("@put-code",), to_int),
+    Field('department', ("department-name",)),
+    Field('role', ("role-title",)),
+    *_xml_date_fields('start', ("start-date",)),
+    *_xml_date_fields('end', ("end-date",)),
+) + _XML_ORGANIZATION_COLUMNS)
+
+
+def _as_list(value):
+    '''
+    Repeated XML elements are parsed into a list, single ones into their
+    value and empty ones into None
+    return  : the elements as a list
+    '''
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def iter_xml_section_items(section: str, data: Any) -> Iterator[Any]:
+    '''
+    Iterates over the summaries of an activity section parsed from XML
+    (works, fundings or an affiliation section)
+    return  : a generator of the summaries
+    '''
+    group_key = ("group" if section in ("works", "fundings")
+                 else "affiliation-group")
+    item_key = f"{section[:-1]}-summary"
+    for group in _as_list((data or {}).get(group_key)):
+        yield from _as_list((group or {}).get(item_key))
+
+
+def xml_section_schema(section: str) -> Schema:
+    '''
+    Column schema of an activity section parsed from XML, see
+    section_schema()
+    return  : the compiled Schema
+    raises  : ValueError if the section has no columnar form
+    '''
+    section_schema(section)
+    if section == "works":
+        return XML_WORK_COLUMNS
+    if section == "fundings":
+        return XML_FUNDING_COLUMNS
+    return XML_AFFILIATION_COLUMNS
+
+
+def xml_section_columns(section: str, data: Any) -> dict[str, list[Any]]:
+    '''
+    Extracts the summaries of an activity section parsed from XML into
+    the columns section_columns() returns for the JSON payload
+    return  : a dictionary mapping each column name to its list of values
+    raises  : ValueError if the section has no columnar form
+    '''
+    schema = xml_section_schema(section)
+    return schema.extract_columns(iter_xml_section_items(section, data))
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "Arrow and Parquet output require pyarrow. Install it with "
+            "'pip install PyOrcid[arrow]'.")
+
+
+def _arrow_type(name):
+    '''
+    Arrow type of a column: integer put-codes, years and months, strings
+    otherwise
+    '''
+    if name == "put-code":
+        return pa.int64()
+    if name.endswith("-year"):
+        return pa.int16()
+    if name.endswith("-month"):
+        return pa.int8()
+    return pa.string()
+
+
+def arrow_schema(section: str, with_orcid_id: bool = False):
+    '''
+    Typed Arrow schema of an activity section's columns
+    with_orcid_id : prepend an "orcid-id" column, as written by
+                    ArrowBatchWriter
+    return  : a pyarrow.Schema
+    '''
+    _require_pyarrow()
+    names = section_schema(section).names
+    if with_orcid_id:
+        names = ("orcid-id",) + names
+    return pa.schema([(name, _arrow_type(name)) for name in names])
+
+
+def to_arrow(section: str, columns: dict[str, list[Any]]):
+    '''
+    Converts the columns of section_columns() into a typed Arrow table
+    return  : a pyarrow.Table
+    '''
+    schema = arrow_schema(section, with_orcid_id="orcid-id" in columns)
+    return pa.Table.from_arrays(
+        [pa.array(columns[field.name], type=field.type) for field in schema],
+        schema=schema)
+
+
+class ArrowBatchWriter:
+    '''
+    Appends the rows of many researchers' activity section into Arrow
+    record batches, written to a Parquet file or kept in memory. Each row
+    carries the researcher's iD in an "orcid-id" column.
+    '''
+    def __init__(
+        self,
+        section: str = "works",
+        path: str | None = None,
+        batch_size: int = 65536,
+        compression: str = "zstd"
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            section: "works", "fundings" or one of AFFILIATION_SECTIONS
+            path: Parquet file to write; batches are kept in memory and
+                returned by to_table() if None
+            batch_size: Number of buffered rows per record batch
+            compression: Parquet compression codec
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            ValueError: If the section has no columnar form
+        """
+        _require_pyarrow()
+        self.section = section
+        self.schema = arrow_schema(section, with_orcid_id=True)
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._batches = []
+        self._writer = None
+        if path is not None:
+            self._writer = pq.ParquetWriter(
+                path, self.schema, compression=compression)
+        self.__reset_buffer()
+
+    def append(self, orcid_id: str, data: Any) -> int:
+        """Buffer the rows of one researcher's section payload.
+
+        Args:
+            orcid_id: ORCID iD the payload belongs to
+            data: Section payload as returned by the ORCID API
+
+        Returns:
+            Number of rows appended
+        """
+        return self.append_columns(
+            orcid_id, section_columns(self.section, data))
+
+    def append_columns(
+        self,
+        orcid_id: str,
+        columns: dict[str, list[Any]]
+    ) -> int:
+        """Buffer rows already extracted into columns.
+
+        Args:
+            orcid_id: ORCID iD the rows belong to
+            columns: Dictionary mapping every column of the section to its
+                values, as returned by section_columns()
+
+        Returns:
+            Number of rows appended
+        """
+        count = len(columns["put-code"])
+        self._buffer["orcid-id"].extend([orcid_id] * count)
+        for name in self.schema.names[1:]:
+            self._buffer[name].extend(columns[name])
+        self._buffered += count
+        if self._buffered >= self.batch_size:
+            self.flush()
+        return count
+
+    def flush(self) -> None:
+        """Turn the buffered rows into a record batch and write it."""
+        if not self._buffered:
+            return
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(self._buffer[field.name], type=field.type)
+             for field in self.schema],
+            schema=self.schema)
+        if self._writer is not None:
+            self._writer.write_batch(batch)
+        else:
+            self._batches.append(batch)
+        self.rows_written += self._buffered
+        self.__reset_buffer()
+
+    def to_table(self):
+        """Return every row appended so far as one table.
+
+        Returns:
+            A pyarrow.Table
+
+        Raises:
+            ValueError: If the rows were written to a Parquet file
+        """
+        if self._writer is not None:
+            raise ValueError(
+                "Rows were written to a Parquet file; read it back with "
+                "pyarrow.parquet.read_table().")
+        self.flush()
+        return pa.Table.from_batches(self._batches, schema=self.schema)
+
+    def close(self) -> None:
+        """Flush the buffered rows and close the Parquet file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self) -> ArrowBatchWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reset_buffer(self):
+        self._buffer = {name: [] for name in self.schema.names}
+        self._buffered = 0
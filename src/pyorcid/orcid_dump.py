@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import tarfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator
+
+from .orcid_columnar import (  # noqa: F401 - XML schemas re-exported
+    XML_AFFILIATION_COLUMNS,
+    XML_FUNDING_COLUMNS,
+    XML_WORK_COLUMNS,
+    ArrowBatchWriter,
+    iter_xml_section_items,
+    section_schema,
+    xml_section_columns,
+)
+from .orcid_extraction import get_path
+from .orcid_store import RecordStore
+from .orcid_xml import parse_xml
+
+logger = logging.getLogger(__name__)
+
+# Sections extracted from every record by default
+DEFAULT_DUMP_SECTIONS = ("works", "fundings", "employments", "educations")
+
+# Records sent to a worker process at once
+DEFAULT_CHUNK_SIZE = 64
+
+
+def parse_record(
+    data: bytes,
+    sections: Iterable[str] = DEFAULT_DUMP_SECTIONS
+) -> tuple[str | None, dict[str, dict[str, list[Any]]]]:
+    '''
+    Parses the XML of one record of the public data file
+    data     : the record's XML
+    sections : activity sections to extract
+    return  : the ORCID iD and a dictionary mapping each section to its
+    columns
+    '''
+    record = next(iter(parse_xml(data).values()), None) or {}
+    orcid_id = get_path(record, ("orcid-identifier", "path"))
+    activities = record.get("activities-summary") or {}
+    return orcid_id, {
+        section: xml_section_columns(section, activities.get(section))
+        for section in sections
+    }
+
+
+def iter_dump_members(path: str) -> Iterator[tuple[str, bytes]]:
+    '''
+    Streams the record files out of a public data file tarball, reading
+    it sequentially and never extracting it to disk
+    path    : the .tar.gz (or any tar compression) file
+    return  : a generator of (member name, XML bytes) tuples
+    '''
+    with tarfile.open(path, mode="r|*") as archive:
+        for member in archive:
+            if not member.isfile() or not member.name.endswith(".xml"):
+                continue
+            stream = archive.extractfile(member)
+            if stream is not None:
+                yield member.name, stream.read()
+
+
+def _parse_chunk(chunk, sections):
+    '''
+    Worker function of ingest_dump()
+    return  : a list of (member name, orcid_id, tables) tuples, tables
+    being the error message if the record could not be parsed
+    '''
+    results = []
+    for name, data in chunk:
+        try:
+            orcid_id, tables = parse_record(data, sections)
+        except Exception as e:
+            results.append((name, None, f"{type(e).__name__}: {e}"))
+            continue
+        if orcid_id is None:
+            orcid_id = os.path.splitext(os.path.basename(name))[0]
+        results.append((name, orcid_id, tables))
+    return results
+
+
+def _chunks(members, size):
+    '''
+    Groups the members into lists of size
+    '''
+    chunk = []
+    for member in members:
+        chunk.append(member)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ingest_dump(
+    path: str,
+    sink: Any,
+    sections: Iterable[str] = DEFAULT_DUMP_SECTIONS,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict[str, int]:
+    """Extract the activity summaries of every record of an ORCID public
+    data file (summaries tarball) into a sink.
+
+    The tarball is streamed by this process while worker processes parse
+    the XML and extract the summaries. At most two chunks per process are
+    in flight, so memory stays flat whatever the size of the dump, and
+    throughput grows with the number of processes until decompression in
+    this process becomes the bottleneck.
+
+    Args:
+        path: The summaries tarball
+        sink: Object receiving each record through write(orcid_id,
+            tables), e.g. JsonlSink, ParquetSink or StoreSink; it is
+            not closed
+        sections: Activity sections to extract, e.g. "works" or
+            "employments"
+        processes: Number of worker processes (os.cpu_count() if None);
+            0 parses in this process
+        chunk_size: Records sent to a worker at once
+
+    Returns:
+        Counters: "records" written to the sink, "failed" records that
+        could not be parsed, and the number of rows of every section
+    """
+    sections = tuple(sections)
+    for section in sections:
+        section_schema(section)
+    stats = dict.fromkeys(("records", "failed") + sections, 0)
+    chunks = _chunks(iter_dump_members(path), chunk_size)
+
+    def consume(results):
+        for name, orcid_id, tables in results:
+            if orcid_id is None:
+                logger.warning(f"Failed to parse {name}: {tables}")
+                stats["failed"] += 1
+                continue
+            sink.write(orcid_id, tables)
+            stats["records"] += 1
+            for section, columns in tables.items():
+                stats[section] += len(columns["put-code"])
+
+    if processes == 0:
+        for chunk in chunks:
+            consume(_parse_chunk(chunk, sections))
+        return stats
+
+    processes = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(_parse_chunk, chunk, sections))
+            if len(pending) < 2 * processes:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                consume(future.result())
+        for future in pending:
+            consume(future.result())
+    return stats
+
+
+class JsonlSink:
+    '''
+    Writes one JSON line per record: its "orcid-id" and, for every
+    section, the list of its summaries as dictionaries. Paths ending in
+    .gz are gzip-compressed.
+    '''
+    def __init__(self, path: str) -> None:
+        if path.endswith(".gz"):
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, orcid_id: str, tables: dict[str, dict[str, list]]) -> None:
+        line = {"orcid-id": orcid_id}
+        for section, columns in tables.items():
+            line[section] = [dict(zip(columns, row))
+                             for row in zip(*columns.values())]
+        self._file.write(json.dumps(line, ensure_ascii=False))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> JsonlSink:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ParquetSink:
+    '''
+    Writes every section to its own Parquet file, {directory}/{section}
+    .parquet, through an ArrowBatchWriter (requires pyarrow)
+    '''
+    def __init__(
+        self,
+        directory: str,
+        sections: Iterable[str] = DEFAULT_DUMP_SECTIONS,
+        batch_size: int = 65536
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._writers = {
+            section: ArrowBatchWriter(
+                section, os.path.join(directory, f"{section}.parquet"),
+                batch_size=batch_size)
+            for section in sections
+        }
+
+    def write(self, orcid_id: str, tables: dict[str, dict[str, list]]) -> None:
+        for section, columns in tables.items():
+            self._writers[section].append_columns(orcid_id, columns)
+
+    def close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+
+    def __enter__(self) -> ParquetSink:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StoreSink:
+    '''
+    Indexes every section's summaries in a RecordStore, committing once
+    per batch of records
+    '''
+    def __init__(
+        self,
+        store: RecordStore | str,
+        batch_size: int = 1000
+    ) -> None:
+        self._owns_store = isinstance(store, str)
+        if self._owns_store:
+            store = RecordStore(store)
+        self.store = store
+        self.batch_size = batch_size
+        self._pending = []
+        self._records = 0
+
+    def write(self, orcid_id: str, tables: dict[str, dict[str, list]]) -> None:
+        self._pending.extend(
+            (orcid_id, section, columns) for section, columns in tables.items())
+        self._records += 1
+        if self._records >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.store.put_columns_many(self._pending)
+        self._pending = []
+        self._records = 0
+
+    def close(self) -> None:
+        """Flush the buffered records, and close the store unless it was
+        given by the caller."""
+        self.flush()
+        if self._owns_store:
+            self.store.close()
+
+    def __enter__(self) -> StoreSink:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
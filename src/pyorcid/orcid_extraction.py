@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import keyword
+import logging
+import re
+from functools import cached_property
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def deunicode(s: str) -> str:
+    '''
+    Removes non-ASCII characters from a string
+    return : a string with only ASCII characters
+    '''
+    if s.isascii():
+        return s
+    return s.encode('ascii', 'ignore').decode('ascii')
+
+
+def get_path(obj: Any, keys: Sequence[str]) -> Any:
+    '''
+    Walks a key path through nested dictionaries in a single pass
+    return  : the value at the end of the path (non-ASCII characters
+    removed from strings), or None if the path is not accessible
+    '''
+    for key in keys:
+        if not isinstance(obj, dict) or key not in obj:
+            return None
+        obj = obj[key]
+    if isinstance(obj, str):
+        return deunicode(obj)
+    return obj
+
+
+def format_date(date_dict: Any) -> str:
+    '''
+    Formats an ORCID fuzzy date ({"year": {"value": ...}, "month": ...})
+    return  : "MM/YYYY", "YYYY" if the month is unknown, or '' if the year
+    is unknown
+    '''
+    year = get_path(date_dict, ("year", "value"))
+    if year is None:
+        return ''
+    month = get_path(date_dict, ("month", "value"))
+    if month is None:
+        return year
+    return f"{month}/{year}"
+
+
+def format_address(address: Any) -> str:
+    '''
+    Joins the components of an organization address
+    return  : e.g. "Boston, MA, US", or '' if there is no address
+    '''
+    if not isinstance(address, dict):
+        return ''
+    return ', '.join(
+        deunicode(part) if isinstance(part, str) else part
+        for part in address.values() if part)
+
+
+def to_int(value: Any) -> int | None:
+    '''
+    Converts a numeric string such as a year, month or put-code to int
+    return  : the number, or None if the value is missing or not numeric
+    '''
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_DOI_PREFIX = re.compile(r"^(https?://(dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+
+
+def normalize_doi(doi: str | None) -> str | None:
+    '''
+    Normalizes a DOI for lookups: lower case, without resolver prefix
+    return  : e.g. "10.1000/xyz" for "https://doi.org/10.1000/XYZ"
+    '''
+    if not doi:
+        return None
+    return _DOI_PREFIX.sub("", doi.strip()).lower() or None
+
+
+def first_doi(external_ids: Any) -> str | None:
+    '''
+    The first DOI among the external ids of a work (a list, or a single
+    external id as parsed from XML)
+    return  : the normalized DOI, or None if the work has none
+    '''
+    if isinstance(external_ids, dict):
+        external_ids = [external_ids]
+    for identifier in external_ids or ():
+        if (isinstance(identifier, dict)
+                and identifier.get("external-id-type") == "doi"):
+            return normalize_doi(identifier.get("external-id-value"))
+    return None
+
+
+class Field:
+    '''
+    One output column of an extraction schema: the value found at a key
+    path, optionally passed through a post-processor
+    '''
+    __slots__ = ("name", "path", "post", "deunicode")
+
+    def __init__(
+        self,
+        name: str,
+        path: Sequence[str],
+        post: Callable[[Any], Any] | None = None,
+        deunicode: bool = True
+    ) -> None:
+        """Initialize the field.
+
+        Args:
+            name: Key of the value in the extracted dictionary
+            path: Keys leading to the value, e.g. ("title", "title", "value");
+                a missing key yields None
+            post: Function applied to the value, e.g. format_date
+            deunicode: Whether non-ASCII characters are removed from string
+                values before post is applied
+
+        Raises:
+            ValueError: If path is empty
+        """
+        if not path:
+            raise ValueError(f"Field '{name}' needs a non-empty key path.")
+        self.name = name
+        self.path = tuple(path)
+        self.post = post
+        self.deunicode = deunicode
+
+
+class Schema:
+    '''
+    Declarative extraction schema compiled once into a single Python
+    function. Key paths sharing a prefix walk it only once, and every
+    field is read in the same pass over the summary.
+    '''
+    def __init__(self, fields: Iterable[Field | tuple]) -> None:
+        """Compile the schema.
+
+        Args:
+            fields: Field instances, or (name, path[, post]) tuples
+        """
+        self.fields = tuple(
+            field if isinstance(field, Field) else Field(*field)
+            for field in fields)
+        self.tree = _prefix_tree(self.fields)
+        self.source = _generate_source(self.fields, self.tree)
+        namespace = self.__compile(self.source)
+        self.extract: Callable[[Any], dict[str, Any]] = namespace["extract"]
+        self.extract_row: Callable[[Any], tuple] = namespace["extract_row"]
+
+    @cached_property
+    def extract_struct_row(self) -> Callable[[Any], tuple]:
+        """Row extractor over nested objects exposing the keys of the
+        paths as attributes named by key_attribute(), such as decoded
+        msgspec structs. A None attribute ends a path like a missing key.
+        """
+        source = _generate_source(self.fields, self.tree, attributes=True)
+        return self.__compile(source)["extract_row"]
+
+    def __call__(self, obj: Any) -> dict[str, Any]:
+        """Extract every field of one summary."""
+        return self.extract(obj)
+
+    def extract_many(self, objs: Iterable[Any]) -> list[dict[str, Any]]:
+        """Extract every field of each summary."""
+        extract = self.extract
+        return [extract(obj) for obj in objs]
+
+    def extract_columns(self, objs: Iterable[Any]) -> dict[str, list[Any]]:
+        """Extract every field of each summary into one list per field.
+
+        Returns:
+            Dictionary mapping each field name to its column of values
+        """
+        extract_row = self.extract_row
+        rows = [extract_row(obj) for obj in objs]
+        columns = zip(*rows) if rows else ((),) * len(self.fields)
+        return {
+            field.name: list(column)
+            for field, column in zip(self.fields, columns)
+        }
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(field.name for field in self.fields)
+
+    def __compile(self, source):
+        namespace = {
+            "_deunicode": deunicode,
+            "_posts": tuple(field.post for field in self.fields),
+        }
+        exec(compile(source, "<orcid-extraction-schema>", "exec"), namespace)
+        return namespace
+
+
+def key_attribute(key: str) -> str:
+    '''
+    Python attribute name standing for a JSON key, e.g. "put-code" ->
+    "put_code", used by Schema.extract_struct_row()
+    '''
+    name = re.sub(r"\W", "_", key)
+    if not name.isidentifier() or keyword.iskeyword(name):
+        name = f"k_{name}"
+    return name
+
+
+def _prefix_tree(fields):
+    '''
+    Merges the key paths of a schema into a prefix tree
+    return  : a dictionary mapping each key to [children, indexes of the
+    fields whose path ends at the key]
+    '''
+    tree = {}
+    for index, field in enumerate(fields):
+        node = tree
+        for depth, key in enumerate(field.path):
+            entry = node.setdefault(key, [{}, []])
+            if depth == len(field.path) - 1:
+                entry[1].append(index)
+            node = entry[0]
+    return tree
+
+
+def _generate_source(fields, tree, attributes=False):
+    '''
+    Generates the source of the extract() and extract_row() functions of
+    a schema: the prefix tree of the key paths is walked with nested
+    isinstance checks, or with None checks and attribute lookups if
+    ``attributes`` is true
+    return  : Python source defining extract(obj) and extract_row(obj)
+    '''
+    lines = ["    " + " = ".join(
+        [f"r{i}" for i in range(len(fields))] + ["None"])]
+    counter = [0]
+
+    def lookup(var, key):
+        if attributes:
+            return f"{var}.{key_attribute(key)}"
+        return f"{var}.get({key!r})"
+
+    def emit(node, var, indent):
+        pad = "    " * indent
+        if attributes:
+            lines.append(f"{pad}if {var} is not None:")
+        else:
+            lines.append(f"{pad}if isinstance({var}, dict):")
+        pad += "    "
+        for key, (children, ending) in node.items():
+            if not children:
+                lines.append(f"{pad}{' = '.join(f'r{i}' for i in ending)}"
+                             f" = {lookup(var, key)}")
+                continue
+            counter[0] += 1
+            tmp = f"t{counter[0]}"
+            lines.append(f"{pad}{tmp} = {lookup(var, key)}")
+            for i in ending:
+                lines.append(f"{pad}r{i} = {tmp}")
+            emit(children, tmp, indent + 1)
+
+    emit(tree, "obj", 1)
+
+    for i, field in enumerate(fields):
+        if field.deunicode:
+            lines.append(f"    if isinstance(r{i}, str) and not r{i}.isascii():")
+            lines.append(f"        r{i} = _deunicode(r{i})")
+        if field.post is not None:
+            lines.append(f"    r{i} = _posts[{i}](r{i})")
+
+    body = "\n".join(lines)
+    items = ", ".join(f"{field.name!r}: r{i}" for i, field in enumerate(fields))
+    values = "".join(f"r{i}, " for i in range(len(fields)))
+    return (f"def extract(obj):\n{body}\n    return {{{items}}}\n\n\n"
+            f"def extract_row(obj):\n{body}\n    return ({values})\n")
+
+
+def iter_group_items(data: Any, item_key: str) -> Iterator[Any]:
+    '''
+    Iterates over the summaries of a works/fundings/peer-reviews payload
+    ({"group": [{item_key: [...]}, ...]})
+    return  : a generator of the summaries
+    '''
+    for group in (data or {}).get('group', []):
+        yield from group.get(item_key, [])
+
+
+def iter_affiliation_items(data: Any, key: str) -> Iterator[Any]:
+    '''
+    Iterates over the summaries of an affiliation payload (educations,
+    employments, ...), e.g. key "employment" for employment-summary
+    return  : a generator of the summaries ({} where one is missing)
+    '''
+    summary_key = f'{key}-summary'
+    for group in (data or {}).get('affiliation-group', []):
+        for summary in group.get('summaries', []):
+            yield summary.get(summary_key, {})
+
+
+def iter_section_items(section: str, data: Any) -> Iterator[Any]:
+    '''
+    Iterates over the summaries of a works, fundings or affiliation
+    section payload (e.g. "invited-positions" yields the
+    invited-position-summary objects)
+    return  : a generator of the summaries
+    '''
+    if section == "works":
+        return iter_group_items(data, 'work-summary')
+    if section == "fundings":
+        return iter_group_items(data, 'funding-summary')
+    return iter_affiliation_items(data, section[:-1])
+
+
+# Shared organization columns
+_ORGANIZATION_FIELDS = (
+    Field('organization', ("organization", "name")),
+    Field('organization-address', ("organization", "address"),
+          format_address),
+    Field('url', ("url", "value")),
+)
+
+WORK_SCHEMA = Schema((
+    Field('title', ("title", "title", "value")),
+    Field('type', ("type",)),
+    Field('publication-date', ("publication-date",), format_date),
+    Field('journal title', ("journal-title", "value")),
+) + _ORGANIZATION_FIELDS)
+
+FUNDING_SCHEMA = Schema((
+    Field('title', ("title", "title", "value")),
+    Field('type', ("type",)),
+    Field('start-date', ("start-date",), format_date),
+    Field('end-date', ("end-date",), format_date),
+) + _ORGANIZATION_FIELDS)
+
+AFFILIATION_SCHEMA = Schema((
+    Field('Department', ("department-name",)),
+    Field('Role', ("role-title",)),
+    Field('start-date', ("start-date",), format_date),
+    Field('end-date', ("end-date",), format_date),
+) + _ORGANIZATION_FIELDS)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+from .orcid_extraction import key_attribute
+from .orcid_records import _RECORD_SCHEMAS, _record_class, section_records
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("auto", "msgspec", "orjson", "json")
+
+
+def json_backend(backend: str = "auto") -> str:
+    '''
+    Resolves the JSON decoder to use
+    backend : "msgspec", "orjson", "json" (the standard library) or "auto"
+              for the fastest one installed, in that order
+    return  : the backend name
+    raises  : ValueError if the backend is unknown, ImportError if it is
+    not installed
+    '''
+    if backend == "auto":
+        if msgspec is not None:
+            return "msgspec"
+        return "json" if orjson is None else "orjson"
+    if backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend '{backend}'. Use one of "
+            f"{', '.join(JSON_BACKENDS)}.")
+    if backend == "msgspec" and msgspec is None:
+        raise ImportError(
+            "The msgspec JSON backend requires msgspec. Install it with "
+            "'pip install PyOrcid[fast-json]'.")
+    if backend == "orjson" and orjson is None:
+        raise ImportError(
+            "The orjson JSON backend requires orjson. Install it with "
+            "'pip install orjson'.")
+    return backend
+
+
+def loads(data: bytes | memoryview | str, backend: str = "auto") -> Any:
+    '''
+    Decodes a JSON document with the fastest installed decoder
+    data    : UTF-8 bytes (or any bytes-like object) or text
+    backend : see json_backend()
+    return  : the decoded document
+    raises  : ValueError if the document is not valid JSON
+    '''
+    backend = json_backend(backend)
+    if backend == "msgspec":
+        try:
+            return _msgspec_decoder().decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    if backend == "orjson":
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, backend: str = "auto") -> bytes:
+    '''
+    Encodes a document into compact UTF-8 JSON with the fastest installed
+    encoder. Keys keep their order, and the backends produce the same
+    bytes for the documents this package builds (strings, numbers, None,
+    lists and dictionaries with string keys).
+    backend : see json_backend()
+    return  : the UTF-8 JSON bytes
+    '''
+    backend = json_backend(backend)
+    if backend == "msgspec":
+        return msgspec.json.encode(obj)
+    if backend == "orjson":
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def response_json(response: Any, backend: str = "auto") -> Any:
+    '''
+    Decodes the JSON body of a response with loads(). Responses that do
+    not expose their body as bytes (e.g. custom transports) are decoded
+    by their own json() method.
+    return  : the decoded body
+    raises  : ValueError if the body is not valid JSON
+    '''
+    content = response.content
+    if not isinstance(content, (bytes, bytearray)):
+        return response.json()
+    return loads(content, backend)
+
+
+def decode_records(section: str, data: bytes) -> list:
+    '''
+    Typed decoding: turns the raw JSON payload of a works, fundings or
+    affiliation section straight into WorkSummary, FundingSummary or
+    AffiliationSummary records. With msgspec, the payload is decoded into
+    structs holding only the fields the records need; everything else is
+    skipped by the decoder instead of being built into dictionaries.
+    Without msgspec (or if the payload does not match the expected
+    shape), the payload is decoded generically and extracted as by
+    section_records().
+    section : "works", "fundings" or an affiliation section
+    data    : the UTF-8 JSON payload
+    return  : a list of records, as section_records() would return
+    raises  : ValueError if the payload is not valid JSON
+    '''
+    if msgspec is None:
+        return section_records(section, loads(data))
+    decoder, items = _typed_section(section)
+    try:
+        payload = decoder.decode(data)
+    except msgspec.ValidationError as e:
+        logger.debug(f"Unexpected '{section}' payload shape ({e}), "
+                     f"decoding it generically")
+        return section_records(section, loads(data))
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+    cls = _record_class(section)
+    extract_row = _RECORD_SCHEMAS[cls].extract_struct_row
+    return [cls(*extract_row(item)) for item in items(payload)]
+
+
+def response_records(section: str, response: Any) -> list:
+    '''
+    Decodes the body of a section response with decode_records()
+    return  : a list of records
+    '''
+    content = response.content
+    if not isinstance(content, (bytes, bytearray)):
+        return section_records(section, response.json())
+    return decode_records(section, content)
+
+
+@lru_cache(maxsize=None)
+def _msgspec_decoder():
+    return msgspec.json.Decoder()
+
+
+def _struct_type(name, tree):
+    '''
+    Builds the msgspec struct type of one node of a schema's prefix tree:
+    one optional field per key, a nested struct for inner keys and Any
+    for the keys fields end at
+    return  : the struct type
+    raises  : ValueError if a key is both an inner key and a field end
+    '''
+    fields, rename = [], {}
+    for key, (children, ending) in tree.items():
+        attribute = key_attribute(key)
+        rename[attribute] = key
+        if children and ending:
+            raise ValueError(
+                f"Key '{key}' ends one path and continues another; the "
+                f"schema cannot be decoded into structs.")
+        if children:
+            child = _struct_type(f"{name}_{attribute}", children)
+            fields.append((attribute, Optional[child], None))
+        else:
+            fields.append((attribute, Any, None))
+    return msgspec.defstruct(name, fields, rename=rename, gc=False)
+
+
+@lru_cache(maxsize=None)
+def _typed_section(section):
+    '''
+    Struct types of a section payload, built on first use from the record
+    schema's prefix tree
+    return  : the msgspec decoder of the payload, and a function iterating
+    over the summary structs of a decoded payload
+    '''
+    cls = _record_class(section)
+    summary = _struct_type(f"{cls.__name__}Struct", _RECORD_SCHEMAS[cls].tree)
+
+    if section in ("works", "fundings"):
+        item_key = f"{section[:-1]}-summary"
+        group = msgspec.defstruct(
+            f"{cls.__name__}Group",
+            [("items", Optional[list[summary]], None)],
+            rename={"items": item_key}, gc=False)
+        payload = msgspec.defstruct(
+            f"{cls.__name__}Payload",
+            [("group", Optional[list[group]], None)], gc=False)
+
+        def items(data):
+            for group in data.group or ():
+                yield from group.items or ()
+    else:
+        holder = msgspec.defstruct(
+            f"{cls.__name__}Holder",
+            [("summary", Optional[summary], None)],
+            rename={"summary": f"{section[:-1]}-summary"}, gc=False)
+        group = msgspec.defstruct(
+            f"{cls.__name__}Group",
+            [("summaries", Optional[list[holder]], None)], gc=False)
+        payload = msgspec.defstruct(
+            f"{cls.__name__}Payload",
+            [("groups", Optional[list[group]], None)],
+            rename={"groups": "affiliation-group"}, gc=False)
+
+        def items(data):
+            for group in data.groups or ():
+                for holder in group.summaries or ():
+                    yield holder.summary
+
+    return msgspec.json.Decoder(payload), items
@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Iterable, Sequence
+from urllib.parse import urlsplit
+
+from .orcid_cache import normalize_section
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover - optional dependency
+    otel_metrics = None
+
+logger = logging.getLogger(__name__)
+
+# Latency phases of a RequestEvent, in seconds
+PHASES = ("elapsed", "connect", "ttfb", "download")
+
+# Upper bounds (in seconds) of the latency histogram buckets: 0.5 ms to
+# about 9 minutes, two buckets per doubling
+DEFAULT_BUCKETS = tuple(0.0005 * 2 ** (k / 2) for k in range(41))
+
+_ORCID_ID = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
+
+
+def endpoint_of(url: str) -> str:
+    '''
+    Endpoint of an ORCID URL, with the iD and put-codes left out, e.g.
+    "works" for /v3.0/{id}/works, "works/{put-codes}" for a bulk read and
+    "expanded-search" for a search
+    return  : the endpoint, "record" for a bare iD
+    '''
+    parts = [part for part in urlsplit(url).path.strip("/").split("/")
+             if part and part != "v3.0" and not _ORCID_ID.match(part)]
+    return normalize_section("/".join(parts)) or "record"
+
+
+class RequestEvent:
+    '''
+    Measurements of one HTTP request, emitted to the hooks of the client
+    once the response has been received (or the request failed). Phases
+    are in seconds and None when they were not measured:
+    - elapsed  : the whole call, including rate limiting and retries
+    - connect  : opening the connection of the last attempt (0 when a
+                 pooled connection was reused)
+    - ttfb     : from sending the request to receiving the response
+                 headers, connection excluded
+    - download : reading the body (None for streamed responses, whose
+                 body is read by the caller)
+    '''
+    __slots__ = ("client", "method", "url", "host", "endpoint", "section",
+                 "status_code", "error", "attempts", "cache", "streamed",
+                 "elapsed", "connect", "ttfb", "download", "bytes_received")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        section: str = "",
+        client: str = "sync",
+        streamed: bool = False
+    ) -> None:
+        self.client = client
+        self.method = method
+        self.url = url
+        self.host = urlsplit(url).hostname or ""
+        self.endpoint = endpoint_of(url)
+        # Put-codes are templated so that labels stay bounded
+        self.section = normalize_section(section) if section else self.endpoint
+        self.status_code: int | None = None
+        # Exception type name if the request failed without a response
+        self.error: str | None = None
+        self.attempts = 0
+        # "hit", "revalidated", "miss" or "bypass" (streamed); None when
+        # the transport has no cache. "coalesced" when the response of an
+        # identical request in flight was shared (see orcid_singleflight)
+        self.cache: str | None = None
+        self.streamed = streamed
+        self.elapsed: float | None = None
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+        self.download: float | None = None
+        self.bytes_received: int | None = None
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    @property
+    def status(self) -> str:
+        '''
+        return  : the status code as text, or the error name
+        '''
+        if self.status_code is not None:
+            return str(self.status_code)
+        return self.error or "unknown"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"RequestEvent({self.method} {self.endpoint} "
+                f"section={self.section!r} status={self.status} "
+                f"elapsed={self.elapsed})")
+
+
+class DecodeEvent:
+    '''
+    Time spent decoding the body of a response into Python objects
+    '''
+    __slots__ = ("section", "seconds", "bytes")
+
+    def __init__(self, section: str, seconds: float, size: int | None) -> None:
+        self.section = normalize_section(section)
+        self.seconds = seconds
+        self.bytes = size
+
+    def __repr__(self) -> str:
+        return (f"DecodeEvent(section={self.section!r} "
+                f"seconds={self.seconds} bytes={self.bytes})")
+
+
+class MetricsHook:
+    '''
+    Receives the events of every request of a client. Subclasses override
+    the methods they need; hooks must be thread-safe since requests are
+    sent from many threads (or tasks) at once.
+    '''
+    def on_request(self, event: RequestEvent) -> None:
+        """Called once per request, after the response was received."""
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        """Called once per decoded response body."""
+
+
+def emit(hooks: Iterable[MetricsHook], method: str, event: Any) -> None:
+    '''
+    Hands an event to every hook; a failing hook is logged and never
+    fails the request
+    '''
+    for hook in hooks:
+        try:
+            getattr(hook, method)(event)
+        except Exception as e:
+            logger.warning(f"Metrics hook {hook!r} failed: {e}")
+
+
+def timed_decode(
+    hooks: Sequence[MetricsHook],
+    section: str,
+    response: Any,
+    decode: Callable[[Any], Any]
+) -> Any:
+    '''
+    Decodes a response, emitting a DecodeEvent to the hooks
+    decode  : function decoding the response, e.g. response_json
+    return  : the decoded body
+    '''
+    if not hooks:
+        return decode(response)
+    start = time.perf_counter()
+    data = decode(response)
+    content = getattr(response, "content", None)
+    size = len(content) if isinstance(content, (bytes, bytearray)) else None
+    emit(hooks, "on_decode",
+         DecodeEvent(section, time.perf_counter() - start, size))
+    return data
+
+
+class LatencyHistogram:
+    '''
+    Histogram of durations over fixed bucket bounds, with percentiles
+    estimated by interpolating within the bucket they fall in
+    '''
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        # One more bucket for values above the last bound
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float | None:
+        """Estimate a percentile.
+
+        Args:
+            q: The percentile, between 0 and 100
+
+        Returns:
+            The estimated duration, or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = (self.bounds[index] if index < len(self.bounds)
+                         else self.max)
+                value = lower + (upper - lower) * (rank - seen) / count
+                return min(max(value, self.min), self.max)
+            seen += count
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        '''
+        return  : count, sum, mean, min, max and the 50th, 90th, 95th and
+        99th percentiles
+        '''
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            **{f"p{q}": self.percentile(q) for q in (50, 90, 95, 99)},
+        }
+
+
+class _SectionMetrics:
+    '''
+    Counters and histograms of one section, see MetricsAggregator
+    '''
+    __slots__ = ("requests", "errors", "status", "cache", "retries",
+                 "bytes", "latency", "decode")
+
+    def __init__(self, bounds):
+        self.requests = 0
+        self.errors = 0
+        self.status = {}
+        self.cache = {}
+        self.retries = 0
+        self.bytes = 0
+        self.latency = {phase: LatencyHistogram(bounds) for phase in PHASES}
+        self.decode = LatencyHistogram(bounds)
+
+
+class MetricsAggregator(MetricsHook):
+    '''
+    In-process metrics: per-section request, status, cache and retry
+    counters, bytes received, and latency histograms of every phase and
+    of decoding
+    '''
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._bounds = tuple(bounds)
+        self._lock = threading.Lock()
+        self._sections: dict[str, _SectionMetrics] = {}
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self.__section(event.section)
+            metrics.requests += 1
+            if event.error is not None or (event.status_code or 0) >= 400:
+                metrics.errors += 1
+            metrics.status[event.status] = (
+                metrics.status.get(event.status, 0) + 1)
+            if event.cache is not None:
+                metrics.cache[event.cache] = (
+                    metrics.cache.get(event.cache, 0) + 1)
+            metrics.retries += event.retries
+            metrics.bytes += event.bytes_received or 0
+            for phase in PHASES:
+                value = getattr(event, phase)
+                if value is not None:
+                    metrics.latency[phase].observe(value)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        with self._lock:
+            self.__section(event.section).decode.observe(event.seconds)
+
+    def histogram(self, section: str, phase: str = "elapsed") -> LatencyHistogram:
+        """Return the histogram of one section's phase ("decode" or one of
+        PHASES).
+
+        Raises:
+            KeyError: If nothing was recorded for the section
+        """
+        with self._lock:
+            metrics = self._sections[section]
+            return metrics.decode if phase == "decode" else metrics.latency[phase]
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of every section.
+
+        Each section also reports its "time_share": the fraction of the
+        time spent in requests (and decoding) of all sections that it
+        accounts for.
+
+        Returns:
+            A dictionary mapping each section to its counters, "latency"
+            summaries per phase and "decode" summary, sections taking the
+            most time first
+        """
+        with self._lock:
+            sections = {
+                section: {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "status": dict(metrics.status),
+                    "cache": dict(metrics.cache),
+                    "retries": metrics.retries,
+                    "bytes": metrics.bytes,
+                    "latency": {phase: histogram.as_dict() for phase, histogram
+                                in metrics.latency.items()},
+                    "decode": metrics.decode.as_dict(),
+                }
+                for section, metrics in self._sections.items()
+            }
+
+        def spent(summary):
+            return summary["latency"]["elapsed"]["sum"] + summary["decode"]["sum"]
+
+        total = sum(spent(summary) for summary in sections.values())
+        for summary in sections.values():
+            summary["time_share"] = spent(summary) / total if total else 0.0
+        return dict(sorted(sections.items(),
+                           key=lambda item: -item[1]["time_share"]))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sections.clear()
+
+    def __section(self, section):
+        metrics = self._sections.get(section)
+        if metrics is None:
+            metrics = self._sections[section] = _SectionMetrics(self._bounds)
+        return metrics
+
+
+class PrometheusHook(MetricsHook):
+    '''
+    Exports the events as Prometheus metrics (requires prometheus_client):
+    {namespace}_requests_total, {namespace}_request_duration_seconds (per
+    phase), {namespace}_response_bytes_total, {namespace}_retries_total
+    and {namespace}_decode_duration_seconds, labelled by section
+    '''
+    def __init__(
+        self,
+        registry: Any = None,
+        namespace: str = "pyorcid",
+        buckets: Sequence[float] | None = None
+    ) -> None:
+        """Register the metrics.
+
+        Args:
+            registry: CollectorRegistry to register with (the default
+                registry if None)
+            namespace: Prefix of the metric names
+            buckets: Histogram buckets in seconds (prometheus_client's
+                defaults if None)
+
+        Raises:
+            ImportError: If prometheus_client is not installed
+        """
+        if prometheus_client is None:
+            raise ImportError(
+                "PrometheusHook requires prometheus_client. Install it with "
+                "'pip install PyOrcid[prometheus]'.")
+        common = {"namespace": namespace}
+        if registry is not None:
+            common["registry"] = registry
+        histogram = dict(common)
+        if buckets is not None:
+            histogram["buckets"] = tuple(buckets)
+
+        self._requests = prometheus_client.Counter(
+            "requests", "ORCID HTTP requests",
+            ["section", "endpoint", "status", "cache"], **common)
+        self._duration = prometheus_client.Histogram(
+            "request_duration_seconds", "ORCID HTTP request latency by phase",
+            ["section", "phase"], **histogram)
+        self._bytes = prometheus_client.Counter(
+            "response_bytes", "Bytes received from ORCID", ["section"],
+            **common)
+        self._retries = prometheus_client.Counter(
+            "retries", "Retried ORCID HTTP requests", ["section"], **common)
+        self._decode = prometheus_client.Histogram(
+            "decode_duration_seconds", "Decoding time of ORCID responses",
+            ["section"], **histogram)
+
+    def on_request(self, event: RequestEvent) -> None:
+        self._requests.labels(event.section, event.endpoint, event.status,
+                              event.cache or "none").inc()
+        for phase in PHASES:
+            value = getattr(event, phase)
+            if value is not None:
+                self._duration.labels(event.section, phase).observe(value)
+        if event.bytes_received:
+            self._bytes.labels(event.section).inc(event.bytes_received)
+        if event.retries:
+            self._retries.labels(event.section).inc(event.retries)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        self._decode.labels(event.section).observe(event.seconds)
+
+
+class OpenTelemetryHook(MetricsHook):
+    '''
+    Records the events with OpenTelemetry instruments (requires
+    opentelemetry-api and, to export them, a configured SDK):
+    pyorcid.requests, pyorcid.request.duration (per phase),
+    pyorcid.response.size, pyorcid.retries and pyorcid.decode.duration
+    '''
+    def __init__(self, meter: Any = None) -> None:
+        """Create the instruments.
+
+        Args:
+            meter: Meter to create the instruments with (the global
+                meter provider's "pyorcid" meter if None)
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        if meter is None:
+            if otel_metrics is None:
+                raise ImportError(
+                    "OpenTelemetryHook requires opentelemetry-api. Install "
+                    "it with 'pip install PyOrcid[opentelemetry]'.")
+            meter = otel_metrics.get_meter("pyorcid")
+        self._requests = meter.create_counter(
+            "pyorcid.requests", unit="1", description="ORCID HTTP requests")
+        self._duration = meter.create_histogram(
+            "pyorcid.request.duration", unit="s",
+            description="ORCID HTTP request latency by phase")
+        self._bytes = meter.create_counter(
+            "pyorcid.response.size", unit="By",
+            description="Bytes received from ORCID")
+        self._retries = meter.create_counter(
+            "pyorcid.retries", unit="1",
+            description="Retried ORCID HTTP requests")
+        self._decode = meter.create_histogram(
+            "pyorcid.decode.duration", unit="s",
+            description="Decoding time of ORCID responses")
+
+    def on_request(self, event: RequestEvent) -> None:
+        attributes = {"section": event.section, "endpoint": event.endpoint}
+        self._requests.add(1, {**attributes, "status": event.status,
+                               "cache": event.cache or "none"})
+        for phase in PHASES:
+            value = getattr(event, phase)
+            if value is not None:
+                self._duration.record(value, {**attributes, "phase": phase})
+        if event.bytes_received:
+            self._bytes.add(event.bytes_received, attributes)
+        if event.retries:
+            self._retries.add(event.retries, attributes)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        self._decode.record(event.seconds, {"section": event.section})
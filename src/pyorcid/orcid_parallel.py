@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, Iterator
+
+from .orcid import Orcid
+from .orcid_columnar import section_columns
+from .orcid_dump import DEFAULT_DUMP_SECTIONS, _chunks, parse_record
+from .orcid_json import loads
+from .orcid_transport import OrcidTransport
+
+logger = logging.getLogger(__name__)
+
+# Payloads handed to a worker process at once, and results sent back
+DEFAULT_CHUNK_SIZE = 256
+
+# A worker function: (orcid_id, payload) -> result. The payload is a
+# memoryview that is only valid during the call.
+PayloadFunction = Callable[[str, memoryview], Any]
+
+# Transport of the Orcid instances built by summarize_record() in this
+# process; record_summary(data=...) never sends a request through it
+_transport = None
+
+
+def summarize_record(orcid_id: str, payload: memoryview) -> dict[str, Any]:
+    '''
+    Worker function building the record_summary() of a /record JSON
+    payload, without any request
+    return  : the summary
+    '''
+    global _transport
+    if _transport is None:
+        _transport = OrcidTransport(pool_maxsize=1)
+    orcid = Orcid(orcid_id, transport=_transport)
+    return orcid.record_summary(data=loads(payload))
+
+
+def record_columns(
+    orcid_id: str,
+    payload: memoryview,
+    sections: Iterable[str] = DEFAULT_DUMP_SECTIONS
+) -> dict[str, dict[str, list[Any]]]:
+    '''
+    Worker function extracting the activity sections of a /record (or
+    /activities) JSON payload into columns; bind other sections with
+    functools.partial
+    return  : a dictionary mapping each section to its columns
+    '''
+    data = loads(payload)
+    activities = data.get("activities-summary", data) if data else {}
+    return {section: section_columns(section, activities.get(section))
+            for section in sections}
+
+
+def dump_record_columns(
+    orcid_id: str,
+    payload: memoryview,
+    sections: Iterable[str] = DEFAULT_DUMP_SECTIONS
+) -> dict[str, dict[str, list[Any]]]:
+    '''
+    Worker function extracting the activity sections of a record of the
+    public data file (XML) into columns
+    return  : a dictionary mapping each section to its columns
+    '''
+    return parse_record(payload, sections)[1]
+
+
+def _apply(function, orcid_id, payload, results):
+    '''
+    Calls the worker function, recording its result or its error
+    '''
+    try:
+        results.append((orcid_id, function(orcid_id, payload)))
+    except Exception as e:
+        results.append((orcid_id, e))
+
+
+def _map_block(function, name, spans):
+    '''
+    Worker side of map_payloads(): maps the shared memory block holding
+    the chunk's payloads and applies the function to each of them
+    spans   : (orcid_id, start, end) tuples locating the payloads
+    return  : a list of (orcid_id, result or exception) tuples
+    '''
+    block = shared_memory.SharedMemory(name=name)
+    results = []
+    try:
+        for orcid_id, start, end in spans:
+            with block.buf[start:end] as payload:
+                _apply(function, orcid_id, payload, results)
+    finally:
+        block.close()
+    return results
+
+
+def _map_paths(function, paths):
+    '''
+    Worker side of map_files(): memory-maps each file and applies the
+    function to its content
+    return  : a list of (orcid_id, result or exception) tuples
+    '''
+    results = []
+    for path in paths:
+        orcid_id = os.path.splitext(os.path.basename(path))[0]
+        try:
+            with open(path, "rb") as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as payload:
+                _apply(function, orcid_id, payload, results)
+        except (OSError, ValueError) as e:
+            # mmap raises ValueError for empty files
+            results.append((orcid_id, e))
+    return results
+
+
+def _pack(chunk):
+    '''
+    Copies the payloads of a chunk into a new shared memory block
+    return  : the block and the (orcid_id, start, end) spans of the
+    payloads
+    '''
+    payloads = [(orcid_id, payload.encode("utf-8")
+                 if isinstance(payload, str) else payload)
+                for orcid_id, payload in chunk]
+    size = sum(len(payload) for _, payload in payloads)
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    spans = []
+    offset = 0
+    for orcid_id, payload in payloads:
+        end = offset + len(payload)
+        block.buf[offset:end] = payload
+        spans.append((orcid_id, offset, end))
+        offset = end
+    return block, spans
+
+
+def _release(block):
+    '''
+    Frees a shared memory block once its worker is done with it
+    '''
+    block.close()
+    try:
+        block.unlink()
+    except FileNotFoundError:  # pragma: no cover - already unlinked
+        pass
+
+
+def map_payloads(
+    function: PayloadFunction,
+    payloads: Iterable[tuple[str, bytes]],
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[tuple[str, Any]]]:
+    """Apply a function to many raw payloads on a process pool.
+
+    The payloads of each chunk are copied once into a shared memory
+    block; workers read them in place through memoryviews and only the
+    block name and the payload offsets are pickled. At most two chunks
+    per process are in flight, so memory stays flat however many
+    payloads are read.
+
+    Args:
+        function: Module-level (picklable) function called as
+            function(orcid_id, payload), e.g. summarize_record,
+            record_columns or dump_record_columns
+        payloads: (orcid_id, bytes) tuples, e.g. from
+            RecordStore.iter_payloads() or iter_dump_members()
+        processes: Number of worker processes (os.cpu_count() if None);
+            0 applies the function in this process
+        chunk_size: Payloads handed to a worker at once, which is also
+            the size of the result chunks
+
+    Returns:
+        A generator of result chunks, in completion order: lists of
+        (orcid_id, result) tuples, result being the exception raised by
+        the function if it failed
+    """
+    chunks = _chunks(payloads, chunk_size)
+    if processes == 0:
+        for chunk in chunks:
+            results = []
+            for orcid_id, payload in chunk:
+                with memoryview(payload.encode("utf-8")
+                                if isinstance(payload, str) else payload) as view:
+                    _apply(function, orcid_id, view, results)
+            yield results
+        return
+
+    processes = processes or os.cpu_count() or 1
+    blocks = {}
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for chunk in chunks:
+                block, spans = _pack(chunk)
+                blocks[executor.submit(
+                    _map_block, function, block.name, spans)] = block
+                while len(blocks) >= 2 * processes:
+                    yield from _completed(blocks)
+            while blocks:
+                yield from _completed(blocks)
+    finally:
+        for block in blocks.values():
+            _release(block)
+
+
+def _completed(blocks):
+    '''
+    Waits for at least one chunk of map_payloads() and frees its block
+    return  : a generator of the result chunks
+    '''
+    done, _ = wait(blocks, return_when=FIRST_COMPLETED)
+    for future in done:
+        _release(blocks.pop(future))
+        yield future.result()
+
+
+def map_files(
+    function: PayloadFunction,
+    paths: Iterable[str],
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[tuple[str, Any]]]:
+    """Apply a function to many payload files on a process pool.
+
+    Only the paths are sent to the workers, which memory-map the files and
+    hand their content to the function without copying it. The ORCID iD
+    of each file is its name without extension, e.g.
+    0000-0002-1825-0097.json.
+
+    Args:
+        function: See map_payloads()
+        paths: Paths of the payload files
+        processes: Number of worker processes (os.cpu_count() if None);
+            0 applies the function in this process
+        chunk_size: Files handed to a worker at once, which is also the
+            size of the result chunks
+
+    Returns:
+        A generator of result chunks, as map_payloads() returns
+    """
+    chunks = _chunks(paths, chunk_size)
+    if processes == 0:
+        for chunk in chunks:
+            yield _map_paths(function, chunk)
+        return
+
+    processes = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(_map_paths, function, chunk))
+            if len(pending) < 2 * processes:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
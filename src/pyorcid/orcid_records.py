@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .orcid_extraction import (
+    AFFILIATION_SCHEMA,
+    FUNDING_SCHEMA,
+    WORK_SCHEMA,
+    Field,
+    Schema,
+    iter_section_items,
+    to_int,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _SummaryRecord:
+    '''
+    Base class of the summary records: an immutable, hashable __slots__
+    object whose first slot is the put-code and whose other slots are the
+    fields of the matching dictionary returned by works(), fundings(), ...
+    '''
+    __slots__ = ()
+
+    # Keys of the dictionary returned by as_dict(), for every slot but
+    # put_code
+    _DICT_KEYS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__init__ = _generate_init(cls.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def as_tuple(self) -> tuple:
+        """Return the values in slot order."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the dictionary the untyped accessor builds for the same
+        summary (without the put-code)."""
+        return {
+            key: getattr(self, name)
+            for key, name in zip(self._DICT_KEYS, self.__slots__[1:])
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__,) + self.as_tuple())
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return (type(self), self.as_tuple())
+
+
+def _generate_init(slots):
+    '''
+    Builds the __init__ of a record class, taking one argument per slot
+    (positionally or by name) and setting it past the immutability guard
+    return  : the __init__ function
+    '''
+    arguments = ", ".join(slots)
+    body = "".join(f"    _set(self, {name!r}, {name})\n" for name in slots)
+    namespace = {"_set": object.__setattr__}
+    exec(f"def __init__(self, {arguments}):\n{body}", namespace)
+    return namespace["__init__"]
+
+
+class WorkSummary(_SummaryRecord):
+    '''
+    Summary of one work, as listed by works()
+    '''
+    __slots__ = ("put_code", "title", "type", "publication_date",
+                 "journal_title", "organization", "organization_address",
+                 "url")
+    _DICT_KEYS = WORK_SCHEMA.names
+
+    put_code: int | None
+    title: str | None
+    type: str | None
+    publication_date: str
+    journal_title: str | None
+    organization: str | None
+    organization_address: str
+    url: str | None
+
+
+class FundingSummary(_SummaryRecord):
+    '''
+    Summary of one funding, as listed by fundings()
+    '''
+    __slots__ = ("put_code", "title", "type", "start_date", "end_date",
+                 "organization", "organization_address", "url")
+    _DICT_KEYS = FUNDING_SCHEMA.names
+
+    put_code: int | None
+    title: str | None
+    type: str | None
+    start_date: str
+    end_date: str
+    organization: str | None
+    organization_address: str
+    url: str | None
+
+
+class AffiliationSummary(_SummaryRecord):
+    '''
+    Summary of one affiliation (education, employment, service, ...), as
+    listed by educations(), employments(), ...
+    '''
+    __slots__ = ("put_code", "department", "role", "start_date", "end_date",
+                 "organization", "organization_address", "url")
+    _DICT_KEYS = AFFILIATION_SCHEMA.names
+
+    put_code: int | None
+    department: str | None
+    role: str | None
+    start_date: str
+    end_date: str
+    organization: str | None
+    organization_address: str
+    url: str | None
+
+
+def _record_schema(schema):
+    '''
+    Extends a dictionary schema with a leading put-code field
+    return  : the compiled Schema, whose rows match the record slots
+    '''
+    return Schema((Field('put-code', ("put-code",), to_int),) + schema.fields)
+
+
+_RECORD_SCHEMAS = {
+    WorkSummary: _record_schema(WORK_SCHEMA),
+    FundingSummary: _record_schema(FUNDING_SCHEMA),
+    AffiliationSummary: _record_schema(AFFILIATION_SCHEMA),
+}
+
+
+def _record_class(section):
+    '''
+    return  : the record class of a works, fundings or affiliation section
+    '''
+    if section == "works":
+        return WorkSummary
+    if section == "fundings":
+        return FundingSummary
+    return AffiliationSummary
+
+
+def section_records(section: str, data: Any) -> list[_SummaryRecord]:
+    '''
+    Extracts the summaries of a works, fundings or affiliation section
+    payload into records
+    section : "works", "fundings" or an affiliation section such as
+              "employments"
+    data    : the section payload as returned by the ORCID API
+    return  : a list of WorkSummary, FundingSummary or AffiliationSummary
+    '''
+    cls = _record_class(section)
+    extract_row = _RECORD_SCHEMAS[cls].extract_row
+    return [cls(*extract_row(item))
+            for item in iter_section_items(section, data)]
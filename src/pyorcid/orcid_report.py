@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Iterable
+
+from .orcid import Orcid
+from .orcid_batch import OrcidBatch
+from .orcid_json import dumps
+from .orcid_templates import REPORT_TEMPLATES, ReportTemplate
+from .orcid_transport import OrcidTransport
+
+logger = logging.getLogger(__name__)
+
+# Summary hashes of the rendered pages, kept in the output directory
+MANIFEST_NAME = ".pyorcid-report.json"
+
+# Buffer of the page files; a page is written in a handful of system calls
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _summary_hash(template_name, summary):
+    '''
+    Fingerprint of a page: its template and summary. Summaries are built
+    with their keys in a fixed order, so they are hashed as encoded,
+    which is several times faster with orjson or msgspec than the
+    canonical encoding of orcid_sync.section_hash().
+    return  : a hexadecimal digest
+    '''
+    digest = hashlib.blake2b(template_name.encode("utf-8"), digest_size=16)
+    digest.update(dumps(summary))
+    return digest.hexdigest()
+
+
+class CohortReport:
+    '''
+    Renders the record_summary() pages of many researchers into one
+    directory, {directory}/{orcid_id}{extension}. Records are read
+    concurrently over one connection pool (see OrcidBatch) and each page
+    is rendered as soon as its record arrives.
+    '''
+    def __init__(
+        self,
+        directory: str,
+        template: str | ReportTemplate = "markdown",
+        incremental: bool = True,
+        orcid_access_token: str = " ",
+        state: str = "public",
+        sandbox: bool = False,
+        concurrency: int = 8,
+        transport: OrcidTransport | None = None
+    ) -> None:
+        """Initialize the report.
+
+        Args:
+            directory: Output directory, created if missing
+            template: "markdown", "html" or a ReportTemplate
+            incremental: Skip the researchers whose summary (and template)
+                did not change since their page was rendered; the hashes
+                are kept in {directory}/.pyorcid-report.json
+            orcid_access_token: ORCID access token used for every record
+            state: Whether to use "public" or "member" API of ORCID
+            sandbox: Whether to use ORCID sandbox API for testing
+            concurrency: Maximum number of records read at the same time
+            transport: Transport shared by every read (a private transport
+                is created if None)
+
+        Raises:
+            ValueError: If the template is unknown
+        """
+        if isinstance(template, str):
+            if template not in REPORT_TEMPLATES:
+                raise ValueError(
+                    f"Unknown template '{template}'. Use one of "
+                    f"{', '.join(REPORT_TEMPLATES)} or a ReportTemplate.")
+            template = REPORT_TEMPLATES[template]
+        self.directory = directory
+        self.template = template
+        self.incremental = incremental
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = OrcidTransport(pool_maxsize=concurrency)
+        self._transport = transport
+        self._batch = OrcidBatch(
+            orcid_access_token=orcid_access_token,
+            state=state,
+            sandbox=sandbox,
+            sections=("record",),
+            concurrency=concurrency,
+            transport=transport,
+        )
+        self._manifest_path = os.path.join(directory, MANIFEST_NAME)
+        os.makedirs(directory, exist_ok=True)
+        self._hashes = self.__load_manifest() if incremental else {}
+
+    def path(self, orcid_id: str) -> str:
+        '''
+        return  : the path of a researcher's page
+        '''
+        return os.path.join(self.directory,
+                            f"{orcid_id}{self.template.extension}")
+
+    def write(self, summary: dict[str, Any]) -> bool:
+        """Render one summary as returned by record_summary() to its page.
+
+        The page is streamed through a buffered file next to its final
+        path and moved into place once complete, so readers never see a
+        partial page.
+
+        Returns:
+            True if the page was written, False if it was up to date
+        """
+        orcid_id = summary['ORCiD ID']
+        path = self.path(orcid_id)
+        digest = _summary_hash(self.template.name, summary)
+        if (self.incremental and self._hashes.get(orcid_id) == digest
+                and os.path.exists(path)):
+            return False
+
+        temporary = f"{path}.part"
+        with open(temporary, 'w', encoding='utf-8',
+                  buffering=WRITE_BUFFER_SIZE) as page:
+            page.writelines(self.template.render(summary))
+        os.replace(temporary, path)
+        self._hashes[orcid_id] = digest
+        return True
+
+    def generate(
+        self,
+        orcid_ids: Iterable[str] = (),
+        summaries: Iterable[dict[str, Any]] = ()
+    ) -> dict[str, int]:
+        """Render the pages of a cohort.
+
+        Pre-fetched summaries are rendered first, then the records of the
+        iDs are read concurrently and rendered in completion order.
+
+        Args:
+            orcid_ids: ORCID iDs to read and render, any iterable
+            summaries: Pre-computed record_summary() results
+
+        Returns:
+            Counters: pages "written", "skipped" as up to date, and
+            records that "failed" to be read or summarized
+        """
+        stats = dict.fromkeys(("written", "skipped", "failed"), 0)
+
+        def render(summary):
+            stats["written" if self.write(summary) else "skipped"] += 1
+
+        try:
+            for summary in summaries:
+                render(summary)
+
+            for orcid_id, result in self._batch.harvest(orcid_ids):
+                if isinstance(result, Exception) or not result["record"]:
+                    stats["failed"] += 1
+                    continue
+                orcid = Orcid(orcid_id, transport=self._transport)
+                try:
+                    summary = orcid.record_summary(data=result["record"])
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to summarize ORCID record {orcid_id}: {e}")
+                    stats["failed"] += 1
+                    continue
+                render(summary)
+        finally:
+            self.save()
+        return stats
+
+    def save(self) -> None:
+        """Write the summary hashes of incremental mode to the manifest."""
+        if not self.incremental:
+            return
+        temporary = f"{self._manifest_path}.part"
+        with open(temporary, 'w', encoding='utf-8') as manifest:
+            json.dump(self._hashes, manifest, sort_keys=True)
+        os.replace(temporary, self._manifest_path)
+
+    def close(self) -> None:
+        """Close the connection pool, unless the transport was given by
+        the caller."""
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> CohortReport:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __load_manifest(self):
+        '''
+        Reads the hashes of the pages rendered by earlier runs
+        return  : a dictionary mapping iDs to summary hashes
+        '''
+        try:
+            with open(self._manifest_path, encoding='utf-8') as manifest:
+                return json.load(manifest)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(
+                f"Ignoring unreadable report manifest {self._manifest_path}")
+            return {}
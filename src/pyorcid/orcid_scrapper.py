@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 import requests
-import xmltodict
 
 from .orcid import Orcid
+from .orcid_transport import OrcidTransport
+from .orcid_xml import iter_xml_elements, parse_xml
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +18,19 @@ class OrcidScrapper(Orcid):
     through web-scraping
     Inherited from Orcid class
     '''
-    def __init__(self, orcid_id: str) -> None:
+    def __init__(
+        self,
+        orcid_id: str,
+        transport: OrcidTransport | None = None
+    ) -> None:
         """Initialize the OrcidScrapper class.
 
         Args:
             orcid_id: ORCID ID of the user
+            transport: Transport to send requests with, e.g. one shared
+                with other clients (a private transport is created if None)
         """
-        super().__init__(orcid_id)
+        super().__init__(orcid_id, transport=transport)
 
     def __read_section(self, section="record"):
         '''
@@ -32,14 +39,21 @@ class OrcidScrapper(Orcid):
         ORCID data
         '''
         url = f"https://pub.orcid.org/v3.0/{self._orcid_id}/{section}"
-        data = self.__orcid_web_scrapper(url)
-        return data[section]
-
-    def __orcid_web_scrapper(self, url: str) -> dict[str, Any]:
+        data = self.__orcid_web_scrapper(url, section)
+        # The root element is not always named after the section
+        # (e.g. activities-summary for /activities)
+        return next(iter(data.values()), {})
+
+    def __orcid_web_scrapper(
+        self,
+        url: str,
+        section: str = ""
+    ) -> dict[str, Any]:
         """Scrape data from the ORCID public webpage.
 
         Args:
             url: URL to scrape data from
+            section: ORCID section name, used to pick the cache TTL
 
         Returns:
             Dictionary containing parsed data
@@ -49,61 +63,67 @@ class OrcidScrapper(Orcid):
             Exception: If XML parsing fails
         """
         try:
-            response = self._session.get(url, timeout=30)
+            response = self._transport.get(url, section=section)
             response.raise_for_status()
-            xml_data = response.content
-
-            # Convert the XML tree scraped to a dict
-            data = xmltodict.parse(xml_data)
         except requests.RequestException as e:
             logger.error(f"Failed to fetch data from {url}: {e}")
             raise
+
+        return self._parse_xml(response.content)
+
+    def _parse_xml(self, xml_data: bytes) -> dict[str, Any]:
+        """Convert a scraped XML document into an API-shaped dict.
+
+        Namespace prefixes and declarations are dropped while parsing, in
+        a single pass over the document.
+
+        Args:
+            xml_data: Raw XML body of an ORCID section
+
+        Returns:
+            Dictionary with the section's root element (e.g. "record") as
+            its only key
+
+        Raises:
+            Exception: If XML parsing fails
+        """
+        try:
+            return parse_xml(xml_data)
         except Exception as e:
             logger.error(f"Failed to parse XML data: {e}")
             raise
 
-        # reformat the json tree
-        renamed_data = self.__rename_keys(data)
-        result = self.__remove_metadata(renamed_data)
+    def scrape_elements(
+        self,
+        section: str,
+        name: str
+    ) -> Iterator[Any]:
+        """Stream the repeated elements of a section as they are parsed.
 
-        return result
+        Args:
+            section: ORCID section to read, e.g. "works" or "employments"
+            name: Element to yield, e.g. "work-summary" or
+                "affiliation-group"
 
-    def __rename_keys(self, data):
-        '''
-        Reformats and renames the keys of a data dictionary acquired
-        thorugh scraping to match the names of keys accessed through API
-        return  : a dictionary of summary view of the section of
-        ORCID data
-        '''
-        if isinstance(data, dict):
-            new_data = {}
-            for key, value in data.items():
-                if ':' in key:
-                    _, new_key = key.split(':')
-                    new_data[new_key] = self.__rename_keys(value)
-                else:
-                    new_data[key] = self.__rename_keys(value)
-            return new_data
-        elif isinstance(data, list):
-            return [self.__rename_keys(item) for item in data]
-        else:
-            return data
-
-    def __remove_metadata(self, data):
-        '''
-        Removes unnecessary metadata from a data dictionary acquired
-        '''
-        result = {}
-        # section name like record, works, activities-summary
-        section = list(data.keys())[0]
-        keys_to_remove = list(data[section].keys())[0:30]
-        newdata = {
-            key1: data[section][key1] for key1 in data[section]
-            if key1 not in keys_to_remove
-        }
-        result[section] = newdata
-
-        return result
+        Yields:
+            Each element, converted as _parse_xml() would
+
+        Raises:
+            requests.RequestException: If HTTP request fails
+        """
+        url = f"https://pub.orcid.org/v3.0/{self._orcid_id}/{section}"
+        try:
+            response = self._transport.get(url, section=section, stream=True)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch data from {url}: {e}")
+            raise
+
+        try:
+            yield from iter_xml_elements(
+                response.iter_content(chunk_size=65536), name)
+        finally:
+            response.close()
 
     def __extract_details(self, data, key):
         '''
@@ -1,13 +1,46 @@
 from __future__ import annotations
 
+import codecs
+import csv
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Mapping, MutableSequence
 from urllib import parse
 
 import requests
 
+from .orcid_json import response_json
+from .orcid_metrics import timed_decode
+from .orcid_token import needs_validation, token_validation_cache
+from .orcid_transport import OrcidTransport
+
 logger = logging.getLogger(__name__)
 
+# Paging limits of the ORCID search API: at most 1000 rows per page and
+# no page may start beyond the 10,000th result
+MAX_SEARCH_ROWS = 1000
+MAX_SEARCH_START = 10000
+
+# Columns returned by csv-search when none are requested
+DEFAULT_CSV_COLUMNS = ("orcid,given-names,family-name,"
+                       "current-institution-affiliation-name")
+
+# Key holding the result rows of each JSON search mode
+_RESULT_KEYS = {"expanded-search": "expanded-result", "search": "result"}
+
+
+def _result_key(search_mode):
+    '''
+    return  : the key holding the result rows of a JSON search mode
+    raises  : ValueError if search_mode is not a JSON search mode
+    '''
+    if search_mode not in _RESULT_KEYS:
+        raise ValueError(
+            f"Invalid search mode for iter_search: {search_mode}. "
+            f"Must be one of {', '.join(_RESULT_KEYS)}.")
+    return _RESULT_KEYS[search_mode]
+
 
 class OrcidSearch:
     '''
@@ -17,7 +50,8 @@ class OrcidSearch:
         self,
         orcid_access_token: str = " ",
         state: str = "public",
-        sandbox: bool = False
+        sandbox: bool = False,
+        transport: OrcidTransport | None = None
     ) -> None:
         """Initialize ORCID search instance.
 
@@ -25,25 +59,29 @@ class OrcidSearch:
             orcid_access_token: ORCID access token
             state: Whether to use "public" or "member" API of ORCID
             sandbox: Whether to use ORCID sandbox API for testing
+            transport: Transport to send requests with, e.g. one shared
+                with other clients (a private transport is created if None)
 
-        Raises:
-            ValueError: If access token is invalid
+        Note:
+            The access token is validated lazily, from the response to the
+            first search, and the outcome is shared process-wide; see
+            orcid_token.token_validation_cache.
         """
         self._orcid_access_token = orcid_access_token
         self._state = state
         self._sandbox = sandbox
-        self._session = requests.Session()
+        if transport is None:
+            transport = self._make_transport()
+        self._transport = transport
+        self._token_validated = not needs_validation(orcid_access_token)
 
-        # For testing purposes (pytesting on github workflow)
-        if orcid_access_token.strip() and orcid_access_token != " ":
-            try:
-                self.__is_access_token_valid()
-            except (KeyError, OSError):
-                if not self.__test_is_access_token_valid():
-                    raise ValueError(
-                        "Invalid access token! Please make sure the "
-                        "provided credentials are correct."
-                    )
+    def _make_transport(self) -> OrcidTransport:
+        '''
+        Creates the private transport of an instance given none; overridden
+        by the clients that do not send their requests with requests
+        return  : the transport
+        '''
+        return OrcidTransport()
 
     def search(
         self,
@@ -51,8 +89,8 @@ class OrcidSearch:
         start=0,
         rows=1000,
         search_mode="expanded-search",
-        columns="orcid,given-names,family-name,"
-                "current-institution-affiliation-name"
+        columns=DEFAULT_CSV_COLUMNS,
+        strict=False
     ):
         '''
         Search orcid records
@@ -68,9 +106,268 @@ class OrcidSearch:
         columns     : for the csv-search, default:
                       "orcid,given-names,family-name,
                       current-institution-affiliation-name"
-        return      : a dictionary of search results
+        strict      : raise the error of a failed request instead of
+                      returning None, default = False
+        return      : a dictionary of search results, or for csv-search
+                      a list of row dictionaries keyed by the columns
         '''
+        if search_mode == "csv-search":
+            return list(self.__stream_csv_page(
+                query, start, rows, columns, strict=strict))
+
+        api_url, headers = self._search_request(
+            query, start, rows, search_mode, columns)
+
+        try:
+            response = self._transport.get(
+                api_url, headers=headers, section="search")
+        except requests.RequestException as e:
+            logger.error(f"Search request failed: {e}")
+            if strict:
+                raise
+            return None
+        self._check_access_token(response.status_code)
+
+        try:
+            response.raise_for_status()
+            return timed_decode(
+                self._transport.hooks, "search", response, response_json)
+        except requests.HTTPError as e:
+            if e.response.status_code in (401, 403):
+                logger.error(
+                    f"Authentication failed for ORCID search: "
+                    f"{e.response.status_code} {e.response.text}"
+                )
+                raise
+            logger.warning(
+                f"Failed to retrieve ORCID search results: "
+                f"{e.response.status_code} {e.response.text}"
+            )
+            if strict:
+                raise
+            return None
+        except requests.RequestException as e:
+            logger.error(f"Search request failed: {e}")
+            if strict:
+                raise
+            return None
+        except ValueError as e:
+            logger.error(f"Failed to parse search response: {e}")
+            if strict:
+                raise
+            return None
+
+    def iter_search(
+        self,
+        query: str,
+        page_size: int = MAX_SEARCH_ROWS,
+        max_results: int | None = None,
+        search_mode: str = "expanded-search"
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate lazily over every result row of a search.
+
+        Pages are requested one ahead: while the caller consumes a page,
+        the next one is already being fetched in the background. The
+        iteration stops after ``max_results`` rows, at the last result,
+        or at the API's deep-paging limit, whichever comes first. A page
+        that cannot be read stops the iteration with its error rather
+        than silently truncating the results.
+
+        Args:
+            query: The search query (see search())
+            page_size: Number of rows requested per page (at most 1000)
+            max_results: Maximum number of rows to yield (all if None)
+            search_mode: Either "expanded-search" (default) or "search"
+
+        Yields:
+            Individual result rows
 
+        Raises:
+            ValueError: If search_mode is not a JSON search mode, or a
+                page cannot be decoded
+            requests.RequestException: If a page cannot be read
+        """
+        result_key = _result_key(search_mode)
+        page_size = max(1, min(page_size, MAX_SEARCH_ROWS))
+        limit = None
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            start = 0
+            future = executor.submit(
+                self.search, query, start, page_size, search_mode,
+                strict=True)
+            while future is not None:
+                page = future.result()
+                if not page:
+                    return
+                if limit is None:
+                    limit = self._reachable_results(
+                        page.get("num-found") or 0, max_results)
+
+                rows = page.get(result_key) or []
+                next_start = start + page_size
+                future = None
+                if (rows and next_start < limit
+                        and next_start <= MAX_SEARCH_START):
+                    # Prefetch the next page before yielding this one
+                    future = executor.submit(
+                        self.search, query, next_start,
+                        min(page_size, limit - next_start), search_mode,
+                        strict=True)
+
+                yield from rows[:max(0, limit - start)]
+                start = next_start
+
+    def iter_csv_search(
+        self,
+        query: str,
+        columns: str = DEFAULT_CSV_COLUMNS,
+        start: int = 0,
+        page_size: int = MAX_SEARCH_ROWS,
+        max_results: int | None = None,
+        as_tuples: bool = False
+    ) -> Iterator[dict[str, str] | tuple[str, ...]]:
+        """Stream the rows of a csv-search.
+
+        Each page is streamed from the socket and parsed row by row, so
+        peak memory does not depend on the number of rows.
+
+        Args:
+            query: The search query (see search())
+            columns: Comma-separated csv-search columns
+            start: Offset of the first row
+            page_size: Number of rows requested per page (at most 1000)
+            max_results: Maximum number of rows to yield (all reachable
+                rows if None)
+            as_tuples: Yield tuples in column order instead of dicts
+
+        Yields:
+            One dict keyed by the requested columns (or tuple) per row
+        """
+        page_size = max(1, min(page_size, MAX_SEARCH_ROWS))
+        yielded = 0
+
+        while True:
+            rows = page_size
+            if max_results is not None:
+                rows = min(rows, max_results - yielded)
+            if rows <= 0:
+                return
+            if start > MAX_SEARCH_START:
+                logger.warning(
+                    f"Stopping csv-search at the deep-paging limit "
+                    f"(start={start}).")
+                return
+
+            count = 0
+            for row in self.__stream_csv_page(
+                    query, start, rows, columns, as_tuples):
+                yield row
+                count += 1
+
+            yielded += count
+            if count < rows:
+                return
+            start += rows
+
+    def csv_search_into(
+        self,
+        query: str,
+        out: Mapping[str, MutableSequence[Any]],
+        columns: str = DEFAULT_CSV_COLUMNS,
+        start: int = 0
+    ) -> int:
+        """Fill preallocated column arrays from a streamed csv-search.
+
+        Args:
+            query: The search query (see search())
+            out: Mapping of column name to a preallocated array (list,
+                array.array, numpy array, ...); rows are written from
+                index 0 until the shortest array is full
+            columns: Comma-separated csv-search columns
+            start: Offset of the first row
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If out names a column that is not requested
+        """
+        targets, capacity = _csv_targets(out, columns)
+        count = 0
+        for row in self.iter_csv_search(
+                query, columns, start, max_results=capacity, as_tuples=True):
+            for index, array in targets:
+                array[count] = row[index]
+            count += 1
+        return count
+
+    def __stream_csv_page(self, query, start, rows, columns,
+                          as_tuples=False, strict=False):
+        '''
+        Streams one page of csv-search results
+        strict  : raise the error of a failed request instead of yielding
+                  no rows
+        return  : a generator of row dicts (or tuples)
+        '''
+        api_url, headers = self._search_request(
+            query, start, rows, "csv-search", columns)
+
+        try:
+            response = self._transport.get(
+                api_url, headers=headers, section="search", stream=True)
+        except requests.RequestException as e:
+            logger.error(f"Search request failed: {e}")
+            if strict:
+                raise
+            return
+
+        try:
+            try:
+                self._check_access_token(response.status_code)
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                if e.response.status_code in (401, 403):
+                    logger.error(
+                        f"Authentication failed for ORCID csv-search: "
+                        f"{e.response.status_code}"
+                    )
+                    raise
+                logger.warning(
+                    f"Failed to retrieve ORCID csv-search results: "
+                    f"{e.response.status_code}"
+                )
+                if strict:
+                    raise
+                return
+            yield from _csv_rows(
+                _iter_text_lines(response), columns, as_tuples)
+        finally:
+            response.close()
+
+    def _reachable_results(self, num_found, max_results):
+        '''
+        Helper function for iter_search()
+        return  : the number of results that can be read, bounded by
+        max_results and the deep-paging limit
+        '''
+        reachable = MAX_SEARCH_START + MAX_SEARCH_ROWS
+        if num_found > reachable:
+            logger.warning(
+                f"Search matched {num_found} records; only the first "
+                f"{reachable} can be paged through.")
+        limit = min(num_found, reachable)
+        if max_results is not None:
+            limit = min(limit, max_results)
+        return limit
+
+    def _search_request(self, query, start, rows, search_mode, columns):
+        '''
+        Builds the URL and headers of a search request, shared with
+        AsyncOrcidSearch
+        return      : a tuple of the API URL and the request headers
+        '''
+        self._check_access_token()
         access_token = self._orcid_access_token
 
         _search_mode = "expanded-search"
@@ -105,57 +402,29 @@ class OrcidSearch:
             'Content-Type': content_type
         }
 
-        # Make a GET request to retrieve the ORCID record
-        response = requests.get(api_url, headers=headers)
+        return api_url, headers
 
-        # The request was successful
-        data = response.json()
-        # Check the response status code
-        if response.status_code == 200 or data is not None:
-            return data
-        else:
-            # Handle the case where the request failed
-            print("Failed to retrieve ORCID search results. Status code:",
-                  response.status_code)
-            return None
-
-    def __is_access_token_valid(self):
+    def _check_access_token(self, status_code=None):
         '''
-        Checks if the current access token is valid
+        Validates the access token from the outcome of a request: before
+        the request (status_code None) a token already known to be
+        rejected fails fast, after it the outcome is recorded
+        status_code : status of a response obtained with the token
+        raises      : ValueError if ORCID rejected the access token
         '''
-        access_token = self._orcid_access_token
-
-        if access_token == "":
+        if self._token_validated:
+            return
+        valid = token_validation_cache.check(
+            self._orcid_access_token, self._state, self._sandbox, status_code,
+            resource="search")
+        if valid is None:
+            return
+        if not valid:
             raise ValueError(
-                "Empty value for access token! Please make sure you are "
-                "authenticated by ORCID as developer.")
-        # Make a test request to the API using the token
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-
-        api_url = ""
-
-        if self._state == "public":
-            # Specify the ORCID record endpoint for the desired ORCID iD
-            api_url = 'https://pub.orcid.org/v3.0/search'
-            if self._sandbox:
-                api_url = 'https://pub.sandbox.orcid.org/v3.0/search'
-
-        elif self._state == "member":
-            api_url = 'https://api.orcid.org/v3.0/search'
-            if self._sandbox:
-                api_url = 'https://api.sandbox.orcid.org/v3.0/search'
-
-        response = requests.get(api_url, headers=headers)
-
-        if response.status_code == 404:
-            # The request was successful, and the token is likely valid
-            return False
-        else:
-            # Token may have expired or is invalid
-            return True
+                "Invalid access token! Please make sure the "
+                "provided credentials are correct."
+            )
+        self._token_validated = True
 
     # THESE FUNCTIONS ARE FOR TESTING PURPOSES
 
@@ -192,3 +461,58 @@ class OrcidSearch:
         else:
             # Token may have expired or is invalid
             return True
+
+
+def _csv_rows(lines, columns, as_tuples=False):
+    '''
+    Parses csv-search lines, skipping the header line
+    return  : a generator of row dicts keyed by the requested columns
+    (or tuples in column order)
+    '''
+    names = [name.strip() for name in columns.split(",")]
+    reader = csv.reader(lines)
+    if next(reader, None) is None:
+        return
+    for record in reader:
+        if not record:
+            continue
+        if as_tuples:
+            yield tuple(record)
+        else:
+            yield dict(zip(names, record))
+
+
+def _csv_targets(out, columns):
+    '''
+    Helper function for csv_search_into()
+    return  : the (column index, array) pairs to fill, and the number of
+    rows they can hold
+    raises  : ValueError if out names a column that is not requested
+    '''
+    names = [name.strip() for name in columns.split(",")]
+    targets = []
+    for name, array in out.items():
+        if name not in names:
+            raise ValueError(
+                f"Column '{name}' is not part of the requested columns.")
+        targets.append((names.index(name), array))
+    capacity = min((len(array) for array in out.values()), default=0)
+    return targets, capacity
+
+
+def _iter_text_lines(response, chunk_size=64 * 1024):
+    '''
+    Decodes a streamed response into lines, keeping the line endings so
+    csv.reader can handle quoted fields spanning several lines
+    return  : a generator of text lines
+    '''
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+from .orcid_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def flight_key(url: str, headers: Mapping[str, str] | None = None) -> str:
+    '''
+    Key of a GET request: requests for the same URL (which carries the iD,
+    the section and the sandbox host) with the same token and media type
+    share a key, as they do in ResponseCache
+    return  : the key
+    '''
+    return ResponseCache.key(url, headers or {})
+
+
+class FlightStats:
+    '''
+    Thread-safe counters of a singleflight group: calls that were sent
+    and calls that were served by another caller's call in flight
+    '''
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
+
+
+class _Flight:
+    '''
+    A call in flight and the outcome its waiters receive
+    '''
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    '''
+    Coalesces identical calls made from several threads at the same time:
+    the first caller of a key runs the call and every caller arriving
+    before it completes waits for it and receives the same result (or
+    exception). Share one instance between the transports (or clients)
+    whose reads should be coalesced.
+    '''
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.stats = FlightStats()
+
+    def do(
+        self,
+        key: Hashable,
+        function: Callable[[], Any]
+    ) -> tuple[Any, bool]:
+        """Run a call, or wait for the identical call in flight.
+
+        Args:
+            key: Identity of the call, e.g. flight_key(url, headers)
+            function: The call, run by the first caller of the key
+
+        Returns:
+            The result of the call, and whether it was shared with (run
+            by) another caller. The result is the same object for every
+            caller and must be treated as read-only.
+
+        Raises:
+            Exception: The exception raised by the call, for every caller
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            self.stats.increment("coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        self.stats.increment("calls")
+        try:
+            flight.result = function()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+class AsyncSingleFlight:
+    '''
+    Asyncio version of SingleFlight, for the callers of one event loop.
+    The call runs in its own task, so cancelling the caller that started
+    it does not cancel it for the other waiters.
+    '''
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self.stats = FlightStats()
+
+    async def do(
+        self,
+        key: Hashable,
+        function: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Asyncio version of SingleFlight.do(); ``function`` returns an
+        awaitable."""
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if shared:
+            self.stats.increment("coalesced")
+        else:
+            self.stats.increment("calls")
+            flight = asyncio.ensure_future(function())
+            self._flights[key] = flight
+            flight.add_done_callback(
+                lambda task: self.__landed(key, task))
+        return await asyncio.shield(flight), shared
+
+    def __landed(self, key, task):
+        '''
+        Forgets a completed call. Its exception is retrieved so that a
+        call whose waiters were all cancelled is not reported as an
+        unretrieved exception.
+        '''
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Coalesced call failed: {task.exception()}")
+
+    def __len__(self) -> int:
+        return len(self._flights)
@@ -0,0 +1,497 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, Iterator
+
+from .orcid_columnar import (
+    AFFILIATION_SECTIONS,
+    iter_xml_section_items,
+    xml_section_schema,
+)
+from .orcid_extraction import (
+    Field,
+    Schema,
+    first_doi,
+    iter_section_items,
+    normalize_doi,
+    to_int,
+)
+from .orcid_json import loads
+
+logger = logging.getLogger(__name__)
+
+# Sections embedded in the activities-summary of a /record or /activities
+# payload, under their own name
+ACTIVITY_SECTIONS = AFFILIATION_SECTIONS + (
+    "works", "fundings", "peer-reviews", "research-resources")
+
+# Sections embedded in the person of a /record or /person payload, and the
+# key they are found under
+PERSON_SECTIONS = {
+    "address": "addresses",
+    "keywords": "keywords",
+    "other-names": "other-names",
+    "researcher-urls": "researcher-urls",
+    "external-identifiers": "external-identifiers",
+}
+
+# Sections RecordStore can hold; the others (e.g. bulk works/{put-codes})
+# are never stored
+STORED_SECTIONS = frozenset(
+    ("record", "activities", "person", "email", "personal-details")
+    + ACTIVITY_SECTIONS + tuple(PERSON_SECTIONS))
+
+# Sections whose summaries are indexed
+INDEXED_SECTIONS = AFFILIATION_SECTIONS + ("works", "fundings")
+
+_INDEX_COLUMNS = ("put_code", "title", "type", "organization",
+                  "start_year", "end_year", "doi")
+
+
+def _index_fields(*fields):
+    '''
+    Index fields keep the original text of the payload
+    '''
+    return Schema(tuple(
+        Field(name, path, post, deunicode=False)
+        for name, path, post in fields))
+
+
+_ORGANIZATION = ("organization", ("organization", "name"), None)
+
+# Index fields of the summaries of each section; for affiliations, the
+# title and type columns hold the role title and the department name
+_INDEX_SCHEMAS = {
+    "works": _index_fields(
+        ("put_code", ("put-code",), to_int),
+        ("title", ("title", "title", "value"), None),
+        ("type", ("type",), None),
+        _ORGANIZATION,
+        ("start_year", ("publication-date", "year", "value"), to_int),
+        ("end_year", ("publication-date", "year", "value"), to_int),
+        ("doi", ("external-ids", "external-id"), first_doi),
+    ),
+    "fundings": _index_fields(
+        ("put_code", ("put-code",), to_int),
+        ("title", ("title", "title", "value"), None),
+        ("type", ("type",), None),
+        _ORGANIZATION,
+        ("start_year", ("start-date", "year", "value"), to_int),
+        ("end_year", ("end-date", "year", "value"), to_int),
+    ),
+    "affiliations": _index_fields(
+        ("put_code", ("put-code",), to_int),
+        ("title", ("role-title",), None),
+        ("type", ("department-name",), None),
+        _ORGANIZATION,
+        ("start_year", ("start-date", "year", "value"), to_int),
+        ("end_year", ("end-date", "year", "value"), to_int),
+    ),
+}
+
+
+def _xml_index_schema(section):
+    '''
+    XML column schema of a section, keeping the original text of the
+    payload as the other index fields do
+    '''
+    return Schema(tuple(
+        Field(field.name, field.path, field.post, deunicode=False)
+        for field in xml_section_schema(section).fields))
+
+
+_XML_INDEX_SCHEMAS = {
+    "works": _xml_index_schema("works"),
+    "fundings": _xml_index_schema("fundings"),
+    "affiliations": _xml_index_schema("employments"),
+}
+
+
+def _parsed_from_xml(section, data):
+    '''
+    Whether a section payload was parsed from XML (e.g. read by
+    OrcidScrapper), whose summaries hold the put-code in an "@put-code"
+    attribute key
+    '''
+    item = next(iter_xml_section_items(section, data), None)
+    return isinstance(item, dict) and "@put-code" in item
+
+
+def _year(date):
+    '''
+    Year of a "MM/YYYY" or "YYYY" date string of a summary record
+    '''
+    return to_int(date.rsplit("/", 1)[-1]) if date else None
+
+
+class RecordStore:
+    '''
+    Embedded SQLite store of harvested ORCID section payloads. Works,
+    fundings and affiliations are indexed by iD, put-code, DOI,
+    organization and year, and stored sections can be served back to
+    Orcid (see its ``store`` argument) without any request. Payloads
+    parsed from XML, as OrcidScrapper reads them, are indexed too.
+    '''
+    def __init__(self, path: str = "pyorcid_records.sqlite") -> None:
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(
+                "CREATE TABLE IF NOT EXISTS payloads ("
+                "orcid_id TEXT, section TEXT, payload BLOB, stored_at REAL, "
+                "PRIMARY KEY (orcid_id, section));"
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "orcid_id TEXT, section TEXT, put_code INTEGER, title TEXT, "
+                "type TEXT, organization TEXT COLLATE NOCASE, "
+                "start_year INTEGER, end_year INTEGER, doi TEXT);"
+                "CREATE INDEX IF NOT EXISTS summaries_id "
+                "ON summaries (orcid_id, section);"
+                "CREATE INDEX IF NOT EXISTS summaries_put_code "
+                "ON summaries (put_code);"
+                "CREATE INDEX IF NOT EXISTS summaries_doi ON summaries (doi);"
+                "CREATE INDEX IF NOT EXISTS summaries_organization "
+                "ON summaries (organization);"
+                "CREATE INDEX IF NOT EXISTS summaries_year "
+                "ON summaries (start_year, end_year);")
+
+    def put(self, orcid_id: str, section: str, payload: Any) -> None:
+        """Store one section payload as returned by the ORCID API and
+        index the summaries it holds.
+
+        A /record or /activities payload also indexes every activity
+        section it embeds, which get() can then serve on their own.
+
+        Args:
+            orcid_id: ORCID iD the payload belongs to
+            section: The section read, e.g. "record" or "works"
+            payload: The payload
+
+        Raises:
+            ValueError: If the section cannot be stored
+        """
+        if section not in STORED_SECTIONS:
+            raise ValueError(f"Section '{section}' cannot be stored.")
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO payloads VALUES (?, ?, ?, ?)",
+                (orcid_id, section, body, time.time()))
+            for name, data in self.__indexed_parts(section, payload):
+                self.__index(orcid_id, name, self.__index_rows(name, data))
+
+    def put_result(self, orcid_id: str, result: dict[str, Any]) -> None:
+        """Store every section of a harvested record, e.g. a result of
+        OrcidBatch.harvest() or OrcidSync.sync(); sections read without
+        success ({} payloads) or not storable are skipped."""
+        for section, payload in result.items():
+            if payload and section in STORED_SECTIONS:
+                self.put(orcid_id, section, payload)
+
+    def put_summaries(
+        self,
+        orcid_id: str,
+        section: str,
+        records: Iterable[Any]
+    ) -> None:
+        """Index extracted summaries instead of a raw payload.
+
+        Args:
+            orcid_id: ORCID iD the summaries belong to
+            section: "works", "fundings" or an affiliation section
+            records: WorkSummary, FundingSummary or AffiliationSummary
+                records, e.g. from work_summaries()
+        """
+        rows = []
+        for record in records:
+            if section == "works":
+                start = end = _year(record.publication_date)
+                title, kind = record.title, record.type
+            else:
+                start, end = _year(record.start_date), _year(record.end_date)
+                if section == "fundings":
+                    title, kind = record.title, record.type
+                else:
+                    title, kind = record.role, record.department
+            rows.append((record.put_code, title, kind, record.organization,
+                         start, end, None))
+        with self._lock, self._connection:
+            self.__index(orcid_id, section, rows)
+
+    def put_columns(
+        self,
+        orcid_id: str,
+        section: str,
+        columns: dict[str, list[Any]]
+    ) -> None:
+        """Index summaries given as columns, as returned by works_table()
+        and the other *_table() accessors or by the dump ingest.
+
+        Args:
+            orcid_id: ORCID iD the summaries belong to
+            section: "works", "fundings" or an affiliation section
+            columns: Dictionary mapping each column name to its values
+        """
+        self.put_columns_many([(orcid_id, section, columns)])
+
+    def put_columns_many(
+        self,
+        items: Iterable[tuple[str, str, dict[str, list[Any]]]]
+    ) -> None:
+        """Index many sections given as columns in one transaction.
+
+        Args:
+            items: (orcid_id, section, columns) tuples, see put_columns()
+        """
+        with self._lock, self._connection:
+            for orcid_id, section, columns in items:
+                self.__index(
+                    orcid_id, section, self.__column_rows(section, columns))
+
+    def get(self, orcid_id: str, section: str) -> Any | None:
+        """Return a stored section payload.
+
+        A section that was not stored on its own is taken from a stored
+        /record (or /activities, /person) payload embedding it.
+
+        Returns:
+            The payload, or None if the store does not hold the section
+        """
+        candidates = [section]
+        if section in ACTIVITY_SECTIONS:
+            candidates += ["activities", "record"]
+        elif section in PERSON_SECTIONS or section == "person":
+            candidates += ["person", "record"]
+        elif section == "activities":
+            candidates.append("record")
+
+        with self._lock:
+            rows = dict(self._connection.execute(
+                f"SELECT section, payload FROM payloads WHERE orcid_id = ? "
+                f"AND section IN ({', '.join('?' * len(candidates))})",
+                (orcid_id, *candidates)).fetchall())
+        for candidate in candidates:
+            if candidate in rows:
+                return self.__embedded(
+                    loads(rows[candidate]), candidate, section)
+        return None
+
+    def find(
+        self,
+        section: str | None = None,
+        orcid_id: str | None = None,
+        put_code: int | None = None,
+        doi: str | None = None,
+        organization: str | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Query the indexed summaries; every given filter must match.
+
+        Args:
+            section: e.g. "works" or "employments"
+            orcid_id: ORCID iD
+            put_code: Put-code of the summary
+            doi: DOI of a work, in any case, with or without resolver
+            organization: Organization name, case-insensitive; SQL LIKE
+                wildcards (%, _) are allowed
+            year_from: First year the summary must overlap (publication
+                year of works, start to end year of the others)
+            year_to: Last year the summary must overlap
+
+        Returns:
+            A list of dictionaries with the orcid_id, section, put_code,
+            title, type, organization, start_year, end_year and doi keys.
+            For affiliations, title is the role title and type the
+            department name.
+        """
+        conditions, parameters = [], []
+        for column, value in (("section", section), ("orcid_id", orcid_id),
+                              ("put_code", put_code),
+                              ("doi", normalize_doi(doi))):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        if organization is not None:
+            conditions.append("organization LIKE ?")
+            parameters.append(organization)
+        if year_from is not None or year_to is not None:
+            conditions.append("start_year IS NOT NULL")
+        if year_to is not None:
+            conditions.append("start_year <= ?")
+            parameters.append(year_to)
+        if year_from is not None:
+            conditions.append("COALESCE(end_year, 9999) >= ?")
+            parameters.append(year_from)
+
+        query = ("SELECT orcid_id, section, " + ", ".join(_INDEX_COLUMNS)
+                 + " FROM summaries")
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            cursor = self._connection.execute(query, parameters)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def orcid_ids(self, **filters: Any) -> list[str]:
+        """Return the distinct iDs with a summary matching the filters of
+        find(), or every stored iD if none is given.
+
+        The filters apply to the indexed columns, where the title and type
+        of an affiliation are its role title and department name.
+        """
+        if not filters:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT DISTINCT orcid_id FROM payloads UNION "
+                    "SELECT DISTINCT orcid_id FROM summaries").fetchall()
+            return sorted(row[0] for row in rows)
+        return sorted({row["orcid_id"] for row in self.find(**filters)})
+
+    def sections(self, orcid_id: str) -> list[str]:
+        """Return the sections stored for an iD (embedded ones excluded)."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT section FROM payloads WHERE orcid_id = ? "
+                "ORDER BY section", (orcid_id,)).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_payloads(
+        self,
+        section: str = "record",
+        page_size: int = 1000
+    ) -> Iterator[tuple[str, bytes]]:
+        """Iterate over the stored payloads of a section, undecoded, in
+        iD order and one page of rows at a time; see
+        orcid_parallel.map_payloads().
+
+        Returns:
+            A generator of (orcid_id, UTF-8 JSON bytes) tuples
+        """
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT orcid_id, payload FROM payloads WHERE section = ? "
+                    "AND orcid_id > ? ORDER BY orcid_id LIMIT ?",
+                    (section, last, page_size)).fetchall()
+            for orcid_id, payload in rows:
+                yield orcid_id, payload
+            if len(rows) < page_size:
+                return
+            last = rows[-1][0]
+
+    def delete(self, orcid_id: str) -> None:
+        """Remove every payload and summary of an iD."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM payloads WHERE orcid_id = ?", (orcid_id,))
+            self._connection.execute(
+                "DELETE FROM summaries WHERE orcid_id = ?", (orcid_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> RecordStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.orcid_ids())
+
+    @staticmethod
+    def __embedded(payload, stored, section):
+        '''
+        Helper function for get(): the part of a stored payload holding
+        the requested section
+        '''
+        if stored == section:
+            return payload
+        if stored == "record":
+            key = ("activities-summary" if section == "activities"
+                   or section in ACTIVITY_SECTIONS else "person")
+            payload = (payload or {}).get(key)
+            stored = "activities" if key == "activities-summary" else "person"
+            if stored == section:
+                return payload
+        key = PERSON_SECTIONS.get(section, section)
+        return (payload or {}).get(key)
+
+    @staticmethod
+    def __indexed_parts(section, payload):
+        '''
+        Helper function for put()
+        return  : the (section, payload) pairs of the indexed sections in
+        a stored payload
+        '''
+        if section == "record":
+            section, payload = "activities", (payload or {}).get(
+                "activities-summary")
+        if section == "activities":
+            payload = payload or {}
+            return [(name, payload[name]) for name in INDEXED_SECTIONS
+                    if name in payload]
+        if section in INDEXED_SECTIONS:
+            return [(section, payload)]
+        return []
+
+    @staticmethod
+    def __index_rows(section, data):
+        '''
+        Helper function for put()
+        return  : the summaries of a section payload (parsed from JSON or
+        XML) as index rows
+        '''
+        if _parsed_from_xml(section, data):
+            schema = _XML_INDEX_SCHEMAS.get(
+                section, _XML_INDEX_SCHEMAS["affiliations"])
+            return RecordStore.__column_rows(section, schema.extract_columns(
+                iter_xml_section_items(section, data)))
+        schema = _INDEX_SCHEMAS.get(section, _INDEX_SCHEMAS["affiliations"])
+        rows = []
+        for item in iter_section_items(section, data or {}):
+            values = schema.extract(item)
+            rows.append(tuple(values.get(name) for name in _INDEX_COLUMNS))
+        return rows
+
+    @staticmethod
+    def __column_rows(section, columns):
+        '''
+        Helper function for put_columns_many()
+        return  : the summaries given as columns as index rows
+        '''
+        if section == "works":
+            keys = ("put-code", "title", "type", "organization",
+                    "publication-year", "publication-year", "doi")
+        elif section == "fundings":
+            keys = ("put-code", "title", "type", "organization",
+                    "start-year", "end-year", "doi")
+        else:
+            keys = ("put-code", "role", "department", "organization",
+                    "start-year", "end-year", "doi")
+        count = len(columns.get("put-code", ()))
+        return list(zip(*(columns.get(key) or [None] * count
+                          for key in keys)))
+
+    def __index(self, orcid_id, section, rows):
+        '''
+        Replaces the index rows of one section of an iD; the caller holds
+        the lock and the transaction
+        '''
+        self._connection.execute(
+            "DELETE FROM summaries WHERE orcid_id = ? AND section = ?",
+            (orcid_id, section))
+        self._connection.executemany(
+            "INSERT INTO summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ((orcid_id, section) + row for row in rows))
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+from typing import Any, Iterable, Iterator, Sequence
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Key paths of the work and funding summaries in the payloads that embed
+# them; "item" stands for every element of an array (as in ijson)
+WORK_SUMMARY_PATHS = {
+    "works": ("group", "item", "work-summary", "item"),
+    "activities": ("works", "group", "item", "work-summary", "item"),
+    "record": ("activities-summary", "works", "group", "item",
+               "work-summary", "item"),
+}
+FUNDING_SUMMARY_PATHS = {
+    "fundings": ("group", "item", "funding-summary", "item"),
+    "activities": ("fundings", "group", "item", "funding-summary", "item"),
+    "record": ("activities-summary", "fundings", "group", "item",
+               "funding-summary", "item"),
+}
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_items(
+    chunks: Iterable[bytes],
+    path: Sequence[str],
+    backend: str = "auto"
+) -> Iterator[Any]:
+    '''
+    Incrementally parses a JSON document arriving in chunks and yields
+    the values found at a key path, one at a time. Only the value being
+    yielded (and the skipped values next to the path) is held in memory,
+    never the whole document.
+    chunks  : the document's bytes, e.g. response.iter_content(65536)
+    path    : keys leading to the values, "item" standing for every
+              element of an array, e.g. ("group", "item", "work-summary",
+              "item")
+    backend : "python" for the built-in scanner, "ijson" for ijson,
+              "auto" for ijson when it is installed
+    return  : a generator of the values
+    raises  : ValueError if the document is not valid JSON
+    '''
+    if backend == "auto":
+        backend = "python" if ijson is None else "ijson"
+    if backend == "ijson":
+        if ijson is None:
+            raise ImportError(
+                "The ijson backend requires ijson. Install it with "
+                "'pip install PyOrcid[streaming]'.")
+        yield from ijson.items(
+            _ChunkFile(chunks), ".".join(path), use_float=True)
+    elif backend == "python":
+        reader = _JsonReader(chunks)
+        yield from _walk(reader, tuple(path), 0)
+        reader.finish()
+    else:
+        raise ValueError(
+            f"Unknown backend '{backend}'. Use 'auto', 'python' or 'ijson'.")
+
+
+def iter_work_summaries(
+    chunks: Iterable[bytes],
+    section: str = "works",
+    backend: str = "auto"
+) -> Iterator[dict[str, Any]]:
+    '''
+    Streams the work-summary objects of a /works, /activities or /record
+    payload
+    section : the section the payload belongs to
+    return  : a generator of work-summary dictionaries
+    '''
+    return iter_json_items(
+        chunks, _summary_path(WORK_SUMMARY_PATHS, section), backend)
+
+
+def iter_funding_summaries(
+    chunks: Iterable[bytes],
+    section: str = "fundings",
+    backend: str = "auto"
+) -> Iterator[dict[str, Any]]:
+    '''
+    Streams the funding-summary objects of a /fundings, /activities or
+    /record payload
+    section : the section the payload belongs to
+    return  : a generator of funding-summary dictionaries
+    '''
+    return iter_json_items(
+        chunks, _summary_path(FUNDING_SUMMARY_PATHS, section), backend)
+
+
+def _summary_path(paths, section):
+    '''
+    Helper function for iter_work_summaries() and iter_funding_summaries()
+    return  : the key path of the summaries in the section
+    raises  : ValueError if the section does not embed the summaries
+    '''
+    try:
+        return paths[section]
+    except KeyError:
+        raise ValueError(
+            f"Section '{section}' cannot be streamed. Use one of "
+            f"{', '.join(paths)}.") from None
+
+
+class _JsonReader:
+    '''
+    Text buffer over a chunked UTF-8 JSON document. Values are decoded
+    with json's raw_decode() as soon as they are complete; the consumed
+    part of the buffer is dropped whenever more input is read.
+    '''
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self):
+        '''
+        Skips whitespace
+        return  : the next character, or '' at the end of the document
+        '''
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill(1):
+                return ''
+
+    def advance(self):
+        '''
+        Consumes the character returned by peek()
+        '''
+        self._pos += 1
+
+    def expect(self, characters):
+        '''
+        Consumes the next character, which must be one of ``characters``
+        return  : the character
+        '''
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r} in the JSON stream, got "
+                f"{character or 'the end of the document'!r}")
+        self._pos += 1
+        return character
+
+    def value(self):
+        '''
+        Decodes the next complete JSON value, reading more input while it
+        is incomplete
+        return  : the value
+        '''
+        self.peek()
+        while True:
+            try:
+                value, end = self._raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise ValueError("Truncated or invalid JSON stream")
+                # Double the buffered input so that long values cost a
+                # linear number of decoding attempts
+                self._fill(max(1, len(self._buffer) - self._pos))
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number at the end of the buffer may continue in the
+                # next chunk
+                if self._fill(1):
+                    continue
+            self._pos = end
+            return value
+
+    def finish(self):
+        '''
+        Checks that nothing but whitespace follows the document
+        '''
+        if self.peek():
+            raise ValueError("Extra data after the JSON document")
+
+    def _fill(self, size):
+        '''
+        Reads at least ``size`` more characters (unless the input ends),
+        dropping the consumed part of the buffer
+        return  : False if no more input is available
+        '''
+        if self._eof:
+            return False
+        remaining = self._buffer[self._pos:]
+        parts = [remaining]
+        read = 0
+        while read < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self._eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            read += len(text)
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return len(self._buffer) > len(remaining)
+
+
+def _walk(reader, path, depth):
+    '''
+    Follows ``path`` from the value at the reader's position, skipping
+    every value off the path
+    return  : a generator of the values at the end of the path
+    '''
+    if depth == len(path):
+        yield reader.value()
+        return
+
+    key = path[depth]
+    character = reader.peek()
+    if key == "item":
+        if character != "[":
+            reader.value()
+            return
+        reader.advance()
+        if reader.peek() == "]":
+            reader.advance()
+            return
+        while True:
+            yield from _walk(reader, path, depth + 1)
+            if reader.expect(",]") == "]":
+                return
+
+    if character != "{":
+        reader.value()
+        return
+    reader.advance()
+    if reader.peek() == "}":
+        reader.advance()
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key:
+            yield from _walk(reader, path, depth + 1)
+        else:
+            reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+class _ChunkFile:
+    '''
+    Minimal binary file object over an iterable of chunks, for ijson
+    '''
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self._pending + b"".join(self._chunks)
+            self._pending = b""
+            return data
+        while len(self._pending) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._pending += chunk
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator
+
+from .orcid_batch import OrcidBatch
+from .orcid_extraction import get_path
+from .orcid_search import MAX_SEARCH_ROWS, OrcidSearch
+from .orcid_transport import OrcidTransport
+
+logger = logging.getLogger(__name__)
+
+# Number of iDs OR-ed together in one profile-last-modified-date query;
+# bounded by the length of the request URL and by Solr's limit of 1024
+# boolean clauses
+DEFAULT_IDS_PER_QUERY = 100
+
+
+def section_hash(payload: Any) -> str:
+    '''
+    Fingerprint of a section payload, independent of key order
+    return  : a hexadecimal digest
+    '''
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"),
+                           ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _solr_date(timestamp):
+    '''
+    Formats a POSIX timestamp for a Solr date range, e.g.
+    "2024-05-01T08:00:00Z"
+    '''
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ")
+
+
+class SyncState:
+    '''
+    SQLite file recording, for every tracked ORCID iD, when it was last
+    synchronized, its last-modified date and the hash of every section
+    read, plus the time of the last complete run
+    '''
+    def __init__(self, path: str = "pyorcid_sync.sqlite") -> None:
+        """Open (or create) the state file.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "orcid_id TEXT PRIMARY KEY, last_modified INTEGER, "
+                "synced_at REAL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sections ("
+                "orcid_id TEXT, section TEXT, hash TEXT, "
+                "PRIMARY KEY (orcid_id, section))")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "key TEXT PRIMARY KEY, value REAL)")
+
+    def track(self, orcid_ids: Iterable[str]) -> None:
+        """Start tracking iDs; the next sync reads them in full."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO records (orcid_id) VALUES (?)",
+                ((orcid_id,) for orcid_id in orcid_ids))
+
+    def untrack(self, orcid_ids: Iterable[str]) -> None:
+        """Stop tracking iDs and forget their hashes."""
+        ids = [(orcid_id,) for orcid_id in orcid_ids]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM records WHERE orcid_id = ?", ids)
+            self._connection.executemany(
+                "DELETE FROM sections WHERE orcid_id = ?", ids)
+
+    def tracked(self) -> list[str]:
+        """Return every tracked iD that has been synchronized once."""
+        return self.__ids("synced_at IS NOT NULL")
+
+    def pending(self) -> list[str]:
+        """Return the tracked iDs never synchronized, or whose last read
+        failed."""
+        return self.__ids("synced_at IS NULL")
+
+    def last_modified(self, orcid_id: str) -> int | None:
+        """Return the last-modified date (ms since the epoch) recorded for
+        an iD."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_modified FROM records WHERE orcid_id = ?",
+                (orcid_id,)).fetchone()
+        return None if row is None else row[0]
+
+    def section_hashes(self, orcid_id: str) -> dict[str, str]:
+        """Return the hash of every section recorded for an iD."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT section, hash FROM sections WHERE orcid_id = ?",
+                (orcid_id,)).fetchall()
+        return dict(rows)
+
+    def mark_synced(
+        self,
+        orcid_id: str,
+        hashes: dict[str, str],
+        last_modified: int | None,
+        synced_at: float
+    ) -> None:
+        """Record a successful read of an iD.
+
+        Args:
+            orcid_id: The iD read
+            hashes: New hash of every section read
+            last_modified: Last-modified date of the record, kept
+                unchanged if None
+            synced_at: Time the read started
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO records (orcid_id, last_modified, synced_at) "
+                "VALUES (?, ?, ?) ON CONFLICT (orcid_id) DO UPDATE SET "
+                "last_modified = COALESCE(excluded.last_modified, "
+                "last_modified), synced_at = excluded.synced_at",
+                (orcid_id, last_modified, synced_at))
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO sections VALUES (?, ?, ?)",
+                ((orcid_id, section, digest)
+                 for section, digest in hashes.items()))
+
+    def mark_pending(self, orcid_id: str) -> None:
+        """Flag an iD to be read again by the next sync."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE records SET synced_at = NULL WHERE orcid_id = ?",
+                (orcid_id,))
+
+    @property
+    def last_run(self) -> float | None:
+        """Start time (POSIX timestamp) of the last complete sync."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'last_run'").fetchone()
+        return None if row is None else row[0]
+
+    @last_run.setter
+    def last_run(self, timestamp: float) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_run', ?)",
+                (timestamp,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> SyncState:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def __ids(self, condition):
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT orcid_id FROM records WHERE {condition} "
+                f"ORDER BY orcid_id").fetchall()
+        return [row[0] for row in rows]
+
+
+class OrcidSync:
+    '''
+    Keeps a local copy of many ORCID records up to date by reading again
+    only the records modified since the last run. Modified records are
+    found with profile-last-modified-date range searches restricted to
+    chunks of the tracked iDs, since the deep-paging limit of the search
+    API rules out listing every profile modified ORCID-wide.
+    '''
+    def __init__(
+        self,
+        sync_state: SyncState | str = "pyorcid_sync.sqlite",
+        orcid_access_token: str = " ",
+        state: str = "public",
+        sandbox: bool = False,
+        sections: Iterable[str] = ("record",),
+        concurrency: int = 8,
+        ids_per_query: int = DEFAULT_IDS_PER_QUERY,
+        overlap: float = 3600,
+        transport: OrcidTransport | None = None
+    ) -> None:
+        """Initialize the sync engine.
+
+        Args:
+            sync_state: SyncState, or the path of its SQLite file
+            orcid_access_token: ORCID access token, which must allow
+                searching (e.g. a /read-public token)
+            state: Whether to use "public" or "member" API of ORCID
+            sandbox: Whether to use ORCID sandbox API for testing
+            sections: ORCID API sections kept in sync for every record
+            concurrency: Maximum number of searches or records read at the
+                same time
+            ids_per_query: Number of iDs per change-detection search
+            overlap: Seconds subtracted from the last run's start time, to
+                cover the delay before ORCID's search index sees a change
+            transport: Transport shared by every request (a private
+                transport is created if None)
+
+        Raises:
+            ValueError: If ids_per_query is not between 1 and 1000
+        """
+        if not 1 <= ids_per_query <= MAX_SEARCH_ROWS:
+            raise ValueError(
+                f"ids_per_query must be between 1 and {MAX_SEARCH_ROWS}.")
+        if isinstance(sync_state, str):
+            sync_state = SyncState(sync_state)
+        self.sync_state = sync_state
+        self._sections = tuple(dict.fromkeys(sections))
+        self._concurrency = concurrency
+        self._ids_per_query = ids_per_query
+        self._overlap = overlap
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = OrcidTransport(pool_maxsize=concurrency)
+        self._transport = transport
+        self._search = OrcidSearch(
+            orcid_access_token, state, sandbox, transport=transport)
+        self._batch = OrcidBatch(
+            orcid_access_token, state, sandbox, sections=self._sections,
+            concurrency=concurrency, transport=transport)
+
+    def track(self, orcid_ids: Iterable[str]) -> None:
+        """Add iDs to keep in sync; see SyncState.track()."""
+        self.sync_state.track(orcid_ids)
+
+    def changed_ids(
+        self,
+        since: float,
+        orcid_ids: Iterable[str] | None = None
+    ) -> list[str]:
+        """Find the iDs whose profile was modified since a given time.
+
+        One search is sent per ``ids_per_query`` iDs, several at a time.
+        The iDs of a search that fails are reported as changed, so that a
+        failure never hides a modification.
+
+        Args:
+            since: POSIX timestamp
+            orcid_ids: iDs to check (every synchronized iD if None)
+
+        Returns:
+            The modified iDs
+        """
+        if orcid_ids is None:
+            orcid_ids = self.sync_state.tracked()
+        orcid_ids = list(orcid_ids)
+        size = self._ids_per_query
+        chunks = [orcid_ids[i:i + size]
+                  for i in range(0, len(orcid_ids), size)]
+        date_range = f"profile-last-modified-date:[{_solr_date(since)} TO *]"
+
+        changed = []
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            for found in executor.map(
+                    lambda chunk: self.__search_chunk(date_range, chunk),
+                    chunks):
+                changed.extend(found)
+        return changed
+
+    def sync(
+        self,
+        since: float | None = None
+    ) -> Iterator[tuple[str, dict[str, Any] | Exception]]:
+        """Read again the records modified since the last complete run.
+
+        Records never synchronized, or whose last read failed, are always
+        read. The state is updated as results are consumed; the run's
+        start time is recorded as the new last run once the generator is
+        exhausted, so an interrupted run is resumed by the next one.
+
+        Args:
+            since: POSIX timestamp to look for modifications from (by
+                default the last run's start time minus the overlap;
+                every tracked record is read if there was no run yet)
+
+        Yields:
+            Tuples of (orcid_id, result) in completion order, where result
+            maps each section whose content changed to its new payload
+            (empty if nothing changed), or is the exception that stopped
+            the read
+        """
+        started = time.time()
+        state = self.sync_state
+        if since is None and state.last_run is not None:
+            since = state.last_run - self._overlap
+
+        orcid_ids = state.pending()
+        if since is None:
+            orcid_ids += state.tracked()
+        else:
+            orcid_ids += self.changed_ids(since)
+        logger.info(f"Synchronizing {len(orcid_ids)} ORCID records")
+
+        for orcid_id, result in self._batch.harvest(
+                dict.fromkeys(orcid_ids)):
+            if isinstance(result, Exception):
+                state.mark_pending(orcid_id)
+                yield orcid_id, result
+                continue
+            yield orcid_id, self.__update(orcid_id, result, started)
+
+        state.last_run = started
+
+    def close(self) -> None:
+        """Close the state file, and the connection pool unless the
+        transport was given by the caller."""
+        self.sync_state.close()
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> OrcidSync:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __search_chunk(self, date_range, orcid_ids):
+        '''
+        Helper function for changed_ids()
+        return  : the iDs of the chunk modified in the date range
+        '''
+        query = f"{date_range} AND orcid:({' OR '.join(orcid_ids)})"
+        page = self._search.search(
+            query, rows=len(orcid_ids), search_mode="search")
+        if page is None:
+            logger.warning(
+                f"Change detection failed for {len(orcid_ids)} iDs; "
+                f"they will be read again")
+            return orcid_ids
+        return [get_path(row, ("orcid-identifier", "path"))
+                for row in page.get("result") or []]
+
+    def __update(self, orcid_id, result, started):
+        '''
+        Helper function for sync(): records the new section hashes of one
+        record. A section without payload keeps its previous hash and
+        leaves the record pending.
+        return  : the changed sections and their payloads
+        '''
+        state = self.sync_state
+        previous = state.section_hashes(orcid_id)
+        hashes, changed = {}, {}
+        for section, payload in result.items():
+            if not payload:
+                continue
+            digest = section_hash(payload)
+            hashes[section] = digest
+            if previous.get(section) != digest:
+                changed[section] = payload
+
+        last_modified = get_path(
+            result.get("record"), ("history", "last-modified-date", "value"))
+        state.mark_synced(orcid_id, hashes, last_modified, started)
+        if len(hashes) < len(result):
+            state.mark_pending(orcid_id)
+        return changed
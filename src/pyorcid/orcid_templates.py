@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import html
+import logging
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class ReportTemplate:
+    '''
+    Layout of a record_summary() page. The text of every part is given
+    once, and the cell lookup of each table shape is compiled once and
+    reused for every row and every page.
+    '''
+    def __init__(
+        self,
+        name: str,
+        extension: str,
+        page: tuple[str, str],
+        section: tuple[str, str],
+        table: tuple[str, str],
+        header: tuple[str, str, str],
+        row: tuple[str, str, str],
+        items: tuple[str, str, str],
+        text: str,
+        empty: str,
+        rule: str | None = None,
+        escape: Callable[[str], str] = str
+    ) -> None:
+        """Define a template.
+
+        Args:
+            name: Name of the template, part of the summary hash of
+                CohortReport's incremental mode
+            extension: Extension of the rendered files, e.g. ".md"
+            page: Text before and after the page; "{title}" is replaced
+                by the researcher's name
+            section: Text before and after each section; "{title}" is
+                replaced by the section name
+            table: Text before and after a table of dictionaries
+            header: Start, cell separator and end of the header row
+            row: Start, cell separator and end of every other row
+            items: Text before a list, format of each item ("{item}")
+                and text after the list
+            text: Format of a single value ("{text}")
+            empty: Text of an empty list
+            rule: Cell of a separator row written after the header, or
+                None for no separator row
+            escape: Escapes every value (and title) rendered
+        """
+        self.name = name
+        self.extension = extension
+        self._page = page
+        self._section = section
+        self._table = table
+        self._header = header
+        self._row = row
+        self._items = items
+        self._text = text
+        self._empty = empty
+        self._rule = rule
+        self._escape = escape
+
+    def render(self, summary: dict[str, Any]) -> Iterator[str]:
+        '''
+        Renders a summary as returned by record_summary()
+        return  : a generator of text chunks, to be written in order
+        '''
+        escape = self._escape
+        yield self._page[0].format(title=escape(_title(summary)))
+        for section, content in summary.items():
+            yield self._section[0].format(title=escape(section))
+            if isinstance(content, list):
+                if not content:
+                    yield self._empty
+                elif isinstance(content[0], dict):
+                    yield self.__table(content)
+                else:
+                    yield self._items[0]
+                    for item in content:
+                        yield self._items[1].format(item=escape(str(item)))
+                    yield self._items[2]
+            else:
+                yield self._text.format(text=escape(str(content)))
+            yield self._section[1]
+        yield self._page[1]
+
+    def render_text(self, summary: dict[str, Any]) -> str:
+        '''
+        return  : the whole rendered page
+        '''
+        return "".join(self.render(summary))
+
+    def __table(self, content):
+        '''
+        Renders a list of dictionaries, with the keys of the first one as
+        columns
+        return  : the rendered table
+        '''
+        keys = tuple(content[0].keys())
+        escape = self._escape
+        start, separator, end = self._header
+        parts = [self._table[0],
+                 start + separator.join(map(escape, keys)) + end]
+
+        start, separator, end = self._row
+        if self._rule is not None:
+            parts.append(start + separator.join([self._rule] * len(keys)) + end)
+        values = _row_getter(keys)
+        if escape is str:
+            parts.extend(start + separator.join(map(str, values(item))) + end
+                         for item in content)
+        else:
+            parts.extend(
+                start + separator.join([escape(str(value))
+                                        for value in values(item)]) + end
+                for item in content)
+        parts.append(self._table[1])
+        return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def _row_getter(keys):
+    '''
+    Compiled lookup of the cells of a table row: the values of the keys,
+    in order, as a tuple
+    '''
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda item: (item[key],)
+    return itemgetter(*keys)
+
+
+def _title(summary):
+    '''
+    Name of the researcher a summary belongs to
+    '''
+    name = " ".join(part for part in (summary.get('Name'),
+                                      summary.get('Family Name')) if part)
+    return name or summary.get('ORCiD ID') or ""
+
+
+# The page generate_markdown_file() has always written
+MARKDOWN_TEMPLATE = ReportTemplate(
+    name="markdown",
+    extension=".md",
+    page=("", ""),
+    section=("## {title}\n\n", "\n"),
+    table=("", ""),
+    header=("| ", " | ", " |\n"),
+    row=("| ", " | ", " |\n"),
+    items=("", "- {item}\n", ""),
+    text="{text}\n",
+    empty="No data available.\n",
+    rule="---",
+)
+
+HTML_TEMPLATE = ReportTemplate(
+    name="html",
+    extension=".html",
+    page=('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+          '<title>{title}</title>\n</head>\n<body>\n<h1>{title}</h1>\n',
+          '</body>\n</html>\n'),
+    section=("<h2>{title}</h2>\n", ""),
+    table=("<table>\n", "</table>\n"),
+    header=("<tr><th>", "</th><th>", "</th></tr>\n"),
+    row=("<tr><td>", "</td><td>", "</td></tr>\n"),
+    items=("<ul>\n", "<li>{item}</li>\n", "</ul>\n"),
+    text="<p>{text}</p>\n",
+    empty="<p>No data available.</p>\n",
+    escape=html.escape,
+)
+
+REPORT_TEMPLATES = {"markdown": MARKDOWN_TEMPLATE, "html": HTML_TEMPLATE}
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterable
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Documented limits of the ORCID public API, per client IP
+PUBLIC_API_RATE = 24
+PUBLIC_API_BURST = 40
+
+
+class RateLimiter:
+    '''
+    Thread-safe token bucket shared by every client that should count
+    against the same request budget
+    '''
+    def __init__(
+        self,
+        rate: float = PUBLIC_API_RATE,
+        burst: int = PUBLIC_API_BURST
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Sustained number of requests per second
+            burst: Number of requests that may be sent back to back
+
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, possibly from the future.
+
+        Returns:
+            Number of seconds the caller must wait before sending
+        """
+        with self._lock:
+            self.__refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be
+        sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds``, e.g. after a 429.
+
+        Args:
+            seconds: Time during which no token is handed out
+        """
+        with self._lock:
+            self.__refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RetryPolicy:
+    '''
+    Retries throttled or failed requests with exponential backoff and
+    full jitter, honouring the server's Retry-After header
+    '''
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        jitter: bool = True
+    ) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Total number of attempts, including the first
+            backoff_factor: Backoff before the second attempt; doubled for
+                every further attempt
+            max_backoff: Upper bound of every delay in seconds, including
+                the one asked for by a Retry-After header
+            retry_statuses: HTTP status codes that are retried
+            jitter: Whether to draw the backoff uniformly from
+                [0, computed backoff] to spread out concurrent retries
+
+        Raises:
+            ValueError: If max_attempts is lower than 1
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.jitter = jitter
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Return the delay before the attempt following ``attempt``.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Value of the response's Retry-After header
+
+        Returns:
+            Delay in seconds, at most max_backoff
+        """
+        delay = _parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.max_backoff)
+
+        delay = min(self.max_backoff,
+                    self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def call(
+        self,
+        send: Callable[[], Any],
+        rate_limiter: RateLimiter | None = None,
+        exceptions: tuple[type[BaseException], ...] = (
+            requests.ConnectionError, requests.Timeout)
+    ) -> Any:
+        """Send a request, retrying it according to the policy.
+
+        Args:
+            send: Function sending the request and returning the response
+            rate_limiter: Limiter every attempt waits for
+            exceptions: Transport errors that are retried
+
+        Returns:
+            The first response that is not retried, or the last one
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                response = send()
+            except exceptions as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(
+                    f"Request failed ({e}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_attempts})")
+                time.sleep(delay)
+                continue
+
+            delay = self.__retry_delay(attempt, response, rate_limiter)
+            if delay is None:
+                return response
+            # Hand the connection of a streamed response back to the pool
+            response.close()
+            time.sleep(delay)
+        return response
+
+    async def acall(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        rate_limiter: RateLimiter | None = None,
+        exceptions: tuple[type[BaseException], ...] = ()
+    ) -> Any:
+        """Asyncio version of call()."""
+        for attempt in range(1, self.max_attempts + 1):
+            if rate_limiter is not None:
+                await rate_limiter.acquire_async()
+            try:
+                response = await send()
+            except exceptions as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(
+                    f"Request failed ({e}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_attempts})")
+                await asyncio.sleep(delay)
+                continue
+
+            delay = self.__retry_delay(attempt, response, rate_limiter)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return response
+
+    def __retry_delay(self, attempt, response, rate_limiter):
+        '''
+        Decides whether a response is retried
+        return  : the delay before the next attempt, or None to return
+        the response
+        '''
+        status_code = response.status_code
+        if (status_code not in self.retry_statuses
+                or attempt == self.max_attempts):
+            return None
+
+        delay = self.backoff(attempt, response.headers.get("Retry-After"))
+        if status_code == 429 and rate_limiter is not None:
+            # Slow every client sharing the limiter down, not just this one
+            rate_limiter.penalize(delay)
+        logger.warning(
+            f"Received HTTP {status_code}, retrying in {delay:.1f}s "
+            f"(attempt {attempt}/{self.max_attempts})")
+        return delay
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    '''
+    Converts a Retry-After header (delay-seconds or HTTP-date) to seconds
+    return  : the delay, or None if the header is missing or malformed
+    '''
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+
+# Status codes with which ORCID rejects an access token
+_REJECTED_STATUSES = (401, 403)
+
+# Status codes proving the token works: 404 is an empty profile
+_ACCEPTED_STATUSES = (200, 404)
+
+# Resource rejections kept before the expired ones are dropped
+_MAX_REJECTED = 4096
+
+
+class TokenValidationCache:
+    '''
+    Process-wide record of which access tokens ORCID accepted or rejected,
+    per (token, state, sandbox). Clients validate their token lazily from
+    the first real response and share the outcome through this cache, so
+    constructing a client never costs a request.
+
+    A token is accepted process-wide by a 200 (or a 404 for an empty
+    profile). A 401/403 answered for a record or section may only mean
+    that resource is restricted, so it is kept for that resource alone;
+    only a dedicated token check (no resource) rejects the token for
+    every client.
+    '''
+    def __init__(self, ttl: float = 3600) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a validation result is trusted
+        """
+        self.ttl = ttl
+        self._results: dict[tuple[str, str, bool], tuple[bool, float]] = {}
+        self._rejected: dict[tuple[str, str, bool, str], float] = {}
+        self._lock = threading.Lock()
+
+    def check(
+        self,
+        token: str,
+        state: str,
+        sandbox: bool,
+        status_code: int | None = None,
+        resource: str | None = None
+    ) -> bool | None:
+        """Look up a token, or record the outcome of a response.
+
+        Args:
+            token: ORCID access token
+            state: "public" or "member" API
+            sandbox: Whether the sandbox API is used
+            status_code: Status of a response obtained with the token;
+                None to only look the token up
+            resource: What the response was for, e.g. "{orcid_id}/works";
+                None for a dedicated token check, whose rejection holds
+                for every resource
+
+        Returns:
+            True if the token is valid, False if it was rejected (for the
+            resource), None if unknown (not cached, expired, or the
+            response is inconclusive, e.g. a 429 or a 5xx)
+        """
+        key = (hashlib.sha256(token.encode("utf-8")).hexdigest(),
+               state, bool(sandbox))
+        now = time.monotonic()
+
+        with self._lock:
+            if status_code is None:
+                cached = self._results.get(key)
+                if cached is not None and now - cached[1] < self.ttl:
+                    return cached[0]
+                rejected_at = self._rejected.get((*key, resource))
+                if rejected_at is not None and now - rejected_at < self.ttl:
+                    return False
+                return None
+
+            if status_code in _ACCEPTED_STATUSES:
+                self._results[key] = (True, now)
+                return True
+            if status_code not in _REJECTED_STATUSES:
+                return None
+            if resource is None:
+                self._results[key] = (False, now)
+            else:
+                self.__prune(now)
+                self._rejected[(*key, resource)] = now
+            return False
+
+    def clear(self) -> None:
+        """Forget every validation result."""
+        with self._lock:
+            self._results.clear()
+            self._rejected.clear()
+
+    def __prune(self, now):
+        '''
+        Drops the expired resource rejections once there are many of them
+        '''
+        if len(self._rejected) < _MAX_REJECTED:
+            return
+        for key, rejected_at in list(self._rejected.items()):
+            if now - rejected_at >= self.ttl:
+                del self._rejected[key]
+
+
+# Shared by every client of the process
+token_validation_cache = TokenValidationCache()
+
+
+def needs_validation(token: str) -> bool:
+    '''
+    Whether a token was given at all (" " is the "no token" default)
+    return  : True if the token has to be validated
+    '''
+    return bool(token.strip()) and token != " "
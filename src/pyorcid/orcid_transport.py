@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Iterable, Mapping
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .orcid_cache import ResponseCache
+from .orcid_metrics import MetricsHook, RequestEvent, emit
+from .orcid_singleflight import SingleFlight, flight_key
+from .orcid_throttle import RateLimiter, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# RequestEvent of the instrumented request the current thread is sending,
+# where the pooled connections add their connect time
+_current = threading.local()
+
+
+class TransportStats:
+    '''
+    Thread-safe per-host counters of requests sent and connections opened
+    by an OrcidTransport
+    '''
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests: defaultdict[str, int] = defaultdict(int)
+        self._connections: defaultdict[str, int] = defaultdict(int)
+
+    def request_sent(self, host: str) -> None:
+        with self._lock:
+            self._requests[host] += 1
+
+    def connection_opened(self, host: str) -> None:
+        with self._lock:
+            self._connections[host] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, in total and per host.
+
+        Returns:
+            Dictionary with "requests", "connections_opened" and
+            "connections_reused" totals and a "hosts" breakdown
+        """
+        with self._lock:
+            hosts = {
+                host: self.__counters(
+                    self._requests[host], self._connections[host])
+                for host in sorted(set(self._requests) | set(self._connections))
+            }
+            totals = self.__counters(
+                sum(self._requests.values()), sum(self._connections.values()))
+        totals["hosts"] = hosts
+        return totals
+
+    @staticmethod
+    def __counters(requests_sent, connections_opened):
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": max(0, requests_sent - connections_opened),
+        }
+
+
+class _CountingAdapter(HTTPAdapter):
+    '''
+    HTTPAdapter whose connection pools report every new connection to a
+    TransportStats
+    '''
+    def __init__(self, stats: TransportStats, **kwargs: Any) -> None:
+        self._pool_classes = _counting_pool_classes(stats)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        manager.pool_classes_by_scheme = self._pool_classes
+        return manager
+
+
+def _timed_connect(connect):
+    '''
+    Wraps the connect() of a connection class to add the time spent
+    opening the connection to the current thread's RequestEvent
+    '''
+    def timed(self):
+        event = getattr(_current, "event", None)
+        if event is None:
+            return connect(self)
+        start = time.perf_counter()
+        try:
+            return connect(self)
+        finally:
+            event.connect = ((event.connect or 0.0)
+                             + time.perf_counter() - start)
+    return timed
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    connect = _timed_connect(HTTPConnection.connect)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    connect = _timed_connect(HTTPSConnection.connect)
+
+
+def _counting_pool_classes(stats):
+    '''
+    Builds urllib3 connection pool classes that count new connections and
+    time how long they take to open
+    return  : a dictionary mapping URL schemes to pool classes
+    '''
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = _TimedHTTPConnection
+
+        def _new_conn(self):
+            stats.connection_opened(self.host)
+            return super()._new_conn()
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = _TimedHTTPSConnection
+
+        def _new_conn(self):
+            stats.connection_opened(self.host)
+            return super()._new_conn()
+
+    return {
+        "http": CountingHTTPConnectionPool,
+        "https": CountingHTTPSConnectionPool,
+    }
+
+
+class OrcidTransport:
+    '''
+    Keep-alive HTTP transport shared by Orcid, OrcidSearch, OrcidScrapper
+    and OrcidAuthentication. Every request of a client constructed with
+    the transport goes through its connection pool, response cache, rate
+    limiter and retry policy.
+    '''
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        host_pool_maxsize: Mapping[str, int] | None = None,
+        timeout: float = 30,
+        proxies: Mapping[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        hooks: Iterable[MetricsHook] | None = None,
+        singleflight: SingleFlight | None = None
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            pool_maxsize: Number of kept-alive connections per host
+            host_pool_maxsize: Per-host overrides of pool_maxsize, e.g.
+                {"pub.orcid.org": 32}
+            timeout: Default timeout of every request in seconds
+            proxies: Proxy URLs by scheme, as accepted by requests
+            cache: Response cache GET requests are read through
+                (no caching if None)
+            rate_limiter: Rate limiter every request waits for
+                (no limit if None)
+            retry: Retry policy for throttled or failed requests
+                (a single attempt if None)
+            hooks: Metrics hooks receiving a RequestEvent for every
+                request, and a DecodeEvent for every body decoded by the
+                clients using the transport (see orcid_metrics)
+            singleflight: Group coalescing identical GET requests in
+                flight, e.g. one shared by many transports: callers of
+                the same URL with the same token wait for the first one's
+                response instead of sending their own (no coalescing if
+                None). Streamed requests are never coalesced.
+        """
+        self.session = requests.Session()
+        if proxies:
+            self.session.proxies.update(proxies)
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.hooks = list(hooks or ())
+        self.singleflight = singleflight
+        self.stats = TransportStats()
+        self._lock = threading.Lock()
+        self._pool_maxsize = 0
+
+        self.ensure_pool_size(pool_maxsize)
+        for host, size in (host_pool_maxsize or {}).items():
+            self.session.mount(f"https://{host}", self.__adapter(size))
+
+    def ensure_pool_size(self, size: int) -> None:
+        """Grow the default connection pools to at least ``size``
+        connections per host. Hosts given in host_pool_maxsize keep their
+        own pool.
+
+        Args:
+            size: Number of concurrent requests the pool must serve
+        """
+        with self._lock:
+            if size <= self._pool_maxsize:
+                return
+            replaced = {id(adapter): adapter for adapter in (
+                self.session.adapters.get("https://"),
+                self.session.adapters.get("http://")) if adapter is not None}
+            adapter = self.__adapter(size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self._pool_maxsize = size
+            # Requests in flight on the old pools finish normally; their
+            # connections are discarded instead of returned to the pool
+            for old in replaced.values():
+                old.close()
+
+    def get(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        section: str = "",
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send a GET request.
+
+        Args:
+            url: Requested URL
+            headers: Request headers
+            section: ORCID section name, used to pick the cache TTL
+            **kwargs: Extra arguments for requests (timeout, stream, ...)
+
+        Returns:
+            The response; streamed requests bypass the cache
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if self.hooks:
+            event = RequestEvent("GET", url, section,
+                                 streamed=bool(kwargs.get("stream")))
+            if self.cache is not None:
+                # Overwritten by __send if a request goes out
+                event.cache = "bypass" if event.streamed else "hit"
+            return self.__instrumented(
+                event, lambda: self.__read(url, headers, section, kwargs))
+        return self.__read(url, headers, section, kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request.
+
+        Args:
+            url: Requested URL
+            **kwargs: Extra arguments for requests (data, headers, ...)
+
+        Returns:
+            The response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if self.hooks:
+            event = RequestEvent("POST", url, streamed=bool(kwargs.get("stream")))
+            return self.__instrumented(
+                event, lambda: self.__send("post", url, kwargs))
+        return self.__send("post", url, kwargs)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
+
+    def __enter__(self) -> OrcidTransport:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __read(self, url, headers, section, kwargs):
+        '''
+        Sends a GET request through the singleflight group and the cache,
+        unless it is streamed
+        return  : the response, shared with the coalesced callers
+        '''
+        if self.singleflight is None or kwargs.get("stream"):
+            return self.__cached(url, headers, section, kwargs)
+        response, shared = self.singleflight.do(
+            flight_key(url, headers),
+            lambda: self.__cached(url, headers, section, kwargs))
+        event = getattr(_current, "event", None)
+        if shared and event is not None:
+            event.cache = "coalesced"
+        return response
+
+    def __cached(self, url, headers, section, kwargs):
+        if self.cache is not None and not kwargs.get("stream"):
+            return self.cache.get(
+                self.__get, url, headers=headers, section=section, **kwargs)
+        return self.__get(url, headers=headers, **kwargs)
+
+    def __get(self, url, **kwargs):
+        return self.__send("get", url, kwargs)
+
+    def __instrumented(self, event, send):
+        '''
+        Sends a request with its RequestEvent as the current thread's, and
+        emits the event to the hooks once the response was received
+        return  : the response
+        '''
+        previous = getattr(_current, "event", None)
+        _current.event = event
+        start = time.perf_counter()
+        try:
+            response = send()
+            event.status_code = response.status_code
+            return response
+        except Exception as e:
+            event.error = type(e).__name__
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - start
+            _current.event = previous
+            emit(self.hooks, "on_request", event)
+
+    def __send(self, method, url, kwargs):
+        '''
+        Sends a request through the rate limiter and retry policy
+        return  : the response
+        '''
+        host = urlsplit(url).hostname or ""
+
+        def send():
+            self.stats.request_sent(host)
+            event = getattr(_current, "event", None)
+            if event is None:
+                return getattr(self.session, method)(url, **kwargs)
+            return self.__timed_attempt(event, method, url, kwargs)
+
+        if self.retry is not None:
+            return self.retry.call(send, self.rate_limiter)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return send()
+
+    def __timed_attempt(self, event, method, url, kwargs):
+        '''
+        Sends one attempt of an instrumented request, splitting its time
+        into connect, time to first byte and download. requests reads the
+        body of a non-streamed response before returning it, so download
+        is the time after response.elapsed (sent to headers parsed).
+        return  : the response
+        '''
+        event.attempts += 1
+        event.connect = 0.0
+        start = time.perf_counter()
+        response = getattr(self.session, method)(url, **kwargs)
+        total = time.perf_counter() - start
+        headers = response.elapsed.total_seconds()
+        event.ttfb = max(0.0, headers - event.connect)
+        if event.streamed:
+            event.download = None
+        else:
+            event.download = max(0.0, total - headers)
+            event.bytes_received = ((event.bytes_received or 0)
+                                    + len(response.content or b""))
+        if event.cache is not None and not event.streamed:
+            event.cache = ("revalidated" if response.status_code == 304
+                           else "miss")
+        return response
+
+    def __adapter(self, size):
+        return _CountingAdapter(
+            self.stats, pool_connections=4, pool_maxsize=size)
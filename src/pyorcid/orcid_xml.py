@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable, Iterator, Union
+from xml.etree.ElementTree import XMLPullParser
+
+logger = logging.getLogger(__name__)
+
+# An XML document as bytes or a memoryview, text, a binary file object or
+# byte chunks
+XmlSource = Union[bytes, memoryview, str, Any, Iterable[bytes]]
+
+_CHUNK_SIZE = 65536
+
+
+def parse_xml(source: XmlSource) -> dict[str, Any]:
+    '''
+    Parses an ORCID XML document into the dictionary xmltodict would build,
+    with namespace prefixes stripped from element and attribute names and
+    namespace declarations left out, in a single pass. Elements are
+    discarded from the XML tree as soon as they are converted.
+    source  : bytes (or a memoryview), text, a binary file object, or an
+              iterable of byte chunks (e.g. response.iter_content())
+    return  : a dictionary with the root element name (e.g. "record") as
+    its only key
+    raises  : xml.etree.ElementTree.ParseError if the XML is malformed
+    '''
+    result = {}
+    for name, value in _convert(source, None):
+        result[name] = value
+    return result
+
+
+def iter_xml_elements(source: XmlSource, name: str) -> Iterator[Any]:
+    '''
+    Streams every element called ``name`` (without namespace prefix, e.g.
+    "work-summary" or "affiliation-group") out of an XML document, each
+    converted as parse_xml() would. Memory stays proportional to one
+    element.
+    source  : see parse_xml()
+    return  : a generator of the converted elements
+    '''
+    for _, value in _convert(source, name):
+        yield value
+
+
+def _local_name(name):
+    '''
+    Strips the namespace ElementTree prefixes names with ("{uri}name")
+    '''
+    return name.rsplit("}", 1)[-1]
+
+
+def _chunks(source):
+    '''
+    Normalizes an XML source into an iterator of chunks. In-memory
+    documents are sliced too, so that the parser never queues the events
+    of the whole document at once.
+    '''
+    if isinstance(source, (bytes, bytearray, memoryview, str)):
+        for start in range(0, len(source), _CHUNK_SIZE):
+            yield source[start:start + _CHUNK_SIZE]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def _convert(source, stream_name):
+    '''
+    Converts the document bottom-up while it is being parsed. Each open
+    element has a frame [element, children, text parts, last child]; when
+    an element ends, its value is added to the parent frame (or yielded if
+    it is called stream_name) and the element is dropped from the tree.
+    return  : a generator of (name, value) tuples for the streamed
+    elements, or for the root element if stream_name is None
+    '''
+    parser = XMLPullParser(events=("start", "end"))
+    stack = []
+
+    for chunk in _chunks(source):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                if stack:
+                    _flush_tail(stack[-1])
+                stack.append([element, {}, [], None])
+                continue
+
+            frame = stack.pop()
+            _flush_tail(frame)
+            name = _local_name(element.tag)
+            value = _element_value(element, frame)
+            # clear() also resets the tail, which may already be parsed
+            tail = element.tail
+            element.clear()
+            element.tail = tail
+
+            if not stack:
+                if stream_name is None:
+                    yield name, value
+                continue
+
+            parent = stack[-1]
+            parent[3] = element
+            # Drop the converted child from the tree
+            del parent[0][:]
+            if name == stream_name:
+                yield name, value
+            else:
+                _add_child(parent[1], name, value)
+    parser.close()
+
+
+def _flush_tail(frame):
+    '''
+    Collects the text following the frame's last converted child
+    '''
+    last_child = frame[3]
+    if last_child is not None:
+        if last_child.tail:
+            frame[2].append(last_child.tail)
+        frame[3] = None
+
+
+def _element_value(element, frame):
+    '''
+    Value of an element, following xmltodict: text-only elements become
+    their text (None if empty), others a dictionary of "@" attributes,
+    children and "#text"
+    '''
+    _, children, texts, _ = frame
+    if element.text:
+        texts.insert(0, element.text)
+    text = "".join(texts).strip() or None
+
+    if not element.attrib and not children:
+        return text
+
+    value = {
+        f"@{_local_name(key)}": attribute
+        for key, attribute in element.attrib.items()
+    }
+    value.update(children)
+    if text is not None:
+        value["#text"] = text
+    return value
+
+
+def _add_child(children, name, value):
+    '''
+    Adds a converted child to its parent, turning repeated names into lists
+    '''
+    if name not in children:
+        children[name] = value
+    elif isinstance(children[name], list):
+        children[name].append(value)
+    else:
+        children[name] = [children[name], value]
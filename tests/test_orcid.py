@@ -1,7 +1,38 @@
 import unittest
 from unittest.mock import Mock, patch
+
+import requests
+
 from src.pyorcid import Orcid
 
+SAMPLE_RECORD = {
+    "history": {"last-modified-date": {"value": 1700000000000}},
+    "person": {
+        "name": {"given-names": {"value": "Sri"},
+                 "family-name": {"value": "S"}},
+        "other-names": {"other-name": []},
+        "emails": {"email": []},
+        "keywords": {"keyword": []},
+    },
+    "activities-summary": {
+        "employments": {"affiliation-group": [{"summaries": [{
+            "employment-summary": {
+                "role-title": "Researcher",
+                "start-date": {"year": {"value": "2020"},
+                               "month": {"value": "01"}},
+                "organization": {
+                    "name": "Example University",
+                    "address": {"city": "Ames", "country": "US"}},
+            }}]}]},
+        "fundings": {"group": []},
+        "works": {"group": [{"work-summary": [{
+            "title": {"title": {"value": "A study"}},
+            "type": "journal-article",
+        }]}]},
+    },
+}
+
+
 class TestOrcid(unittest.TestCase):
 
     MY_ORCID_ID = "0009-0004-5301-6863"
@@ -35,7 +66,95 @@ class TestOrcid(unittest.TestCase):
         record = orc._Orcid__test_record()
         self.assertEqual(record, {"data": "full_record_data"})
 
+    def test_record_summary_single_fetch(self):
+        # The summary is built from the activities embedded in /record
+        orc = Orcid(self.MY_ORCID_ID)
+        orc._transport.session = Mock()
+        orc._transport.session.get.return_value.json.return_value = SAMPLE_RECORD
+        summary = orc.record_summary()
+        self.assertEqual(orc._transport.session.get.call_count, 1)
+        self.assertEqual(summary['Name'], "Sri")
+        self.assertEqual(summary['Employment'][0]['organization'],
+                         "Example University")
+        self.assertEqual(summary['Employment'][0]['start-date'], "01/2020")
+        self.assertEqual(summary['Works'][0]['title'], "A study")
+        self.assertEqual(summary['Fundings'], [])
+
+    def test_record_summary_per_section(self):
+        # The per-section fallback reads every activity section
+        orc = Orcid(self.MY_ORCID_ID)
+        orc._transport.session = Mock()
+        orc._transport.session.get.return_value.json.return_value = SAMPLE_RECORD
+        orc.record_summary(per_section=True)
+        self.assertEqual(orc._transport.session.get.call_count,
+                         1 + len(Orcid.ACTIVITY_SECTIONS))
+
+    def test_fetch_sections_isolates_failures(self):
+        # A failing section does not prevent the others from being read
+        orc = Orcid(self.MY_ORCID_ID)
+
+        def fake_read(section):
+            if section == "fundings":
+                raise requests.ConnectionError("boom")
+            return {"group": [], "path": section}
+
+        orc._Orcid__read_section = fake_read
+        data = orc.fetch_sections(["works", "fundings", "employments"])
+        self.assertEqual(list(data), ["works", "fundings", "employments"])
+        self.assertEqual(data["fundings"], {})
+        self.assertEqual(orc.works(data["works"]), ([], data["works"]))
+
+    def test_fetch_sections_raises_token_errors(self):
+        # A rejected token is not reported as an empty profile
+        orc = Orcid(self.MY_ORCID_ID)
+        response = Mock(status_code=401)
+
+        def fake_read(section):
+            if section == "fundings":
+                raise requests.HTTPError("unauthorized", response=response)
+            return {"group": []}
+
+        orc._Orcid__read_section = fake_read
+        with self.assertRaises(requests.HTTPError):
+            orc.fetch_sections(["works", "fundings"])
+
+        def rejected(section):
+            raise ValueError("Invalid access token!")
+
+        orc._Orcid__read_section = rejected
+        with self.assertRaises(ValueError):
+            orc.fetch_sections(["works"])
+
+    def test_work_details_reads_put_codes_in_bulk(self):
+        orc = Orcid(self.MY_ORCID_ID)
+        urls = []
+
+        def fake_get(url, **kwargs):
+            urls.append(url)
+            response = Mock()
+            response.status_code = 200
+            if url.endswith("/works"):
+                response.json.return_value = {"group": [{"work-summary": [
+                    {"put-code": code} for code in range(250)]}]}
+            else:
+                codes = url.rsplit("/", 1)[1].split(",")
+                response.json.return_value = {"bulk": [
+                    {"work": {"put-code": int(code)}} for code in codes
+                ] + [{"error": {"developer-message": "gone"}}]}
+            return response
+
+        orc._transport.session = Mock()
+        orc._transport.session.get.side_effect = fake_get
+        works = list(orc.work_details(max_workers=2))
+        self.assertEqual(sorted(work["put-code"] for work in works),
+                         list(range(250)))
+        # One /works read and three bulk reads of up to 100 put-codes
+        self.assertEqual(len(urls), 4)
+        with self.assertRaises(ValueError):
+            list(orc.work_details([1], batch_size=101))
+
     # Add other integration tests if needed
 
+
 if __name__ == '__main__':
     unittest.main()
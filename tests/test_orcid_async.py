@@ -0,0 +1,150 @@
+import unittest
+
+from src.pyorcid import AsyncOrcid, AsyncOrcidSearch
+from src.pyorcid.orcid_async import httpx
+from tests.test_orcid import SAMPLE_RECORD
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncOrcid(unittest.IsolatedAsyncioTestCase):
+
+    MY_ORCID_ID = "0009-0004-5301-6863"
+
+    def client(self, handler):
+        self.requested = []
+
+        def record_request(request):
+            self.requested.append(request.url.path)
+            return handler(request)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(record_request))
+
+    async def test_record_summary(self):
+        client = self.client(
+            lambda request: httpx.Response(200, json=SAMPLE_RECORD))
+        orc = AsyncOrcid(self.MY_ORCID_ID, client=client)
+        summary = await orc.record_summary()
+        self.assertEqual(self.requested, [f"/v3.0/{self.MY_ORCID_ID}/record"])
+        self.assertEqual(summary['Works'][0]['title'], "A study")
+        await client.aclose()
+
+    async def test_fetch_sections_isolates_failures(self):
+        def handler(request):
+            if request.url.path.endswith("/fundings"):
+                return httpx.Response(500, text="error")
+            return httpx.Response(200, json={"group": []})
+
+        client = self.client(handler)
+        orc = AsyncOrcid(self.MY_ORCID_ID, client=client)
+        data = await orc.fetch_sections(["works", "fundings"])
+        self.assertEqual(data, {"works": {"group": []}, "fundings": {}})
+        self.assertEqual(await orc.works(data["works"]), ([], {"group": []}))
+        await client.aclose()
+
+    async def test_fetch_sections_raises_auth_errors(self):
+        def handler(request):
+            if request.url.path.endswith("/fundings"):
+                return httpx.Response(403, text="forbidden")
+            return httpx.Response(200, json={"group": []})
+
+        client = self.client(handler)
+        orc = AsyncOrcid(self.MY_ORCID_ID, client=client)
+        # The token counts as validated, so a 403 is an auth failure
+        orc._token_validated = True
+        with self.assertRaises(httpx.HTTPStatusError):
+            await orc.fetch_sections(["works", "fundings"])
+        await client.aclose()
+
+    async def test_work_details(self):
+        def handler(request):
+            codes = request.url.path.rsplit("/", 1)[1].split(",")
+            return httpx.Response(200, json={"bulk": [
+                {"work": {"put-code": int(code)}} for code in codes]})
+
+        client = self.client(handler)
+        orc = AsyncOrcid(self.MY_ORCID_ID, client=client)
+        works = [work async for work in orc.work_details(
+            range(150), max_workers=2)]
+        self.assertEqual(sorted(work["put-code"] for work in works),
+                         list(range(150)))
+        self.assertEqual(len(self.requested), 2)
+        await client.aclose()
+
+    async def test_search(self):
+        client = self.client(
+            lambda request: httpx.Response(200, json={"num-found": 0}))
+        orc_search = AsyncOrcidSearch(client=client)
+        self.assertEqual(await orc_search.search("Smith"), {"num-found": 0})
+        self.assertEqual(self.requested, ["/v3.0/expanded-search/"])
+        await client.aclose()
+
+    async def test_iter_search(self):
+        def handler(request):
+            start = int(request.url.params["start"])
+            rows = int(request.url.params["rows"])
+            if start >= 20:
+                return httpx.Response(500, text="error")
+            found = range(start, min(start + rows, 25))
+            return httpx.Response(200, json={
+                "num-found": 25,
+                "expanded-result": [{"orcid-id": str(i)} for i in found]})
+
+        client = self.client(handler)
+        orc_search = AsyncOrcidSearch(client=client)
+        rows = [row async for row in orc_search.iter_search(
+            "Smith", page_size=10, max_results=12)]
+        self.assertEqual([row["orcid-id"] for row in rows],
+                         [str(i) for i in range(12)])
+
+        rows = []
+        with self.assertRaises(httpx.HTTPStatusError):
+            async for row in orc_search.iter_search("Smith", page_size=10):
+                rows.append(row)
+        # The pages read before the failure were delivered
+        self.assertEqual(len(rows), 20)
+        await client.aclose()
+
+    async def test_iter_csv_search_streams_rows(self):
+        pages = ['orcid,given-names\r\n0000-1,Zoë\r\n0000-2,"Multi\nline"\r\n',
+                 'orcid,given-names\r\n0000-3,Ana\r\n']
+
+        async def chunks(body):
+            # Small chunks, cutting lines and characters
+            for i in range(0, len(body), 7):
+                yield body[i:i + 7]
+
+        def handler(request):
+            body = pages[int(request.url.params["start"]) // 2].encode()
+            return httpx.Response(200, content=chunks(body))
+
+        client = self.client(handler)
+        orc_search = AsyncOrcidSearch(client=client)
+        rows = [row async for row in orc_search.iter_csv_search(
+            "Smith", columns="orcid,given-names", page_size=2)]
+        self.assertEqual(rows, [
+            {"orcid": "0000-1", "given-names": "Zoë"},
+            {"orcid": "0000-2", "given-names": "Multi\nline"},
+            {"orcid": "0000-3", "given-names": "Ana"},
+        ])
+
+        names = [None] * 2
+        count = await orc_search.csv_search_into(
+            "Smith", {"given-names": names}, columns="orcid,given-names")
+        self.assertEqual((count, names), (2, ["Zoë", "Multi\nline"]))
+        await client.aclose()
+
+    async def test_no_synchronous_transport(self):
+        for orc in (AsyncOrcid(self.MY_ORCID_ID), AsyncOrcidSearch()):
+            with self.assertRaisesRegex(TypeError, type(orc).__name__):
+                orc._transport.get("https://pub.orcid.org/v3.0/")
+
+    async def test_streaming_accessors_are_not_available(self):
+        orc = AsyncOrcid(self.MY_ORCID_ID)
+        with self.assertRaisesRegex(NotImplementedError, r"await works\(\)"):
+            orc.stream_works()
+        with self.assertRaisesRegex(NotImplementedError, r"await fundings\(\)"):
+            orc.stream_fundings()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import threading
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from src.pyorcid import OrcidBatch
+
+
+class TestOrcidBatch(unittest.TestCase):
+
+    def test_harvest_streams_results_and_errors(self):
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_get(url, **kwargs):
+            with lock:
+                in_flight.append(url)
+                peak.append(len(in_flight))
+            try:
+                if "/0000-0000-0000-0003/" in url:
+                    raise RuntimeError("boom")
+                response = Mock()
+                response.json.return_value = {"path": url}
+                return response
+            finally:
+                with lock:
+                    in_flight.remove(url)
+
+        ids = (f"0000-0000-0000-000{i}" for i in range(6))
+        with OrcidBatch(sections=["works", "fundings"], concurrency=2) as batch:
+            batch._transport.session.get = fake_get
+            results = dict(batch.harvest(ids))
+
+        self.assertEqual(len(results), 6)
+        self.assertIsInstance(results["0000-0000-0000-0003"], RuntimeError)
+        self.assertEqual(
+            results["0000-0000-0000-0001"]["works"],
+            {"path": "https://pub.orcid.org/v3.0/0000-0000-0000-0001/works"})
+        self.assertLessEqual(max(peak), 2)
+
+    def test_harvest_reports_failed_sections(self):
+        def fake_get(url, **kwargs):
+            if "/0000-0000-0000-0001/" in url:
+                raise requests.ConnectionError("refused")
+            response = requests.Response()
+            response.url = url
+            response.status_code = 500 if url.endswith("/fundings") else 200
+            response._content = b'{"group": []}'
+            return response
+
+        ids = ["0000-0000-0000-0001", "0000-0000-0000-0002"]
+        with OrcidBatch(sections=["works", "fundings"]) as batch:
+            batch._transport.session.get = fake_get
+            results = dict(batch.harvest(ids))
+
+        self.assertIsInstance(results["0000-0000-0000-0001"],
+                              requests.ConnectionError)
+        # A section answering 500 fails the record rather than reading as {}
+        self.assertIsInstance(results["0000-0000-0000-0002"],
+                              requests.HTTPError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock
+
+from src.pyorcid import (MemoryCacheBackend, Orcid, OrcidTransport,
+                         ResponseCache, SQLiteCacheBackend)
+from src.pyorcid.orcid_cache import CacheEntry
+
+
+def make_response(status_code, body=b"", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = body
+    response.headers = headers or {}
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+
+    URL = "https://pub.orcid.org/v3.0/0009-0004-5301-6863/works"
+
+    def test_revalidates_with_etag(self):
+        cache = ResponseCache()
+        session = Mock()
+        session.get.return_value = make_response(
+            200, b'{"group": []}', {"ETag": '"v1"'})
+        cache.get(session.get, self.URL, section="works")
+
+        session.get.return_value = make_response(304)
+        response = cache.get(session.get, self.URL, section="works")
+
+        self.assertEqual(response.json(), {"group": []})
+        self.assertEqual(
+            session.get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(cache.stats.as_dict(),
+                         {"hits": 0, "misses": 1, "revalidations": 1})
+
+    def test_section_ttl_serves_fresh_entries(self):
+        cache = ResponseCache(section_ttl={"works": 3600})
+        session = Mock()
+        session.get.return_value = make_response(200, b'{"group": []}')
+        cache.get(session.get, self.URL, section="works")
+        cache.get(session.get, self.URL, section="works")
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_put_code_reads_use_section_ttl(self):
+        cache = ResponseCache(section_ttl={"works": 3600, "fundings/{put-codes}": 60})
+        self.assertEqual(cache.ttl_for("works/1,2,3"), 3600)
+        self.assertEqual(cache.ttl_for("works/4"), 3600)
+        self.assertEqual(cache.ttl_for("fundings/7,8"), 60)
+        self.assertEqual(cache.ttl_for("fundings"), 0)
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_bytes=10)
+        backend.set("a", CacheEntry(b"12345", {}, 0))
+        backend.set("b", CacheEntry(b"12345", {}, 0))
+        backend.get("a")
+        backend.set("c", CacheEntry(b"12345", {}, 0))
+        self.assertIsNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("a"))
+        self.assertEqual(backend.evictions, 1)
+
+    def test_sqlite_backend_round_trip(self):
+        backend = SQLiteCacheBackend(":memory:")
+        backend.set("a", CacheEntry(b"body", {"ETag": '"v1"'}, 1.0))
+        entry = backend.get("a")
+        self.assertEqual((entry.body, entry.etag), (b"body", '"v1"'))
+        backend.close()
+
+    def test_orcid_reads_through_cache(self):
+        cache = ResponseCache(ttl=3600)
+        orc = Orcid("0009-0004-5301-6863",
+                    transport=OrcidTransport(cache=cache))
+        orc._transport.session = Mock()
+        orc._transport.session.get.return_value = make_response(200, b'{"group": []}')
+        orc._transport.session.get.return_value.json.return_value = {"group": []}
+        self.assertEqual(orc.works()[0], [])
+        self.assertEqual(orc.works()[0], [])
+        self.assertEqual(orc._transport.session.get.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from src.pyorcid import Orcid
+from src.pyorcid.orcid_columnar import pa, section_columns
+
+WORKS = {"group": [{"work-summary": [
+    {"put-code": 11, "title": {"title": {"value": "A study"}},
+     "type": "journal-article",
+     "publication-date": {"year": {"value": "2021"},
+                          "month": {"value": "03"}}},
+    {"put-code": 12, "title": None, "publication-date": None},
+]}]}
+
+EMPLOYMENTS = {"affiliation-group": [{"summaries": [{"employment-summary": {
+    "put-code": 7, "role-title": "Professor",
+    "start-date": {"year": {"value": "2020"}},
+    "organization": {"name": "Example University",
+                     "address": {"city": "Boston", "country": "US"}},
+}}]}]}
+
+
+class TestOrcidColumnar(unittest.TestCase):
+
+    def test_works_table_types_dates(self):
+        table = Orcid("0009-0004-5301-6863").works_table(WORKS)
+        self.assertEqual(table["put-code"], [11, 12])
+        self.assertEqual(table["title"], ["A study", None])
+        self.assertEqual(table["publication-year"], [2021, None])
+        self.assertEqual(table["publication-month"], [3, None])
+
+    def test_affiliations_table(self):
+        orc = Orcid("0009-0004-5301-6863")
+        table = orc.affiliations_table("employments", EMPLOYMENTS)
+        self.assertEqual(table["role"], ["Professor"])
+        self.assertEqual(table["start-year"], [2020])
+        self.assertEqual(table["end-year"], [None])
+        self.assertEqual(table["organization-address"], ["Boston, US"])
+        with self.assertRaises(ValueError):
+            orc.affiliations_table("works", WORKS)
+
+    def test_empty_payload(self):
+        self.assertEqual(section_columns("fundings", {})["title"], [])
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_batch_writer(self):
+        from src.pyorcid import ArrowBatchWriter
+        with ArrowBatchWriter("works", batch_size=1) as writer:
+            writer.append("0000-0000-0000-0001", WORKS)
+            writer.append("0000-0000-0000-0002", WORKS)
+            table = writer.to_table()
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(str(table.schema.field("publication-year").type),
+                         "int16")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import gzip
+import io
+import json
+import os
+import tarfile
+import tempfile
+import unittest
+
+from src.pyorcid import RecordStore
+from src.pyorcid.orcid_columnar import section_schema
+from src.pyorcid.orcid_dump import (
+    XML_AFFILIATION_COLUMNS,
+    XML_FUNDING_COLUMNS,
+    XML_WORK_COLUMNS,
+    JsonlSink,
+    StoreSink,
+    ingest_dump,
+    parse_record,
+)
+
+NAMESPACES = " ".join(
+    f'xmlns:{ns}="http://www.orcid.org/ns/{ns}"'
+    for ns in ("record", "common", "activities", "work", "employment"))
+
+
+def record_xml(orcid_id, works):
+    summaries = "".join(
+        f'<activities:group><work:work-summary put-code="{put_code}">'
+        f'<work:title><common:title>Work {put_code}</common:title></work:title>'
+        f'<common:external-ids><common:external-id>'
+        f'<common:external-id-type>doi</common:external-id-type>'
+        f'<common:external-id-value>10.1/W{put_code}</common:external-id-value>'
+        f'</common:external-id></common:external-ids>'
+        f'<work:type>book</work:type><common:publication-date>'
+        f'<common:year>2020</common:year></common:publication-date>'
+        f'</work:work-summary></activities:group>'
+        for put_code in works)
+    return (
+        f'<record:record path="/{orcid_id}" {NAMESPACES}>'
+        f'<common:orcid-identifier><common:path>{orcid_id}</common:path>'
+        f'</common:orcid-identifier><activities:activities-summary>'
+        f'<activities:employments><activities:affiliation-group>'
+        f'<employment:employment-summary put-code="5">'
+        f'<common:role-title>Professor</common:role-title>'
+        f'<common:start-date><common:year>2019</common:year>'
+        f'<common:month>09</common:month></common:start-date>'
+        f'<common:organization><common:name>Example University</common:name>'
+        f'<common:address><common:city>Boston</common:city>'
+        f'<common:country>US</common:country></common:address>'
+        f'</common:organization></employment:employment-summary>'
+        f'</activities:affiliation-group></activities:employments>'
+        f'<activities:works>{summaries}</activities:works>'
+        f'</activities:activities-summary></record:record>'
+    ).encode("utf-8")
+
+
+class TestOrcidDump(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "summaries.tar.gz")
+        members = {
+            "summaries/000/0000-0000-0000-0001.xml":
+                record_xml("0000-0000-0000-0001", [1]),
+            "summaries/000/0000-0000-0000-0002.xml":
+                record_xml("0000-0000-0000-0002", [2, 3]),
+            "summaries/000/0000-0000-0000-0003.xml": b"<record:record",
+            "summaries/README.txt": b"not a record",
+        }
+        with tarfile.open(self.path, "w:gz") as archive:
+            for name, data in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_xml_columns_match_json_columns(self):
+        for schema, section in ((XML_WORK_COLUMNS, "works"),
+                                (XML_FUNDING_COLUMNS, "fundings"),
+                                (XML_AFFILIATION_COLUMNS, "employments")):
+            self.assertEqual(schema.names, section_schema(section).names)
+
+    def test_parse_record(self):
+        orcid_id, tables = parse_record(
+            record_xml("0000-0000-0000-0002", [2, 3]), ["works", "employments"])
+        self.assertEqual(orcid_id, "0000-0000-0000-0002")
+        self.assertEqual(tables["works"]["put-code"], [2, 3])
+        self.assertEqual(tables["works"]["doi"], ["10.1/w2", "10.1/w3"])
+        self.assertEqual(tables["employments"]["start-month"], [9])
+        self.assertEqual(tables["employments"]["organization-address"],
+                         ["Boston, US"])
+
+    def test_ingest_to_jsonl(self):
+        output = os.path.join(self.directory.name, "records.jsonl.gz")
+        with JsonlSink(output) as sink:
+            stats = ingest_dump(self.path, sink, sections=["works"],
+                                processes=2, chunk_size=1)
+        self.assertEqual(stats, {"records": 2, "failed": 1, "works": 3})
+
+        with gzip.open(output, "rt", encoding="utf-8") as lines:
+            records = sorted((json.loads(line) for line in lines),
+                             key=lambda record: record["orcid-id"])
+        self.assertEqual([work["title"] for work in records[1]["works"]],
+                         ["Work 2", "Work 3"])
+
+    def test_ingest_to_store(self):
+        store = RecordStore(":memory:")
+        with StoreSink(store, batch_size=1) as sink:
+            ingest_dump(self.path, sink, processes=0)
+        self.assertEqual(store.orcid_ids(doi="10.1/W3"),
+                         ["0000-0000-0000-0002"])
+        self.assertEqual(len(store.find(section="employments",
+                                        organization="example%")), 2)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from src.pyorcid.orcid_extraction import (
+    FUNDING_SCHEMA,
+    WORK_SCHEMA,
+    Field,
+    Schema,
+    format_date,
+    iter_group_items,
+)
+
+
+class TestOrcidExtraction(unittest.TestCase):
+
+    def test_schema_matches_path_semantics(self):
+        schema = Schema([
+            Field("a", ("x", "y")),
+            Field("b", ("x",)),
+            Field("c", ("x", "z", "w")),
+            Field("d", ("name",), lambda value: value or "-"),
+        ])
+        self.assertEqual(
+            schema({"x": {"y": "café", "z": "leaf"}, "name": "ok"}),
+            {"a": "caf", "b": {"y": "café", "z": "leaf"}, "c": None,
+             "d": "ok"})
+        # Missing paths and non-dict payloads yield None
+        self.assertEqual(schema({"x": None, "name": None}),
+                         {"a": None, "b": None, "c": None, "d": "-"})
+        self.assertEqual(schema(None)["a"], None)
+
+    def test_format_date(self):
+        self.assertEqual(format_date(None), '')
+        self.assertEqual(format_date({}), '')
+        self.assertEqual(format_date({"year": {"value": "2020"}}), "2020")
+        self.assertEqual(format_date({"year": {"value": "2020"},
+                                      "month": {"value": "01"}}), "01/2020")
+
+    def test_work_and_funding_rows(self):
+        data = {"group": [{"work-summary": [{
+            "title": {"title": {"value": "A study"}},
+            "type": "journal-article",
+            "publication-date": {"year": {"value": "2021"}},
+            "journal-title": None,
+            "organization": {"name": "Uni",
+                             "address": {"city": "Zürich", "region": None,
+                                         "country": "CH"}},
+        }]}]}
+        self.assertEqual(WORK_SCHEMA.extract_many(
+            iter_group_items(data, "work-summary")), [{
+                'title': "A study",
+                'type': "journal-article",
+                'publication-date': "2021",
+                'journal title': None,
+                'organization': "Uni",
+                'organization-address': "Zrich, CH",
+                'url': None,
+            }])
+        self.assertEqual(FUNDING_SCHEMA({})["start-date"], '')
+
+
+if __name__ == '__main__':
+    unittest.main()
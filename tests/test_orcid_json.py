@@ -0,0 +1,83 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from src.pyorcid import Orcid
+from src.pyorcid.orcid_extraction import WORK_SCHEMA, key_attribute
+from src.pyorcid.orcid_json import (
+    decode_records,
+    json_backend,
+    loads,
+    msgspec,
+    orjson,
+)
+from src.pyorcid.orcid_records import section_records
+
+from .test_orcid_columnar import EMPLOYMENTS, WORKS
+
+
+def as_struct(data, tree):
+    # Mimics a decoded struct: every key of the tree is an attribute
+    if not isinstance(data, dict):
+        return None
+    return SimpleNamespace(**{
+        key_attribute(key): (as_struct(data.get(key), children)
+                             if children else data.get(key))
+        for key, (children, _) in tree.items()})
+
+
+class TestOrcidJson(unittest.TestCase):
+
+    def test_backends_agree(self):
+        raw = json.dumps(WORKS, ensure_ascii=False).encode("utf-8")
+        backends = ["json"] + [name for name, module in
+                               (("orjson", orjson), ("msgspec", msgspec))
+                               if module is not None]
+        for backend in backends:
+            self.assertEqual(loads(raw, backend), WORKS)
+            with self.assertRaises(ValueError):
+                loads(b'{"group": [', backend)
+        self.assertIn(json_backend(), backends)
+        with self.assertRaises(ValueError):
+            json_backend("simdjson")
+
+    def test_struct_rows_match_dict_rows(self):
+        summaries = [summary for group in WORKS["group"]
+                     for summary in group["work-summary"]]
+        for summary in summaries:
+            self.assertEqual(
+                WORK_SCHEMA.extract_struct_row(
+                    as_struct(summary, WORK_SCHEMA.tree)),
+                WORK_SCHEMA.extract_row(summary))
+        self.assertEqual(WORK_SCHEMA.extract_struct_row(None),
+                         WORK_SCHEMA.extract_row({}))
+
+    def test_decode_records_matches_section_records(self):
+        for section, payload in (("works", WORKS),
+                                 ("employments", EMPLOYMENTS),
+                                 ("fundings", {"group": []})):
+            raw = json.dumps(payload).encode("utf-8")
+            self.assertEqual(decode_records(section, raw),
+                             section_records(section, payload))
+
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_unexpected_shape_falls_back(self):
+        payload = {"group": [{"work-summary": [{"title": "flat"}]}]}
+        raw = json.dumps(payload).encode("utf-8")
+        self.assertEqual(decode_records("works", raw),
+                         section_records("works", payload))
+
+    def test_work_summaries_decode_response_body(self):
+        orc = Orcid("0009-0004-5301-6863")
+        orc._transport.session = Mock()
+        response = orc._transport.session.get.return_value
+        response.status_code = 200
+        response.content = json.dumps(WORKS).encode("utf-8")
+        self.assertEqual(orc.work_summaries(), orc.work_summaries(WORKS))
+        response.json.assert_not_called()
+        self.assertEqual(orc.works(), orc.works(WORKS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.pyorcid import (
+    AsyncOrcid,
+    MetricsAggregator,
+    MetricsHook,
+    Orcid,
+    OrcidTransport,
+    ResponseCache,
+    RetryPolicy,
+)
+from src.pyorcid.orcid_async import httpx
+from src.pyorcid.orcid_metrics import LatencyHistogram, endpoint_of
+
+ORCID_ID = "0000-0002-1825-0097"
+BODY = b'{"group": []}'
+
+
+class OrcidHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = {}
+
+    def do_GET(self):
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.__respond(503, b"")
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self.__respond(304, b"")
+        else:
+            self.__respond(200, BODY)
+
+    def __respond(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Recorder(MetricsHook):
+
+    def __init__(self):
+        self.requests = []
+        self.decodes = []
+
+    def on_request(self, event):
+        self.requests.append(event)
+
+    def on_decode(self, event):
+        self.decodes.append(event)
+
+
+class TestOrcidMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), OrcidHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+        OrcidHandler.failures = {}
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_endpoint_of(self):
+        self.assertEqual(
+            endpoint_of(f"https://pub.orcid.org/v3.0/{ORCID_ID}/works"),
+            "works")
+        self.assertEqual(
+            endpoint_of(f"https://pub.orcid.org/v3.0/{ORCID_ID}/works/1,2,3"),
+            "works/{put-codes}")
+        self.assertEqual(
+            endpoint_of(f"https://pub.orcid.org/v3.0/{ORCID_ID}"), "record")
+        self.assertEqual(
+            endpoint_of("https://pub.orcid.org/v3.0/expanded-search/?q=x"),
+            "expanded-search")
+
+    def test_request_phases_and_cache_status(self):
+        recorder = Recorder()
+        transport = OrcidTransport(cache=ResponseCache(ttl=60),
+                                   hooks=[recorder])
+        url = f"{self.base}/v3.0/{ORCID_ID}/works"
+        with transport:
+            transport.get(url, section="works")
+            transport.get(url, section="works")
+            transport.get(url, section="works", stream=True).close()
+
+        miss, hit, streamed = recorder.requests
+        self.assertEqual((miss.status_code, miss.cache, miss.attempts),
+                         (200, "miss", 1))
+        self.assertEqual(miss.bytes_received, len(BODY))
+        self.assertGreater(miss.connect, 0)
+        for phase in ("ttfb", "download"):
+            self.assertGreaterEqual(getattr(miss, phase), 0)
+        self.assertGreaterEqual(miss.elapsed, miss.connect + miss.ttfb)
+
+        self.assertEqual((hit.cache, hit.attempts, hit.connect),
+                         ("hit", 0, None))
+        self.assertEqual(streamed.cache, "bypass")
+        self.assertEqual(streamed.connect, 0)
+        self.assertIsNone(streamed.download)
+
+    def test_revalidation_and_retries(self):
+        recorder = Recorder()
+        OrcidHandler.failures = {f"/v3.0/{ORCID_ID}/works": 1}
+        transport = OrcidTransport(
+            cache=ResponseCache(ttl=0), hooks=[recorder],
+            retry=RetryPolicy(max_attempts=3, backoff_factor=0.01, jitter=False))
+        url = f"{self.base}/v3.0/{ORCID_ID}/works"
+        with transport:
+            transport.get(url, section="works")
+            transport.get(url, section="works")
+
+        retried, revalidated = recorder.requests
+        self.assertEqual((retried.attempts, retried.retries), (2, 1))
+        self.assertEqual(retried.status_code, 200)
+        self.assertEqual(revalidated.cache, "revalidated")
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(revalidated.bytes_received, 0)
+
+    def test_failed_request_is_reported(self):
+        recorder = Recorder()
+        self.server.shutdown()
+        self.server.server_close()
+        with OrcidTransport(hooks=[recorder]) as transport, \
+                self.assertRaises(Exception):
+            transport.get(f"{self.base}/v3.0/{ORCID_ID}/works")
+        self.assertEqual(recorder.requests[0].error, "ConnectionError")
+        self.assertEqual(recorder.requests[0].status, "ConnectionError")
+
+    def test_failing_hook_does_not_fail_request(self):
+        class Broken(MetricsHook):
+            def on_request(self, event):
+                raise RuntimeError("broken")
+
+        with OrcidTransport(hooks=[Broken()]) as transport, \
+                self.assertLogs("src.pyorcid.orcid_metrics", "WARNING"):
+            response = transport.get(f"{self.base}/v3.0/{ORCID_ID}/works")
+        self.assertEqual(response.status_code, 200)
+
+    def test_client_decode_and_aggregator(self):
+        aggregator = MetricsAggregator()
+        transport = OrcidTransport(hooks=[aggregator])
+        orcid = Orcid(ORCID_ID, transport=transport)
+        orcid._Orcid__get_api_url = (
+            lambda section="": f"{self.base}/v3.0/{ORCID_ID}/{section}")
+        with transport:
+            for _ in range(3):
+                orcid._read_section("works")
+            orcid._read_section("fundings")
+
+        metrics = aggregator.as_dict()
+        self.assertEqual(set(metrics), {"works", "fundings"})
+        works = metrics["works"]
+        self.assertEqual(works["requests"], 3)
+        self.assertEqual(works["status"], {"200": 3})
+        self.assertEqual(works["bytes"], 3 * len(BODY))
+        self.assertEqual(works["latency"]["elapsed"]["count"], 3)
+        self.assertEqual(works["decode"]["count"], 3)
+        self.assertAlmostEqual(
+            sum(section["time_share"] for section in metrics.values()), 1)
+        aggregator.reset()
+        self.assertEqual(aggregator.as_dict(), {})
+
+    def test_bulk_reads_share_one_section_label(self):
+        recorder = Recorder()
+        aggregator = MetricsAggregator()
+        transport = OrcidTransport(hooks=[recorder, aggregator])
+        orcid = Orcid(ORCID_ID, transport=transport)
+        orcid._Orcid__get_api_url = (
+            lambda section="": f"{self.base}/v3.0/{ORCID_ID}/{section}")
+        with transport:
+            list(orcid.work_details(put_codes=range(1, 7), batch_size=2))
+
+        self.assertEqual(len(recorder.requests), 3)
+        self.assertEqual({event.section for event in recorder.requests},
+                         {"works/{put-codes}"})
+        self.assertEqual({event.section for event in recorder.decodes},
+                         {"works/{put-codes}"})
+        self.assertEqual(list(aggregator.as_dict()), ["works/{put-codes}"])
+        self.assertEqual(
+            aggregator.as_dict()["works/{put-codes}"]["requests"], 3)
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_async_client_phases(self):
+        recorder = Recorder()
+
+        async def read():
+            async with httpx.AsyncClient() as client:
+                orcid = AsyncOrcid(ORCID_ID, "token", client=client,
+                                   hooks=[recorder])
+                orcid._Orcid__get_api_url = (
+                    lambda section="": f"{self.base}/v3.0/{ORCID_ID}/{section}")
+                return await orcid._read_section("works")
+
+        self.assertEqual(asyncio.run(read()), {"group": []})
+        event, = recorder.requests
+        self.assertEqual((event.client, event.section, event.status_code),
+                         ("async", "works", 200))
+        self.assertGreater(event.connect, 0)
+        self.assertGreaterEqual(event.ttfb, 0)
+        self.assertEqual(event.bytes_received, len(BODY))
+        self.assertEqual(recorder.decodes[0].section, "works")
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for millisecond in range(1, 101):
+            histogram.observe(millisecond / 1000)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.sum, 5.05)
+        # Buckets are ~41% wide, so percentiles are estimates
+        self.assertAlmostEqual(histogram.percentile(50), 0.050, delta=0.01)
+        self.assertAlmostEqual(histogram.percentile(99), 0.099, delta=0.01)
+        self.assertEqual(histogram.percentile(100), 0.1)
+        self.assertEqual(histogram.percentile(0), 0.001)
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.pyorcid import Orcid, RecordStore
+from src.pyorcid.orcid_parallel import (
+    dump_record_columns,
+    map_files,
+    map_payloads,
+    record_columns,
+    summarize_record,
+)
+
+from .test_orcid import SAMPLE_RECORD
+from .test_orcid_dump import record_xml
+
+IDS = [f"0000-0000-0000-000{i}" for i in range(1, 6)]
+
+
+def flatten(chunks):
+    return dict(result for chunk in chunks for result in chunk)
+
+
+class TestOrcidParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.store = RecordStore(":memory:")
+        for orcid_id in IDS:
+            self.store.put(orcid_id, "record", SAMPLE_RECORD)
+        self.expected = Orcid(IDS[0]).record_summary(data=SAMPLE_RECORD)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_summaries_through_shared_memory(self):
+        payloads = list(self.store.iter_payloads(page_size=2))
+        self.assertEqual([orcid_id for orcid_id, _ in payloads], IDS)
+        payloads.append(("0000-0000-0000-0009", b"{not json"))
+
+        chunks = list(map_payloads(summarize_record, payloads,
+                                   processes=2, chunk_size=2))
+        self.assertEqual(sorted(len(chunk) for chunk in chunks), [2, 2, 2])
+        results = flatten(chunks)
+        self.assertEqual(results[IDS[0]], self.expected)
+        self.assertEqual(results[IDS[4]]["ORCiD ID"], IDS[4])
+        self.assertIsInstance(results["0000-0000-0000-0009"], ValueError)
+
+    def test_inline_matches_pool(self):
+        payloads = list(self.store.iter_payloads())
+        self.assertEqual(
+            flatten(map_payloads(record_columns, payloads, processes=0)),
+            flatten(map_payloads(record_columns, payloads, processes=1)))
+        columns = flatten(map_payloads(record_columns, payloads[:1],
+                                       processes=0))[IDS[0]]
+        self.assertEqual(columns["works"]["title"], ["A study"])
+        self.assertEqual(columns["employments"]["start-year"], [2020])
+
+    def test_memory_mapped_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for orcid_id, data in (
+                    (IDS[0], record_xml(IDS[0], [1, 2])),
+                    (IDS[1], record_xml(IDS[1], [3])),
+                    (IDS[2], b"")):
+                paths.append(os.path.join(directory, f"{orcid_id}.xml"))
+                with open(paths[-1], "wb") as file:
+                    file.write(data)
+
+            results = flatten(map_files(dump_record_columns, paths,
+                                        processes=2, chunk_size=1))
+        self.assertEqual(results[IDS[0]]["works"]["put-code"], [1, 2])
+        self.assertEqual(results[IDS[1]]["employments"]["role"],
+                         ["Professor"])
+        self.assertIsInstance(results[IDS[2]], ValueError)
+
+    def test_text_payloads(self):
+        results = flatten(map_payloads(
+            summarize_record, [(IDS[0], json.dumps(SAMPLE_RECORD))],
+            processes=0))
+        self.assertEqual(results[IDS[0]], self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import pickle
+import sys
+import unittest
+
+from src.pyorcid import AffiliationSummary, Orcid, WorkSummary
+
+from .test_orcid_columnar import EMPLOYMENTS, WORKS
+
+
+class TestOrcidRecords(unittest.TestCase):
+
+    def test_work_summaries_match_works(self):
+        orc = Orcid("0009-0004-5301-6863")
+        records = orc.work_summaries(WORKS)
+        self.assertIsInstance(records[0], WorkSummary)
+        self.assertEqual(records[0].put_code, 11)
+        self.assertEqual(records[0].publication_date, "03/2021")
+        self.assertEqual([record.as_dict() for record in records],
+                         orc.works(WORKS)[0])
+
+    def test_records_are_immutable_values(self):
+        orc = Orcid("0009-0004-5301-6863")
+        record = orc.affiliation_summaries("employments", EMPLOYMENTS)[0]
+        self.assertIsInstance(record, AffiliationSummary)
+        self.assertEqual(record.role, "Professor")
+        with self.assertRaises(AttributeError):
+            record.role = "Dean"
+        copy = pickle.loads(pickle.dumps(record))
+        self.assertEqual(copy, record)
+        self.assertEqual(len({copy, record}), 1)
+        self.assertLess(sys.getsizeof(record),
+                        sys.getsizeof(record.as_dict()))
+
+
+if __name__ == '__main__':
+    unittest.main()
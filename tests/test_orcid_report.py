@@ -0,0 +1,82 @@
+import copy
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.pyorcid import CohortReport, Orcid
+
+from .test_orcid import SAMPLE_RECORD
+from .test_orcid_sync import json_response
+
+IDS = ["0000-0000-0000-0001", "0000-0000-0000-0002", "0000-0000-0000-0003"]
+
+
+class TestOrcidReport(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.summary = Orcid(IDS[0]).record_summary(data=SAMPLE_RECORD)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, name):
+        with open(os.path.join(self.directory.name, name),
+                  encoding="utf-8") as page:
+            return page.read()
+
+    def test_markdown_matches_generate_markdown_file(self):
+        expected = os.path.join(self.directory.name, "expected.md")
+        Orcid(IDS[0]).generate_markdown_file(expected, summary=self.summary)
+        with CohortReport(self.directory.name) as report:
+            stats = report.generate(summaries=[self.summary])
+        self.assertEqual(stats, {"written": 1, "skipped": 0, "failed": 0})
+        self.assertEqual(self.read(f"{IDS[0]}.md"), self.read("expected.md"))
+
+    def test_incremental_skips_unchanged_summaries(self):
+        changed = copy.deepcopy(self.summary)
+        changed["ORCiD ID"] = IDS[1]
+        with CohortReport(self.directory.name) as report:
+            report.generate(summaries=[self.summary, changed])
+
+        changed["Name"] = "Ada"
+        with CohortReport(self.directory.name) as report:
+            stats = report.generate(summaries=[self.summary, changed])
+        self.assertEqual(stats, {"written": 1, "skipped": 1, "failed": 0})
+        self.assertIn("Ada", self.read(f"{IDS[1]}.md"))
+
+        # A full run re-renders everything
+        with CohortReport(self.directory.name, incremental=False) as report:
+            stats = report.generate(summaries=[self.summary, changed])
+        self.assertEqual(stats["written"], 2)
+
+    def test_html_pages_of_fetched_records(self):
+        record = copy.deepcopy(SAMPLE_RECORD)
+        record["activities-summary"]["works"]["group"][0]["work-summary"][0][
+            "title"]["title"]["value"] = "Cats & <dogs>"
+
+        def get(url, **kwargs):
+            if IDS[2] in url:
+                return json_response({}, 500)
+            return json_response(record)
+
+        with CohortReport(self.directory.name, template="html",
+                          concurrency=2) as report:
+            report._transport.session = Mock()
+            report._transport.session.get.side_effect = get
+            stats = report.generate(IDS)
+        self.assertEqual(stats, {"written": 2, "skipped": 0, "failed": 1})
+        page = self.read(f"{IDS[1]}.html")
+        self.assertIn("<title>Sri S</title>", page)
+        self.assertIn("<td>Cats &amp; &lt;dogs&gt;</td>", page)
+        self.assertFalse(os.path.exists(
+            os.path.join(self.directory.name, f"{IDS[2]}.html")))
+
+    def test_unknown_template(self):
+        with self.assertRaises(ValueError):
+            CohortReport(self.directory.name, template="pdf")
+
+
+if __name__ == '__main__':
+    unittest.main()
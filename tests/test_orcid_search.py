@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from src.pyorcid import OrcidSearch
+
+
+class TestOrcidSearch(unittest.TestCase):
+
+    def fake_search(self, query, start=0, rows=1000, search_mode=None,
+                    strict=False):
+        self.requested.append((start, rows))
+        found = range(start, min(start + rows, self.num_found))
+        return {"num-found": self.num_found,
+                "expanded-result": [{"orcid-id": str(i)} for i in found]}
+
+    def test_iter_search_pages_through_results(self):
+        self.requested, self.num_found = [], 25
+        orc_search = OrcidSearch()
+        with patch.object(orc_search, "search", self.fake_search):
+            rows = list(orc_search.iter_search("Smith", page_size=10))
+        self.assertEqual([row["orcid-id"] for row in rows],
+                         [str(i) for i in range(25)])
+        self.assertEqual(self.requested, [(0, 10), (10, 10), (20, 5)])
+
+    def test_iter_search_stops_at_max_results(self):
+        self.requested, self.num_found = [], 25
+        orc_search = OrcidSearch()
+        with patch.object(orc_search, "search", self.fake_search):
+            rows = list(orc_search.iter_search(
+                "Smith", page_size=10, max_results=12))
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(self.requested, [(0, 10), (10, 2)])
+
+    def test_iter_search_stops_at_deep_paging_limit(self):
+        self.requested, self.num_found = [], 50000
+        orc_search = OrcidSearch()
+        with patch.object(orc_search, "search", self.fake_search):
+            count = sum(1 for _ in orc_search.iter_search("Smith"))
+        self.assertEqual(count, 11000)
+        self.assertEqual(self.requested[-1], (10000, 1000))
+
+    def test_iter_search_raises_on_failed_page(self):
+        def fake_get(url, **kwargs):
+            response = requests.Response()
+            response.url = url
+            response.status_code = 500 if "start=10" in url else 200
+            response._content = (b'{"num-found": 25, "expanded-result": ['
+                                 + b','.join([b'{}'] * 10) + b']}')
+            return response
+
+        orc_search = OrcidSearch()
+        orc_search._transport.session.get = fake_get
+        rows = []
+        with self.assertRaises(requests.HTTPError):
+            for row in orc_search.iter_search("Smith", page_size=10):
+                rows.append(row)
+        self.assertEqual(len(rows), 10)
+        # search() itself keeps reporting failures as None
+        self.assertIsNone(orc_search.search("Smith", start=10, rows=10))
+
+    def csv_session(self, *pages):
+        session = Mock()
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.status_code = 200
+            body = page.encode("utf-8")
+            # Split the body into small chunks, cutting lines and characters
+            response.iter_content.return_value = [
+                body[i:i + 7] for i in range(0, len(body), 7)]
+            responses.append(response)
+        session.get.side_effect = responses
+        return session
+
+    def test_iter_csv_search_streams_rows(self):
+        orc_search = OrcidSearch()
+        orc_search._transport.session = self.csv_session(
+            'orcid,given-names\r\n0000-1,Zoë\r\n0000-2,"Multi\nline"\r\n',
+            'orcid,given-names\r\n0000-3,Ana\r\n')
+        rows = list(orc_search.iter_csv_search(
+            "Smith", columns="orcid,given-names", page_size=2))
+        self.assertEqual(rows, [
+            {"orcid": "0000-1", "given-names": "Zoë"},
+            {"orcid": "0000-2", "given-names": "Multi\nline"},
+            {"orcid": "0000-3", "given-names": "Ana"},
+        ])
+        self.assertTrue(orc_search._transport.session.get.call_args.kwargs["stream"])
+
+    def test_csv_search_into_fills_preallocated_columns(self):
+        orc_search = OrcidSearch()
+        orc_search._transport.session = self.csv_session(
+            'orcid,given-names\n0000-1,Ana\n0000-2,Bo\n')
+        names = [None] * 2
+        count = orc_search.csv_search_into(
+            "Smith", {"given-names": names}, columns="orcid,given-names")
+        self.assertEqual((count, names), (2, ["Ana", "Bo"]))
+
+    def test_csv_page_is_closed_when_the_token_is_rejected(self):
+        def check_access_token(status_code=None):
+            if status_code is not None:
+                raise ValueError("Invalid access token!")
+
+        orc_search = OrcidSearch()
+        orc_search._transport.session = Mock()
+        response = orc_search._transport.session.get.return_value
+        with patch.object(orc_search, "_check_access_token",
+                          check_access_token), \
+                self.assertRaises(ValueError):
+            list(orc_search.iter_csv_search("Smith"))
+        response.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
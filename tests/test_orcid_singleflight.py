@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.pyorcid import (
+    AsyncOrcid,
+    AsyncSingleFlight,
+    MetricsAggregator,
+    Orcid,
+    OrcidTransport,
+    SingleFlight,
+)
+from src.pyorcid.orcid_async import httpx
+
+ORCID_ID = "0000-0002-1825-0097"
+WAITERS = 8
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the waiters")
+        time.sleep(0.001)
+
+
+class GatedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    gate = threading.Event()
+    requested = []
+
+    def do_GET(self):
+        self.requested.append(self.path)
+        self.gate.wait(5)
+        body = b'{"group": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_are_coalesced(self):
+        flight = SingleFlight()
+        calls = []
+
+        def call():
+            calls.append(1)
+            wait_for(lambda: flight.stats.coalesced == WAITERS - 1)
+            return {"group": []}
+
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(flight.do("works", call)))
+            for _ in range(WAITERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(shared for _, shared in results),
+                         [False] + [True] * (WAITERS - 1))
+        self.assertTrue(all(result is results[0][0] for result, _ in results))
+        self.assertEqual(flight.stats.as_dict(),
+                         {"calls": 1, "coalesced": WAITERS - 1})
+        self.assertEqual(len(flight), 0)
+        # Once landed, the next call runs again
+        self.assertEqual(flight.do("works", lambda: 1), (1, False))
+
+    def test_error_reaches_every_waiter(self):
+        flight = SingleFlight()
+        errors = []
+
+        def call():
+            wait_for(lambda: flight.stats.coalesced == 1)
+            raise ValueError("boom")
+
+        def waiter():
+            try:
+                flight.do("works", call)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=waiter) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(len(flight), 0)
+
+
+class TestTransportSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        GatedHandler.gate = threading.Event()
+        GatedHandler.requested = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), GatedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        GatedHandler.gate.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def orcid(self, transport):
+        orcid = Orcid(ORCID_ID, "token", transport=transport)
+        orcid._Orcid__get_api_url = (
+            lambda section="": f"{self.base}/v3.0/{ORCID_ID}/{section}")
+        return orcid
+
+    def test_clients_share_one_request(self):
+        flight = SingleFlight()
+        metrics = MetricsAggregator()
+        # Separate transports, as separate Orcid instances would have
+        transports = [OrcidTransport(singleflight=flight, hooks=[metrics])
+                      for _ in range(WAITERS)]
+        results = []
+
+        def read(transport):
+            results.append(self.orcid(transport)._read_section("works"))
+
+        threads = [threading.Thread(target=read, args=(transport,))
+                   for transport in transports]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: flight.stats.coalesced == WAITERS - 1)
+        GatedHandler.gate.set()
+        for thread in threads:
+            thread.join()
+        for transport in transports:
+            transport.close()
+
+        self.assertEqual(GatedHandler.requested,
+                         [f"/v3.0/{ORCID_ID}/works"])
+        self.assertEqual(results, [{"group": []}] * WAITERS)
+        # Every caller decodes its own copy
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(metrics.as_dict()["works"]["cache"],
+                         {"coalesced": WAITERS - 1})
+
+    def test_different_tokens_are_not_coalesced(self):
+        GatedHandler.gate.set()
+        flight = SingleFlight()
+        with OrcidTransport(singleflight=flight) as transport:
+            url = f"{self.base}/v3.0/{ORCID_ID}/works"
+            threads = [threading.Thread(target=transport.get, args=(url,), kwargs={
+                "headers": {"Authorization": f"Bearer {token}"}})
+                for token in ("a", "b")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(GatedHandler.requested), 2)
+        self.assertEqual(flight.stats.coalesced, 0)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_clients_share_one_request(self):
+        flight = AsyncSingleFlight()
+        requested = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            requested.append(request.url.path)
+            await release.wait()
+            return httpx.Response(200, json={"group": []})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        readers = [AsyncOrcid(ORCID_ID, "token", client=client,
+                              singleflight=flight) for _ in range(WAITERS)]
+        tasks = [asyncio.ensure_future(orcid._read_section("works"))
+                 for orcid in readers]
+        while flight.stats.coalesced < WAITERS - 1:
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        await client.aclose()
+
+        self.assertEqual(requested, [f"/v3.0/{ORCID_ID}/works"])
+        self.assertEqual(results, [{"group": []}] * WAITERS)
+        self.assertEqual(len(flight), 0)
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "payload"
+
+        leader = asyncio.ensure_future(flight.do("works", call))
+        waiter = asyncio.ensure_future(flight.do("works", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        self.assertEqual(await waiter, ("payload", True))
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import copy
+import unittest
+from unittest.mock import Mock
+
+from src.pyorcid import Orcid, OrcidScrapper, RecordStore
+
+from .test_orcid_columnar import EMPLOYMENTS, WORKS
+from .test_orcid_dump import record_xml
+
+ORCID_ID = "0009-0004-5301-6863"
+
+WORKS_WITH_DOI = copy.deepcopy(WORKS)
+WORKS_WITH_DOI["group"][0]["work-summary"][0]["external-ids"] = {
+    "external-id": [{"external-id-type": "doi",
+                     "external-id-value": "10.1000/ABC.1"}]}
+
+RECORD = {
+    "person": {"keywords": {"keyword": [{"content": "optics"}]}},
+    "activities-summary": {"works": WORKS_WITH_DOI,
+                           "employments": EMPLOYMENTS},
+}
+
+
+class TestOrcidStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = RecordStore(":memory:")
+        self.store.put(ORCID_ID, "record", RECORD)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_embedded_sections_are_served(self):
+        self.assertEqual(self.store.get(ORCID_ID, "works"), WORKS_WITH_DOI)
+        self.assertEqual(self.store.get(ORCID_ID, "keywords"),
+                         RECORD["person"]["keywords"])
+        self.assertEqual(self.store.get(ORCID_ID, "activities"),
+                         RECORD["activities-summary"])
+        self.assertIsNone(self.store.get(ORCID_ID, "fundings"))
+        self.assertEqual(self.store.sections(ORCID_ID), ["record"])
+        with self.assertRaises(ValueError):
+            self.store.put(ORCID_ID, "works/11,12", {})
+
+    def test_indexed_lookups(self):
+        [work] = self.store.find(doi="https://doi.org/10.1000/abc.1")
+        self.assertEqual((work["orcid_id"], work["put_code"]), (ORCID_ID, 11))
+        self.assertEqual(work["start_year"], 2021)
+        self.assertEqual(
+            self.store.orcid_ids(organization="example%", section="employments"),
+            [ORCID_ID])
+        # An ongoing employment overlaps every later year
+        self.assertEqual(len(self.store.find(section="employments",
+                                             year_from=2030)), 1)
+        self.assertEqual(self.store.find(section="works", year_to=2020), [])
+        self.assertEqual(len(self.store.find(put_code=12)), 1)
+
+    def test_scrapped_payloads_are_indexed(self):
+        scrapper = OrcidScrapper("0000-0000-0000-0002")
+        parsed = scrapper._parse_xml(record_xml("0000-0000-0000-0002", [2, 3]))
+        # OrcidScrapper reads a section as the value of its root element
+        record = parsed["record"]
+        self.store.put("0000-0000-0000-0002", "record", record)
+        self.store.put("0000-0000-0000-0003", "works",
+                       record["activities-summary"]["works"])
+
+        [work] = self.store.find(orcid_id="0000-0000-0000-0002",
+                                 doi="10.1/w3")
+        self.assertEqual(
+            (work["put_code"], work["title"], work["type"], work["start_year"]),
+            (3, "Work 3", "book", 2020))
+        self.assertEqual(
+            [row["put_code"] for row in self.store.find(
+                orcid_id="0000-0000-0000-0003", section="works")], [2, 3])
+        [employment] = self.store.find(orcid_id="0000-0000-0000-0002",
+                                       section="employments")
+        self.assertEqual(
+            (employment["title"], employment["organization"],
+             employment["start_year"]),
+            ("Professor", "Example University", 2019))
+
+    def test_summaries_replace_index_rows(self):
+        orc = Orcid(ORCID_ID)
+        self.store.put_summaries(
+            ORCID_ID, "works", orc.work_summaries(WORKS)[:1])
+        [work] = self.store.find(section="works")
+        self.assertEqual((work["title"], work["doi"]), ("A study", None))
+
+    def test_orcid_reads_from_store(self):
+        orc = Orcid(ORCID_ID, store=self.store)
+        orc._transport.session = Mock()
+        response = orc._transport.session.get.return_value
+        response.status_code = 200
+        response.json.return_value = {"group": []}
+
+        self.assertEqual(orc.works(), Orcid(ORCID_ID).works(WORKS_WITH_DOI))
+        self.assertEqual(orc.affiliation_summaries("employments")[0].role,
+                         "Professor")
+        orc._transport.session.get.assert_not_called()
+
+        # Sections missing from the store are read once and saved
+        orc.fundings()
+        orc.fundings()
+        self.assertEqual(orc._transport.session.get.call_count, 1)
+        self.assertEqual(self.store.get(ORCID_ID, "fundings"), {"group": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from src.pyorcid import Orcid
+from src.pyorcid.orcid_stream import iter_json_items, iter_work_summaries
+
+WORKS = {
+    "last-modified-date": {"value": 1700000000000},
+    "group": [
+        {"external-ids": {"external-id": []},
+         "work-summary": [{"put-code": 1, "title": {"title": {"value": "Café"}}},
+                          {"put-code": 2, "type": "book"}]},
+        {"work-summary": [{"put-code": 3, "url": {"value": "https://x.org"}}]},
+    ],
+    "path": "/0009-0004-5301-6863/works",
+}
+
+
+def chunked(payload, size):
+    raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+class TestOrcidStream(unittest.TestCase):
+
+    def test_items_survive_any_chunk_boundary(self):
+        expected = [summary for group in WORKS["group"]
+                    for summary in group["work-summary"]]
+        for size in (1, 3, 17, 4096):
+            self.assertEqual(
+                list(iter_work_summaries(chunked(WORKS, size),
+                                         backend="python")),
+                expected)
+
+    def test_record_path_skips_other_sections(self):
+        record = {"person": {"name": {"given-names": {"value": "Sri"}}},
+                  "activities-summary": {"educations": {}, "works": WORKS}}
+        put_codes = [summary["put-code"] for summary in iter_work_summaries(
+            chunked(record, 5), "record", backend="python")]
+        self.assertEqual(put_codes, [1, 2, 3])
+
+    def test_truncated_document_raises(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_items([b'{"a": [1, 2'], ("a", "item"),
+                                 backend="python"))
+
+    def test_stream_works_extracts_rows(self):
+        orc = Orcid("0009-0004-5301-6863")
+        orc._transport.session = Mock()
+        response = orc._transport.session.get.return_value
+        response.status_code = 200
+        response.iter_content.return_value = chunked(WORKS, 8)
+        rows = list(orc.stream_works(backend="python"))
+        self.assertEqual(rows, orc.works(WORKS)[0])
+        self.assertTrue(orc._transport.session.get.call_args[1]["stream"])
+        response.close.assert_called_once()
+
+    def test_failed_stream_yields_nothing(self):
+        orc = Orcid("0009-0004-5301-6863")
+        orc._transport.session = Mock()
+        response = requests.Response()
+        response.status_code = 500
+        response.raw = Mock()
+        orc._transport.session.get.return_value = response
+        self.assertEqual(list(orc.stream_works(backend="python")), [])
+        self.assertEqual(list(orc.stream_fundings(backend="python")), [])
+        response.raw.close.assert_called()
+
+        orc._transport.session.get.side_effect = requests.ConnectionError
+        self.assertEqual(list(orc.stream_works(backend="python")), [])
+
+    def test_broken_stream_raises_the_request_error(self):
+        def broken_body(chunk_size):
+            yield chunked(WORKS, 8)[0]
+            raise requests.exceptions.ChunkedEncodingError("connection lost")
+
+        orc = Orcid("0009-0004-5301-6863")
+        orc._transport.session = Mock()
+        response = orc._transport.session.get.return_value
+        response.status_code = 200
+        response.iter_content.side_effect = broken_body
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            list(orc.stream_works(backend="python"))
+        response.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
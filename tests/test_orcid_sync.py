@@ -0,0 +1,110 @@
+import json
+import unittest
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from src.pyorcid import OrcidSync, SyncState
+
+IDS = ["0000-0000-0000-0001", "0000-0000-0000-0002", "0000-0000-0000-0003"]
+
+
+def json_response(payload, status_code=200):
+    response = Mock(status_code=status_code)
+    response.content = json.dumps(payload).encode("utf-8")
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            response=response)
+    return response
+
+
+class FakeOrcid:
+    '''
+    Serves /record and search requests from an in-memory set of records
+    '''
+    def __init__(self):
+        self.records = {orcid_id: {"history": {"last-modified-date": {
+            "value": 1}}, "person": {"name": orcid_id}} for orcid_id in IDS}
+        self.modified = set()
+        self.failing = set()
+        self.queries = []
+        self.reads = []
+
+    def get(self, url, **kwargs):
+        if "/search/" in url:
+            query = parse_qs(urlparse(url).query)["q"][0]
+            self.queries.append(query)
+            return json_response({"num-found": len(self.modified), "result": [
+                {"orcid-identifier": {"path": orcid_id}}
+                for orcid_id in sorted(self.modified) if orcid_id in query]})
+        orcid_id = url.split("/")[-2]
+        self.reads.append(orcid_id)
+        if orcid_id in self.failing:
+            return json_response({}, 500)
+        return json_response(self.records[orcid_id])
+
+    def modify(self, orcid_id):
+        self.records[orcid_id]["person"]["name"] += "!"
+        self.records[orcid_id]["history"]["last-modified-date"]["value"] += 1
+        self.modified.add(orcid_id)
+
+
+class TestOrcidSync(unittest.TestCase):
+
+    def setUp(self):
+        self.orcid = FakeOrcid()
+        self.sync = OrcidSync(SyncState(":memory:"), ids_per_query=2,
+                              concurrency=2)
+        self.sync._transport.session = Mock()
+        self.sync._transport.session.get.side_effect = self.orcid.get
+        self.sync.track(IDS)
+
+    def tearDown(self):
+        self.sync.close()
+
+    def test_first_run_reads_everything(self):
+        results = dict(self.sync.sync())
+        self.assertEqual(sorted(results), IDS)
+        self.assertEqual(results[IDS[0]],
+                         {"record": self.orcid.records[IDS[0]]})
+        self.assertEqual(self.orcid.queries, [])
+        state = self.sync.sync_state
+        self.assertIsNotNone(state.last_run)
+        self.assertEqual(state.tracked(), IDS)
+        self.assertEqual(state.last_modified(IDS[0]), 1)
+
+    def test_later_runs_read_modified_records_only(self):
+        list(self.sync.sync())
+        self.orcid.reads.clear()
+        self.orcid.modify(IDS[1])
+
+        results = dict(self.sync.sync())
+        self.assertEqual(self.orcid.reads, [IDS[1]])
+        self.assertEqual(results, {IDS[1]: {
+            "record": self.orcid.records[IDS[1]]}})
+        self.assertEqual(self.sync.sync_state.last_modified(IDS[1]), 2)
+        # Two chunks of at most two iDs
+        self.assertEqual(len(self.orcid.queries), 2)
+        self.assertIn("profile-last-modified-date:[", self.orcid.queries[0])
+        self.assertIn(f"orcid:({IDS[0]} OR {IDS[1]})", self.orcid.queries[0])
+
+        # Reported as modified again, but with the same content
+        self.assertEqual(dict(self.sync.sync()), {IDS[1]: {}})
+
+    def test_failed_reads_stay_pending(self):
+        self.orcid.failing.add(IDS[2])
+        results = dict(self.sync.sync())
+        self.assertIsInstance(results[IDS[2]], Exception)
+        self.assertEqual(self.sync.sync_state.pending(), [IDS[2]])
+
+        self.orcid.failing.clear()
+        self.orcid.reads.clear()
+        results = dict(self.sync.sync())
+        self.assertEqual(self.orcid.reads, [IDS[2]])
+        self.assertIn("record", results[IDS[2]])
+        self.assertEqual(self.sync.sync_state.pending(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from src.pyorcid import OrcidSearch, OrcidTransport, RateLimiter, RetryPolicy
+
+
+def make_response(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestThrottle(unittest.TestCase):
+
+    def test_rate_limiter_allows_burst_then_waits(self):
+        limiter = RateLimiter(rate=10, burst=2)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertAlmostEqual(limiter.reserve(), 0.1, places=2)
+
+    @patch('src.pyorcid.orcid_throttle.time.sleep')
+    def test_retry_honours_retry_after(self, mock_sleep):
+        send = Mock(side_effect=[
+            make_response(429, {"Retry-After": "3"}),
+            make_response(200),
+        ])
+        response = RetryPolicy().call(send)
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch('src.pyorcid.orcid_throttle.time.sleep')
+    def test_retry_after_is_capped_and_retried_response_closed(self, mock_sleep):
+        throttled = make_response(429, {"Retry-After": "86400"})
+        send = Mock(side_effect=[throttled, make_response(200)])
+        RetryPolicy(max_backoff=30).call(send)
+        mock_sleep.assert_called_once_with(30)
+        throttled.close.assert_called_once_with()
+
+    @patch('src.pyorcid.orcid_throttle.time.sleep')
+    def test_retry_gives_up_after_max_attempts(self, mock_sleep):
+        send = Mock(return_value=make_response(503))
+        response = RetryPolicy(max_attempts=3).call(send)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('src.pyorcid.orcid_throttle.time.sleep')
+    def test_search_retries_and_checks_status(self, mock_sleep):
+        orc_search = OrcidSearch(
+            transport=OrcidTransport(retry=RetryPolicy(max_attempts=2)))
+        orc_search._transport.session = Mock()
+        failed = make_response(503)
+        failed.raise_for_status.side_effect = requests.HTTPError(
+            response=failed)
+        orc_search._transport.session.get.return_value = failed
+        self.assertIsNone(orc_search.search("Smith"))
+        self.assertEqual(orc_search._transport.session.get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
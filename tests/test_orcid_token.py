@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from src.pyorcid import Orcid, OrcidSearch
+from src.pyorcid.orcid_token import TokenValidationCache, token_validation_cache
+
+
+class TestTokenValidation(unittest.TestCase):
+
+    def setUp(self):
+        token_validation_cache.clear()
+
+    def tearDown(self):
+        token_validation_cache.clear()
+
+    def fake_session(self, status_code):
+        session = Mock()
+        session.get.return_value.status_code = status_code
+        session.get.return_value.json.return_value = {"path": "record"}
+        return session
+
+    def test_cache_outcomes_and_ttl(self):
+        cache = TokenValidationCache(ttl=60)
+        self.assertIsNone(cache.check("token", "public", False))
+        self.assertIsNone(cache.check("token", "public", False, 503))
+        # Throttled or malformed requests say nothing about the token
+        self.assertIsNone(cache.check("token", "public", False, 429))
+        self.assertIsNone(cache.check("token", "public", False, 400))
+        self.assertIsNone(cache.check("token", "public", False))
+        self.assertTrue(cache.check("token", "public", False, 404))
+        self.assertTrue(cache.check("token", "public", False))
+        # Results are kept apart per state and sandbox
+        self.assertIsNone(cache.check("token", "member", False))
+        self.assertFalse(cache.check("token", "public", True, 401))
+        with patch('src.pyorcid.orcid_token.time.monotonic',
+                   return_value=10 ** 9):
+            self.assertIsNone(cache.check("token", "public", False))
+
+    def test_resource_rejection_is_scoped(self):
+        cache = TokenValidationCache(ttl=60)
+        self.assertFalse(cache.check("token", "public", False, 403,
+                                     resource="0000-0002-1825-0097/works"))
+        self.assertFalse(cache.check("token", "public", False,
+                                     resource="0000-0002-1825-0097/works"))
+        self.assertIsNone(cache.check("token", "public", False,
+                                      resource="0009-0004-5301-6863/works"))
+        self.assertIsNone(cache.check("token", "public", False))
+
+    def test_construction_sends_no_request(self):
+        with patch('src.pyorcid.orcid_transport.requests.Session') as session:
+            Orcid("0009-0004-5301-6863", orcid_access_token="token")
+            OrcidSearch(orcid_access_token="token")
+        session.return_value.get.assert_not_called()
+
+    def test_rejection_is_shared_for_the_same_section_only(self):
+        orc = Orcid("0009-0004-5301-6863", orcid_access_token="bad")
+        orc._transport.session = self.fake_session(401)
+        with self.assertRaises(ValueError):
+            orc.record()
+
+        # Another client reading the same record fails without a request
+        same = Orcid("0009-0004-5301-6863", orcid_access_token="bad")
+        same._transport.session = self.fake_session(200)
+        with self.assertRaises(ValueError):
+            same.record()
+        same._transport.session.get.assert_not_called()
+
+        # One restricted record does not break the reads of other records
+        other = Orcid("0000-0002-1825-0097", orcid_access_token="bad")
+        other._transport.session = self.fake_session(200)
+        self.assertEqual(other.record(), {"path": "record"})
+        self.assertTrue(other._token_validated)
+
+    def test_first_response_validates_token(self):
+        orc = Orcid("0009-0004-5301-6863", orcid_access_token="good")
+        orc._transport.session = self.fake_session(200)
+        self.assertEqual(orc.record(), {"path": "record"})
+        self.assertTrue(orc._token_validated)
+        self.assertTrue(token_validation_cache.check("good", "public", False))
+
+
+if __name__ == '__main__':
+    unittest.main()
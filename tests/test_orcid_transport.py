@@ -0,0 +1,67 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.pyorcid import OrcidTransport
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"group": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestOrcidTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/works"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        with OrcidTransport() as transport:
+            for _ in range(3):
+                self.assertEqual(transport.get(self.url).json(),
+                                 {"group": []})
+            stats = transport.stats.as_dict()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connections_reused"], 2)
+        self.assertEqual(stats["hosts"]["127.0.0.1"]["requests"], 3)
+
+    def test_pool_only_grows(self):
+        transport = OrcidTransport(pool_maxsize=4)
+        adapter = transport.session.get_adapter("https://pub.orcid.org")
+        transport.ensure_pool_size(2)
+        self.assertIs(
+            transport.session.get_adapter("https://pub.orcid.org"), adapter)
+        transport.ensure_pool_size(16)
+        self.assertEqual(
+            transport.session.get_adapter(
+                "https://pub.orcid.org")._pool_maxsize, 16)
+
+    def test_growing_the_pool_closes_the_old_adapter(self):
+        with OrcidTransport(pool_maxsize=2) as transport:
+            transport.get(self.url)
+            old = transport.session.get_adapter(self.url)
+            self.assertEqual(len(old.poolmanager.pools), 1)
+            transport.ensure_pool_size(8)
+            self.assertEqual(len(old.poolmanager.pools), 0)
+            self.assertEqual(transport.get(self.url).json(), {"group": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import Mock
+
+import xmltodict
+
+from src.pyorcid import OrcidScrapper
+from src.pyorcid.orcid_xml import iter_xml_elements, parse_xml
+
+WORKS_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<activities:works path="/0009-0004-5301-6863/works"
+    xmlns:activities="http://www.orcid.org/ns/activities"
+    xmlns:common="http://www.orcid.org/ns/common"
+    xmlns:work="http://www.orcid.org/ns/work">
+  <common:last-modified-date>2024-01-01T00:00:00Z</common:last-modified-date>
+  <activities:group>
+    <work:work-summary put-code="1" visibility="public">
+      <work:title><common:title>Café <!-- note -->culture</common:title></work:title>
+      <work:type>journal-article</work:type>
+    </work:work-summary>
+    <work:work-summary put-code="2"><work:type>book</work:type></work:work-summary>
+  </activities:group>
+  <activities:group>
+    <work:work-summary put-code="3"><common:url>https://x.org</common:url></work:work-summary>
+  </activities:group>
+  <activities:group/>
+</activities:works>
+'''.encode("utf-8")
+
+
+def strip_prefixes(data):
+    if isinstance(data, dict):
+        return {key.split(":")[-1]: strip_prefixes(value)
+                for key, value in data.items()
+                if not key.startswith("@xmlns")}
+    if isinstance(data, list):
+        return [strip_prefixes(item) for item in data]
+    return data
+
+
+class TestOrcidXml(unittest.TestCase):
+
+    def test_matches_xmltodict_without_prefixes(self):
+        expected = strip_prefixes(xmltodict.parse(WORKS_XML))
+        self.assertEqual(parse_xml(WORKS_XML), expected)
+        self.assertEqual(parse_xml(WORKS_XML.decode("utf-8")), expected)
+        for size in (1, 7, 4096):
+            chunks = [WORKS_XML[i:i + size]
+                      for i in range(0, len(WORKS_XML), size)]
+            self.assertEqual(parse_xml(chunks), expected)
+
+    def test_mixed_content_and_attributes(self):
+        data = parse_xml(b'<a xmlns:x="urn:x" x:lang="en">one<b/>two</a>')
+        self.assertEqual(data, {"a": {"@lang": "en", "b": None,
+                                      "#text": "onetwo"}})
+
+    def test_iter_xml_elements(self):
+        summaries = list(iter_xml_elements(WORKS_XML, "work-summary"))
+        self.assertEqual([summary["@put-code"] for summary in summaries],
+                         ["1", "2", "3"])
+        self.assertEqual(summaries[0]["title"], {"title": "Café culture"})
+
+    def test_scrape_elements_streams_response(self):
+        scrapper = OrcidScrapper("0009-0004-5301-6863")
+        scrapper._transport.session = Mock()
+        response = scrapper._transport.session.get.return_value
+        response.status_code = 200
+        response.iter_content.return_value = [
+            WORKS_XML[i:i + 64] for i in range(0, len(WORKS_XML), 64)]
+        groups = list(scrapper.scrape_elements("works", "group"))
+        self.assertEqual(len(groups), 3)
+        self.assertIsNone(groups[2])
+        self.assertTrue(
+            scrapper._transport.session.get.call_args[1]["stream"])
+        response.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()